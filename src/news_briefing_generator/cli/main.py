@@ -1,15 +1,20 @@
 import asyncio
 import os
 from pathlib import Path
-from typing import Any, Dict, Optional
+from typing import TYPE_CHECKING, Any, Dict, Optional, Tuple
 
 import typer
 
-from news_briefing_generator.core.context import ApplicationContext
-from news_briefing_generator.model.task.result import TaskResult
-from news_briefing_generator.tasks import TASK_REGISTRY
 from news_briefing_generator.utils.opml_parser import parse_opml_file
-from news_briefing_generator.workflow.workflow_handler import WorkflowHandler
+
+# Heavy modules (LLM clients, clustering, task registry) are imported inside the
+# commands that need them to keep CLI startup fast
+if TYPE_CHECKING:
+    from news_briefing_generator.core.context import ApplicationContext
+    from news_briefing_generator.model.task.base import Task
+    from news_briefing_generator.model.task.config import TaskConfig
+    from news_briefing_generator.model.task.result import TaskResult
+    from news_briefing_generator.workflow.workflow_handler import WorkflowHandler
 
 # Disable HuggingFace tokenizers parallelism to prevent deadlocks when forking processes
 # This avoids the warning: "The current process just got forked, after parallelism has already been used."
@@ -29,16 +34,19 @@ INFO_SYMBOL = "ℹ️"
 
 
 def _create_workflow_handler(
-    ctx: ApplicationContext,
+    ctx: "ApplicationContext",
     workflow_config_file: Optional[Path],
     opml_path: Optional[Path],
-) -> WorkflowHandler:
+) -> "WorkflowHandler":
     """Create workflow handler with given configuration."""
+    from news_briefing_generator.workflow.workflow_handler import WorkflowHandler
+
     handler_kwargs: Dict[str, Any] = {
         "db": ctx.db,
         "default_llm": ctx.default_llm,
         "conf": ctx.conf,
         "logger_manager": ctx.logger_manager,
+        "http": ctx.http,
     }
 
     if workflow_config_file is not None:
@@ -50,8 +58,9 @@ def _create_workflow_handler(
     return WorkflowHandler(**handler_kwargs)
 
 
-async def _validate_workflow(handler: WorkflowHandler, workflow_name: str) -> None:
+async def _validate_workflow(handler: "WorkflowHandler", workflow_name: str) -> None:
     """Validate a workflow configuration."""
+    from news_briefing_generator.tasks import TASK_REGISTRY
 
     # Check workflow exists
     if workflow_name not in handler.workflows:
@@ -64,9 +73,30 @@ async def _validate_workflow(handler: WorkflowHandler, workflow_name: str) -> No
 
     typer.echo(f"\nValidating workflow: {workflow_name}")
 
-    # Validate each task
-    for task_dict in workflow["tasks"]:
-        task_config = handler._create_task_config(task_dict)
+    task_configs = [
+        handler._create_task_config(task_dict) for task_dict in workflow["tasks"]
+    ]
+
+    def _instantiate(
+        task_config: "TaskConfig",
+    ) -> Tuple[Optional["Task"], Optional[str]]:
+        """Create task instance to validate context, returning (instance, error)."""
+        if task_config.task_type not in TASK_REGISTRY:
+            return None, None
+        try:
+            return handler._get_task_instance(task_config), None
+        except Exception as e:
+            return None, str(e)
+
+    # Task instantiation is independent per task, run it concurrently
+    instances = await asyncio.gather(
+        *[asyncio.to_thread(_instantiate, task_config) for task_config in task_configs]
+    )
+
+    # Validate each task (in declaration order, dependencies must be declared first)
+    for task_config, (task_instance, error) in zip(
+        task_configs, instances, strict=True
+    ):
 
         # Check task name uniqueness
         if task_config.name in task_names:
@@ -91,24 +121,21 @@ async def _validate_workflow(handler: WorkflowHandler, workflow_name: str) -> No
                 )
                 has_errors = True
 
-        # Create task instance to validate context
-        try:
-            task_instance = handler._get_task_instance(task_config)
-
-            # Warn about default LLM usage if applicable
-            if task_instance.requires_llm and not task_config.llm_config:
-                typer.secho(
-                    f"{INFO_SYMBOL}  {task_config.name} will use default LLM configuration",
-                    fg="yellow",
-                )
-
-            typer.echo(f"✓ {task_config.name} ({task_config.task_type})")
-
-        except Exception as e:
+        if error is not None:
             typer.echo(
-                f"{FAILURE_SYMBOL} Failed to validate {task_config.name}: {str(e)}"
+                f"{FAILURE_SYMBOL} Failed to validate {task_config.name}: {error}"
             )
             has_errors = True
+            continue
+
+        # Warn about default LLM usage if applicable
+        if task_instance.requires_llm and not task_config.llm_config:
+            typer.secho(
+                f"{INFO_SYMBOL}  {task_config.name} will use default LLM configuration",
+                fg="yellow",
+            )
+
+        typer.echo(f"✓ {task_config.name} ({task_config.task_type})")
 
     if has_errors:
         typer.echo(f"\n{FAILURE_SYMBOL} Validation failed")
@@ -117,7 +144,7 @@ async def _validate_workflow(handler: WorkflowHandler, workflow_name: str) -> No
         typer.echo(f"\n{SUCCESS_SYMBOL} Workflow configuration is valid")
 
 
-def _print_results(results: Dict[str, TaskResult]) -> None:
+def _print_results(results: Dict[str, "TaskResult"]) -> None:
     """Print workflow execution results."""
     for task_name, result in results.items():
         status = SUCCESS_SYMBOL if result.success else FAILURE_SYMBOL
@@ -138,6 +165,8 @@ def list_workflows(
     """List available workflow definitions and their tasks."""
 
     async def _list() -> None:
+        from news_briefing_generator.core.context import ApplicationContext
+
         async with ApplicationContext() as ctx:
             handler = _create_workflow_handler(ctx, workflow_config, None)
 
@@ -175,6 +204,8 @@ def validate(
     """Validate a workflow configuration."""
 
     async def _validate() -> None:
+        from news_briefing_generator.core.context import ApplicationContext
+
         async with ApplicationContext() as ctx:
             handler = _create_workflow_handler(ctx, workflow_config, None)
             await _validate_workflow(handler, workflow_name)
@@ -208,6 +239,8 @@ def run(
     """Execute a workflow by name."""
 
     async def _run() -> None:
+        from news_briefing_generator.core.context import ApplicationContext
+
         async with ApplicationContext(
             config_path, db_path, ollama_url=base_url_ollama, typer_ctx=ctx
         ) as app_ctx:
@@ -1,6 +1,5 @@
-from typing import List
+from typing import List, Sequence, Union
 
-import hdbscan
 import numpy as np
 
 
@@ -10,14 +9,129 @@ class HDBSCAN:
         min_cluster_size: int = 5,
         min_samples: int = 5,
         cluster_selection_epsilon: float = 0.3,
+        algorithm: str = "boruvka_kdtree",
+        core_dist_n_jobs: int = -1,
+        prediction_data: bool = True,
+        normalize: bool = False,
+        backend: str = "cpu",
     ) -> None:
+        """Initialize HDBSCAN wrapper.
+
+        Args:
+            min_cluster_size: Minimum size of clusters
+            min_samples: Number of samples in a neighborhood for a core point
+            cluster_selection_epsilon: Distance threshold below which clusters are
+                merged
+            algorithm: hdbscan algorithm, the Boruvka KD-tree scales best for
+                euclidean distances on dense embeddings
+            core_dist_n_jobs: Parallel jobs for core distance computation
+                (-1 uses all CPUs)
+            prediction_data: Keep prediction data after fitting so new embeddings
+                can be assigned to existing clusters via predict()
+            normalize: L2-normalize embeddings before clustering, so euclidean
+                distances rank like cosine distances
+            backend: "cpu" for the hdbscan package or "gpu" for RAPIDS cuML
+                (requires cuml and cupy; algorithm and core_dist_n_jobs are ignored)
+
+        Raises:
+            ValueError: If backend is not supported
+        """
         self.min_cluster_size = min_cluster_size
         self.min_samples = min_samples
         self.cluster_selection_epsilon = cluster_selection_epsilon
-        self.model = hdbscan.HDBSCAN(
-            min_cluster_size=self.min_cluster_size, min_samples=self.min_samples
-        )
+        self.algorithm = algorithm
+        self.core_dist_n_jobs = core_dist_n_jobs
+        self.prediction_data = prediction_data
+        self.normalize = normalize
+        self._fitted = False
+
+        self.backend = backend
+
+        if backend == "cpu":
+            # Deferred import: hdbscan pulls in scipy/sklearn, which is only needed
+            # once a clustering model is actually built
+            import hdbscan
 
-    def cluster(self, embeddings: List[np.ndarray]) -> List[str]:
+            self.model = hdbscan.HDBSCAN(
+                min_cluster_size=self.min_cluster_size,
+                min_samples=self.min_samples,
+                cluster_selection_epsilon=self.cluster_selection_epsilon,
+                algorithm=self.algorithm,
+                core_dist_n_jobs=self.core_dist_n_jobs,
+                approx_min_span_tree=True,
+                prediction_data=self.prediction_data,
+            )
+        elif backend == "gpu":
+            from cuml.cluster import HDBSCAN as CumlHDBSCAN
+
+            self.model = CumlHDBSCAN(
+                min_cluster_size=self.min_cluster_size,
+                min_samples=self.min_samples,
+                cluster_selection_epsilon=self.cluster_selection_epsilon,
+                prediction_data=self.prediction_data,
+            )
+        else:
+            raise ValueError(f"Unsupported HDBSCAN backend: {backend}")
+
+    def cluster(self, embeddings: Union[np.ndarray, Sequence[np.ndarray]]) -> List[str]:
         """Run HDBSCAN clustering on the input embeddings and return the cluster labels."""
-        return self.model.fit(embeddings).labels_.astype(str).tolist()
+        # Without allow_single_cluster HDBSCAN needs at least two clusters of
+        # min_cluster_size points, smaller inputs are always labeled as noise
+        if len(embeddings) < self.min_cluster_size * 2:
+            return ["-1"] * len(embeddings)
+
+        X = self._prepare(embeddings)
+        if self.backend == "gpu":
+            import cupy
+
+            labels = self.model.fit(cupy.asarray(X)).labels_.get()
+        else:
+            labels = self.model.fit(X).labels_
+        self._fitted = True
+        return [str(label) for label in labels.tolist()]
+
+    def predict(
+        self, new_embeddings: Union[np.ndarray, Sequence[np.ndarray]]
+    ) -> List[str]:
+        """Assign new embeddings to the clusters of the last fit without refitting.
+
+        Raises:
+            RuntimeError: If the model was not fitted with prediction data
+        """
+        if not (self._fitted and self.prediction_data):
+            raise RuntimeError(
+                "HDBSCAN.predict() requires a prior cluster() call "
+                "with prediction_data=True"
+            )
+        X = self._prepare(new_embeddings)
+        if self.backend == "gpu":
+            import cupy
+            from cuml.cluster.hdbscan import approximate_predict
+
+            labels, _ = approximate_predict(self.model, cupy.asarray(X))
+            labels = labels.get()
+        else:
+            import hdbscan
+
+            labels, _ = hdbscan.approximate_predict(self.model, X)
+        return [str(label) for label in labels.tolist()]
+
+    def _prepare(
+        self, embeddings: Union[np.ndarray, Sequence[np.ndarray]]
+    ) -> np.ndarray:
+        """Convert embeddings to the model input matrix."""
+        X = self._to_matrix(embeddings)
+        return self._l2_normalize(X) if self.normalize else X
+
+    @staticmethod
+    def _l2_normalize(X: np.ndarray) -> np.ndarray:
+        """Scale each row to unit length (zero rows are left unchanged)."""
+        norms = np.linalg.norm(X, axis=1, keepdims=True)
+        return np.divide(X, norms, out=np.zeros_like(X), where=norms > 0)
+
+    @staticmethod
+    def _to_matrix(embeddings: Union[np.ndarray, Sequence[np.ndarray]]) -> np.ndarray:
+        """Stack embeddings into a single C-contiguous float32 2D array."""
+        if isinstance(embeddings, np.ndarray):
+            return np.ascontiguousarray(embeddings, dtype=np.float32)
+        return np.ascontiguousarray(np.stack(embeddings), dtype=np.float32)
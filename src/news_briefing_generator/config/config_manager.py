@@ -1,14 +1,47 @@
+import json
 import os
+import pickle
+import tempfile
 from dataclasses import dataclass, field
 from enum import Enum
+from functools import lru_cache
+from operator import itemgetter
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple
 
-import typer
 import yaml
 
+try:
+    # libyaml bindings are bundled with most PyYAML wheels
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:  # pragma: no cover - depends on PyYAML build
+    from yaml import SafeLoader
+
 from news_briefing_generator.utils.path_utils import resolve_config_path
 
+if TYPE_CHECKING:
+    import typer
+
+
+# Extracts (url, name) pairs from feed config entries
+_URL_AND_NAME = itemgetter("url", "name")
+
+
+# Pickled settings per file path, keyed by (mtime_ns, size), so re-created
+# managers (e.g. a new ApplicationContext) skip both YAML parsing and the sidecar
+# read. Stored pickled so every manager gets its own copy to mutate.
+_SETTINGS_MEMORY_CACHE: Dict[Path, Tuple[Tuple[int, int], bytes]] = {}
+
+
+# (key, task scope) of a memoized settings-file parameter lookup
+_ParamCacheKey = Tuple[str, Optional[str]]
+
+
+@lru_cache(maxsize=None)
+def _split_path(path: str) -> Tuple[str, ...]:
+    """Split a dot notation path into its keys."""
+    return tuple(path.split("."))
+
 
 class ConfigSource(Enum):
     CLI_ARGUMENT = "cli_arg"
@@ -36,15 +69,29 @@ class ConfigManager:
     )
     environment: str = field(default="development")
     ollama_url: Optional[str] = field(default=None)
-    typer_ctx: Optional[typer.Context] = field(default=None)
+    typer_ctx: Optional["typer.Context"] = field(default=None)
 
     base_settings: Dict[str, Any] = field(init=False, default_factory=dict)
     env_settings: Dict[str, Any] = field(init=False, default_factory=dict)
     merged_settings: Dict[str, Any] = field(init=False, default_factory=dict)
     url_to_feedname: Dict[str, str] = field(init=False, default_factory=dict)
+    _nbg_env: Dict[str, str] = field(init=False, default_factory=dict, repr=False)
+    _cli_lookup: Dict[str, Optional[str]] = field(
+        init=False, default_factory=dict, repr=False
+    )
+    _cli_lookup_ctx: Optional["typer.Context"] = field(
+        init=False, default=None, repr=False
+    )
+    _settings_param_cache: Dict[_ParamCacheKey, Optional[Parameter]] = field(
+        init=False, default_factory=dict, repr=False
+    )
+    _get_cache: Dict[str, Any] = field(init=False, default_factory=dict, repr=False)
 
     def __post_init__(self) -> None:
         """Initializes the ConfigManager instance."""
+        # Snapshot NBG_ prefixed environment variables once per run
+        self._nbg_env = {k: v for k, v in os.environ.items() if k.startswith("NBG_")}
+
         # Convert string path to Path object if needed
         if isinstance(self.config_path, str):
             self.config_path = Path(self.config_path)
@@ -75,7 +122,13 @@ class ConfigManager:
 
         Used for core system configuration that shouldn't be overrideable.
         """
-        base_value = self._get_from_dict(self.merged_settings, key)
+        # Merged settings only change through override_feeds(), which clears this
+        try:
+            base_value = self._get_cache[key]
+        except KeyError:
+            base_value = self._get_cache[key] = self._get_from_dict(
+                self.merged_settings, key
+            )
         if base_value is not None:
             return base_value
         return default
@@ -93,7 +146,7 @@ class ConfigManager:
         Follows parameter resolution precedence:
         1. CLI arguments
         2. Workflow config (from workflow_configs.yaml)
-        3. Environment variables (NBG_ prefixed)
+        3. Environment variables (NBG_ prefixed, as set when the manager was created)
         4. Environment settings (settings.{env}.yaml)
         5. Base settings (settings.yaml)
         6. Default value
@@ -108,47 +161,68 @@ class ConfigManager:
             Parameter: Value and source tracking object used by Task._track_param_resolution()
         """
 
-        # Helper to try both scoped and unscoped keys
-        def try_get_param(
-            params: Dict, param_key: str, scope: Optional[str] = None
-        ) -> Optional[Any]:
-            # Try scoped key first if scope provided
-            if scope:
-                scoped_key = f"{scope}.{param_key}"
-                value = self._get_from_dict(params, scoped_key)
-                if value is not None:
-                    return value
-            # Fall back to unscoped key
-            return self._get_from_dict(params, param_key)
-
         # 1. Check CLI arguments (if applicable)
         cli_value = self._get_cli_param(key)
         if cli_value is not None:
             return Parameter(cli_value, ConfigSource.CLI_ARGUMENT)
 
         # 2. Check workflow params
-        resolved_workflow_param = try_get_param(workflow_params or {}, key)
+        resolved_workflow_param = self._try_get_param(workflow_params or {}, key)
         if resolved_workflow_param is not None:
             return Parameter(resolved_workflow_param, ConfigSource.WORKFLOW)
 
-        # 3. Check environment variables
-        env_var = f"NBG_{key.upper()}"
-        if env_var in os.environ:
-            return Parameter(os.environ[env_var], ConfigSource.ENVIRONMENT_VARIABLE)
-
-        # 4. Check environment config (settings.{env}.yaml)
-        env_value = try_get_param(self.env_settings, key, scope=task_scope)
+        # 3. Check environment variables (snapshot taken at initialization)
+        env_value = self._nbg_env.get(f"NBG_{key.upper()}")
         if env_value is not None:
-            return Parameter(env_value, ConfigSource.ENVIRONMENT_SETTINGS)
+            return Parameter(env_value, ConfigSource.ENVIRONMENT_VARIABLE)
 
-        # 5. Check base settings (settings.yaml)
-        base_value = try_get_param(self.base_settings, key, scope=task_scope)
-        if base_value is not None:
-            return Parameter(base_value, ConfigSource.BASE_SETTINGS)
+        # 4. + 5. Check environment and base settings (cached, files are static)
+        settings_param = self._get_settings_param(key, task_scope)
+        if settings_param is not None:
+            return settings_param
 
         # 6. Return default value
         return Parameter(default, ConfigSource.DEFAULT)
 
+    def _get_settings_param(
+        self, key: str, task_scope: Optional[str] = None
+    ) -> Optional[Parameter]:
+        """Resolve parameter from settings files, memoized per (key, task_scope).
+
+        Only the settings file steps of the precedence chain are cached: CLI
+        arguments, workflow params and environment variables may change between
+        calls and are always resolved fresh in get_param().
+        """
+        cache_key = (key, task_scope)
+        if cache_key in self._settings_param_cache:
+            return self._settings_param_cache[cache_key]
+
+        parameter = None
+
+        # Check environment config (settings.{env}.yaml)
+        env_value = self._try_get_param(self.env_settings, key, scope=task_scope)
+        if env_value is not None:
+            parameter = Parameter(env_value, ConfigSource.ENVIRONMENT_SETTINGS)
+        else:
+            # Check base settings (settings.yaml)
+            base_value = self._try_get_param(self.base_settings, key, scope=task_scope)
+            if base_value is not None:
+                parameter = Parameter(base_value, ConfigSource.BASE_SETTINGS)
+
+        self._settings_param_cache[cache_key] = parameter
+        return parameter
+
+    def _try_get_param(
+        self, params: Dict, param_key: str, scope: Optional[str] = None
+    ) -> Optional[Any]:
+        """Try scoped key first (if scope provided), then fall back to unscoped key."""
+        if scope:
+            scoped_key = f"{scope}.{param_key}"
+            value = self._get_from_dict(params, scoped_key)
+            if value is not None:
+                return value
+        return self._get_from_dict(params, param_key)
+
     def get_all_configs(self) -> Dict[str, Any]:
         """Returns all configurations."""
         all_configs = {
@@ -166,6 +240,8 @@ class ConfigManager:
         # Update both base and merged settings to maintain consistency
         self.base_settings["feeds"] = feeds
         self.merged_settings["feeds"] = feeds
+        self._settings_param_cache.clear()
+        self._get_cache.clear()
 
         # Regenerate feed name mapping
         self.url_to_feedname = self._generate_url_to_feedname_map()
@@ -173,38 +249,50 @@ class ConfigManager:
     def _get_cli_param(self, key: str) -> Optional[str]:
         """Retrieve CLI argument value if available.
 
+        Lookups are memoized per key for the current Typer context.
+
         Args:
             key: Parameter key to look up
 
         Returns:
             Optional[str]: CLI argument value if found, otherwise None
         """
-        try:
-            # Use Typer's context to access CLI arguments
-            if self.typer_ctx is None:
-                return None
+        # Use Typer's context to access CLI arguments
+        if self.typer_ctx is None:
+            return None
+
+        # Reset memoized lookups if the context was replaced
+        if self._cli_lookup_ctx is not self.typer_ctx:
+            self._cli_lookup = {}
+            self._cli_lookup_ctx = self.typer_ctx
 
-            # Convert key to CLI argument format (e.g., "base_url" -> "base-url")
-            cli_arg = key.replace("_", "-")
+        if key not in self._cli_lookup:
+            self._cli_lookup[key] = self._lookup_cli_param(self.typer_ctx.params, key)
+        return self._cli_lookup[key]
 
-            # Check if the argument was passed
-            if cli_arg in self.typer_ctx.params:
-                return str(self.typer_ctx.params[cli_arg])
+    @staticmethod
+    def _lookup_cli_param(cli_params: Dict[str, Any], key: str) -> Optional[str]:
+        """Find key in CLI params by long (base_url -> base-url) or short (b) form."""
+        # Convert key to CLI argument format (e.g., "base_url" -> "base-url")
+        cli_arg = key.replace("_", "-")
 
-            # Check for short option (e.g., "b" for "base_url")
-            short_cli_arg = key[0]
-            if short_cli_arg in self.typer_ctx.params:
-                return str(self.typer_ctx.params[short_cli_arg])
+        # Check if the argument was passed
+        if cli_arg in cli_params:
+            return str(cli_params[cli_arg])
 
-        except Exception as e:
-            # Log or handle the exception as needed
-            print(f"Error retrieving CLI parameter '{key}': {e}")
+        # Check for short option (e.g., "b" for "base_url")
+        if key and key[0] in cli_params:
+            return str(cli_params[key[0]])
 
         return None
 
     def _load_settings_file(self, path: Path, required: bool = True) -> Dict[str, Any]:
         """Load settings from YAML file.
 
+        Parsed settings are cached in memory and in a JSON sidecar
+        (``<file>.cache``), both reused as long as the YAML file's mtime and
+        size are unchanged.
+
         Args:
             path: Path to settings file
             required: Whether file must exist
@@ -216,15 +304,90 @@ class ConfigManager:
             FileNotFoundError: If required file doesn't exist
         """
         try:
-            with open(path, "r") as file:
-                return yaml.safe_load(file) or {}
+            stat = path.stat()
         except FileNotFoundError:
             if required:
-                raise FileNotFoundError(f"Required settings file not found: {path}")
+                raise FileNotFoundError(
+                    f"Required settings file not found: {path}"
+                ) from None
+            return {}
+
+        cache_key = (stat.st_mtime_ns, stat.st_size)
+        memory_cached = _SETTINGS_MEMORY_CACHE.get(path)
+        if memory_cached is not None and memory_cached[0] == cache_key:
+            return pickle.loads(memory_cached[1])
+
+        cache_path = path.with_suffix(path.suffix + ".cache")
+        cached = self._read_settings_cache(cache_path, cache_key)
+        if cached is not None:
+            self._remember_settings(path, cache_key, cached)
+            return cached
+
+        try:
+            # Hand the raw bytes to the loader in one buffer, libyaml decodes them
+            settings = yaml.load(path.read_bytes(), Loader=SafeLoader) or {}
+        except FileNotFoundError:
+            if required:
+                raise FileNotFoundError(
+                    f"Required settings file not found: {path}"
+                ) from None
             return {}
         except yaml.YAMLError as e:
             raise ValueError(f"Invalid YAML in {path}: {e}")
 
+        self._write_settings_cache(cache_path, cache_key, settings)
+        self._remember_settings(path, cache_key, settings)
+        return settings
+
+    @staticmethod
+    def _remember_settings(
+        path: Path, cache_key: Tuple[int, int], settings: Dict[str, Any]
+    ) -> None:
+        """Keep parsed settings in the in-process cache."""
+        try:
+            _SETTINGS_MEMORY_CACHE[path] = (cache_key, pickle.dumps(settings))
+        except pickle.PicklingError:
+            pass
+
+    @staticmethod
+    def _read_settings_cache(
+        cache_path: Path, cache_key: Tuple[int, int]
+    ) -> Optional[Dict[str, Any]]:
+        """Read cached settings if the sidecar matches the given file state."""
+        try:
+            with open(cache_path, "rb") as file:
+                mtime_ns, size, settings = json.load(file)
+        except (OSError, ValueError, TypeError):
+            return None
+        if (mtime_ns, size) != cache_key or not isinstance(settings, dict):
+            return None
+        return settings
+
+    @staticmethod
+    def _write_settings_cache(
+        cache_path: Path, cache_key: Tuple[int, int], settings: Dict[str, Any]
+    ) -> None:
+        """Atomically write parsed settings to the sidecar cache file.
+
+        Settings that don't survive a JSON round trip unchanged (e.g. dates or
+        non-string keys) aren't cached. Failures (e.g. read-only config
+        directory) are ignored, the cache is purely an optimization.
+        """
+        try:
+            data = json.dumps([*cache_key, settings])
+            if json.loads(data)[2] != settings:
+                return
+            fd, tmp_path = tempfile.mkstemp(dir=cache_path.parent, suffix=".tmp")
+            try:
+                with os.fdopen(fd, "w", encoding="utf-8") as file:
+                    file.write(data)
+                os.replace(tmp_path, cache_path)
+            except BaseException:
+                os.unlink(tmp_path)
+                raise
+        except (OSError, TypeError, ValueError):
+            pass
+
     def _merge_settings(self, base: Dict, env: Dict) -> Dict:
         """Deep merge base and environment settings.
 
@@ -243,37 +406,39 @@ class ConfigManager:
         """
 
         def deep_merge(base_dict: Dict, override_dict: Dict) -> Dict:
-            merged = base_dict.copy()
-
+            # Nothing to override (the common case without settings.{env}.yaml):
+            # reuse the base dictionary instead of copying it
+            if not override_dict:
+                return base_dict
+
+            # Only keys present in the override need new objects, all other
+            # values are shared with the base dictionary
+            overrides = {}
             for key, value in override_dict.items():
-                if (
-                    key in merged
-                    and isinstance(merged[key], dict)
-                    and isinstance(value, dict)
-                ):
+                base_value = base_dict.get(key)
+                if isinstance(base_value, dict) and isinstance(value, dict):
                     # Recursively merge nested dictionaries
-                    merged[key] = deep_merge(merged[key], value)
+                    overrides[key] = deep_merge(base_value, value)
                 else:
                     # Override or add value
-                    merged[key] = value
+                    overrides[key] = value
 
-            return merged
+            return {**base_dict, **overrides}
 
         return deep_merge(base, env)
 
     def _generate_url_to_feedname_map(self) -> Dict:
         """Generates a mapping of feed URLs to feed names."""
-        feeds = self.get("feeds", {})
-        mapping = {feed["url"]: feed["name"] for feed in feeds}
-        return mapping
+        feeds = self.get("feeds", [])
+        return dict(map(_URL_AND_NAME, feeds))
 
     def _get_from_dict(self, config_dict: Dict, path: str) -> Optional[Any]:
         """Get value from dictionary using dot notation."""
-        try:
-            value = config_dict
-            for key in path.split("."):
-                value = value[key]
-            return value
-        except (KeyError, TypeError, AttributeError):
-            return None
-            return None
+        value = config_dict
+        for key in _split_path(path):
+            if not isinstance(value, dict):
+                return None
+            value = value.get(key)
+            if value is None:
+                return None
+        return value
@@ -1,22 +1,23 @@
+import asyncio
 import logging
 import os
 import sys
 from contextlib import AbstractAsyncContextManager
 from pathlib import Path
 from types import TracebackType
-from typing import Optional, Type
-
-import typer
+from typing import TYPE_CHECKING, Optional, Type
 
 from news_briefing_generator.config.config_manager import ConfigManager
 from news_briefing_generator.db.helpers import get_sql_command
 from news_briefing_generator.db.sqlite import DatabaseManager
-from news_briefing_generator.llm.base import LLM
-from news_briefing_generator.llm.ollama import OllamaModel
-from news_briefing_generator.llm.openai import OpenAIModel
+from news_briefing_generator.llm.base import DEFAULT_MAX_CONCURRENCY, LLM
 from news_briefing_generator.logging.manager import LogConfig, LoggerManager
+from news_briefing_generator.utils.http_session import HttpSessionManager
 from news_briefing_generator.utils.security import get_openai_api_key
 
+if TYPE_CHECKING:
+    import typer
+
 
 class ApplicationContext(AbstractAsyncContextManager):
     """Manages application lifecycle and core dependencies."""
@@ -32,7 +33,7 @@ class ApplicationContext(AbstractAsyncContextManager):
         db_path: Optional[Path] = None,
         log_config: Optional[LogConfig] = None,
         ollama_url: Optional[str] = None,
-        typer_ctx: Optional[typer.Context] = None,
+        typer_ctx: Optional["typer.Context"] = None,
     ):
         """Initialize application context.
 
@@ -54,6 +55,8 @@ class ApplicationContext(AbstractAsyncContextManager):
         self.conf: Optional[ConfigManager] = None
         self.logger_manager: Optional[LoggerManager] = None
         self.default_llm: Optional[LLM] = None
+        # Session is opened by the first task making HTTP requests
+        self.http = HttpSessionManager()
 
     async def __aenter__(self) -> "ApplicationContext":
         """Initialize application resources."""
@@ -76,11 +79,18 @@ class ApplicationContext(AbstractAsyncContextManager):
             self._initialize_logging()
             self.logger.info("Logging initialized")
 
-            # Initialize database with schema
-            self._initialize_database()
-
-            # Initialize LLM
-            await self._initialize_llm()
+            # Initialize database with schema (in a worker thread) and LLM
+            # concurrently, both only depend on configuration and logging
+            results = await asyncio.gather(
+                asyncio.to_thread(self._initialize_database),
+                self._initialize_llm(),
+                return_exceptions=True,
+            )
+            for result in results:
+                if isinstance(result, BaseException):
+                    raise result
+            if self.default_llm:
+                self.default_llm.attach_cache(self.db)
             self.logger.info(f"LLM initialized: {self.default_llm}")
 
             return self
@@ -101,6 +111,8 @@ class ApplicationContext(AbstractAsyncContextManager):
     ) -> None:
         """Clean up application resources."""
         try:
+            await self.http.close()
+
             if self.logger_manager:
                 if self.db:
                     self.db.close()
@@ -126,7 +138,11 @@ class ApplicationContext(AbstractAsyncContextManager):
         try:
             # Initialize connection
             db_path = self.db_path or self.conf.get("database.path")
-            self.db = DatabaseManager(db_path)
+            self.db = DatabaseManager(
+                db_path,
+                pragmas=self.conf.get("database.pragmas"),
+                pool_size=self.conf.get("database.pool_size", 5),
+            )
 
             # Create schema tables
             tables = [
@@ -135,12 +151,18 @@ class ApplicationContext(AbstractAsyncContextManager):
                 "topic_feeds.sql",
                 "briefings.sql",
                 "briefing_topics.sql",
+                "prompts_cache.sql",
+                "robots_cache.sql",
             ]
 
-            for table in tables:
-                ddl_command = get_sql_command(table)
-                self.db.execute_ddl(command=ddl_command)
-                self.logger.debug(f"Initialized table from {table}")
+            # Run all DDL in a single script instead of one execute/commit per table
+            self.db.execute_script("\n".join(get_sql_command(t) for t in tables))
+            self.logger.debug(f"Initialized tables from {', '.join(tables)}")
+            # Databases created before the embedding columns existed
+            self.db.add_column_if_missing("feeds", "embedding", "BLOB")
+            self.db.add_column_if_missing("feeds", "embedding_model", "TEXT")
+            # Collect planner statistics for the feeds/topic_feeds joins
+            self.db.ensure_statistics()
 
             self.logger.info(f"Database initialized at {db_path}")
 
@@ -184,7 +206,12 @@ class ApplicationContext(AbstractAsyncContextManager):
 
     async def _initialize_llm(self) -> None:
         """Initialize LLM if specified in config."""
+        # Provider modules are only needed once an LLM is actually created
+        from news_briefing_generator.llm.ollama import OllamaModel
+        from news_briefing_generator.llm.openai import OpenAIModel
+
         llm_provider = self.conf.get_param("llm_provider", default="ollama").value
+        use_cache = self.conf.get_param("llm.use_cache", default=False).value
 
         if llm_provider == "ollama":
             ollama_base_url = self.conf.get_param("ollama.base_url").value
@@ -208,7 +235,7 @@ class ApplicationContext(AbstractAsyncContextManager):
                 ).value,
             }
 
-            self.default_llm = OllamaModel(**ollama_params)
+            self.default_llm = OllamaModel(use_cache=use_cache, **ollama_params)
             self.logger.info(f"Initialized Ollama LLM: {str(self.default_llm)}")
 
         elif llm_provider == "openai":
@@ -230,9 +257,17 @@ class ApplicationContext(AbstractAsyncContextManager):
             # Remove None values to avoid passing them to the model
             openai_params = {k: v for k, v in openai_params.items() if v is not None}
 
-            self.default_llm = OpenAIModel(**openai_params)
+            self.default_llm = OpenAIModel(use_cache=use_cache, **openai_params)
             self.logger.info(f"Initialized OpenAI LLM: {str(self.default_llm)}")
 
         else:
             self.logger.warning(f"Unsupported LLM provider: {llm_provider}")
             self.default_llm = None
+
+        if self.default_llm:
+            self.default_llm.max_concurrency = self.conf.get_param(
+                "llm.max_concurrency", default=DEFAULT_MAX_CONCURRENCY
+            ).value
+            self.default_llm.cache_ttl = self.conf.get_param(
+                "llm.cache_ttl", default=None
+            ).value
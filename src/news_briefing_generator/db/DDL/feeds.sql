@@ -10,5 +10,7 @@ CREATE TABLE IF NOT EXISTS feeds (
     scraped_text TEXT,
     extracted_article TEXT,
     summarized_article TEXT,
+    embedding BLOB,
+    embedding_model TEXT,
     UNIQUE(source, link)
 );
\ No newline at end of file
@@ -0,0 +1,5 @@
+CREATE TABLE IF NOT EXISTS prompts_cache (
+    hash BLOB PRIMARY KEY,
+    response TEXT,
+    created_at TEXT
+);
\ No newline at end of file
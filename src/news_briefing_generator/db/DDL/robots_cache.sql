@@ -0,0 +1,5 @@
+CREATE TABLE IF NOT EXISTS robots_cache (
+    domain TEXT PRIMARY KEY,
+    body TEXT,
+    fetched_at TEXT
+);
\ No newline at end of file
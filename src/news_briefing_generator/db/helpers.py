@@ -1,13 +1,15 @@
-import os
+from pathlib import Path
+
+_DDL_DIR = Path(__file__).resolve().parent / "DDL"
+
+# DDL files ship with the package and don't change at runtime, load them once
+_DDL_COMMANDS = {path.name: path.read_text() for path in _DDL_DIR.glob("*.sql")}
 
 
 def get_sql_command(filename: str) -> str:
     """Read SQL command from SQL file."""
-    fpath = os.path.join(
-        os.path.dirname(os.path.abspath(__file__)), 
-        "DDL",
-        filename
-    )
-    
-    with open(fpath, 'r') as file:
-        return file.read()
\ No newline at end of file
+    if filename in _DDL_COMMANDS:
+        return _DDL_COMMANDS[filename]
+
+    # Not part of the packaged DDL, read from disk (raises if missing)
+    return (_DDL_DIR / filename).read_text()
@@ -0,0 +1,73 @@
+import asyncio
+import sqlite3
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Dict, List
+
+
+class ConnectionPool:
+    """
+    A fixed-size pool of SQLite connections for concurrent async reads.
+
+    Connections are opened lazily, configured with the given PRAGMAs once at
+    creation and reused afterwards, so their page cache stays warm. Queries run
+    in worker threads, which lets several coroutines read in parallel under WAL.
+
+    Methods
+    -------
+    acquire() -> AsyncContextManager[sqlite3.Connection]
+        Checks out a connection and returns it to the pool afterwards.
+    fetchall(query: str, params: tuple = ()) -> list
+        Executes a query on a pooled connection and returns the results.
+    close() -> None
+        Closes all connections opened by the pool.
+    """
+
+    def __init__(self, db_path: str, size: int, pragmas: Dict[str, Any]) -> None:
+        if size < 1:
+            raise ValueError(f"Pool size must be at least 1, got {size}")
+        self.db_path = db_path
+        self.size = size
+        self.pragmas = pragmas
+        self._idle: asyncio.Queue[sqlite3.Connection] = asyncio.Queue()
+        self._connections: List[sqlite3.Connection] = []
+        self._opened = 0
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(
+            self.db_path, check_same_thread=False, isolation_level=None
+        )
+        for name, value in self.pragmas.items():
+            conn.execute(f"PRAGMA {name}={value}")
+        return conn
+
+    @asynccontextmanager
+    async def acquire(self) -> AsyncIterator[sqlite3.Connection]:
+        """Check out a connection, opening a new one while below pool size."""
+        if self._idle.empty() and self._opened < self.size:
+            # Reserve the slot before awaiting so concurrent callers can't overshoot
+            self._opened += 1
+            try:
+                conn = await asyncio.to_thread(self._connect)
+            except BaseException:
+                self._opened -= 1
+                raise
+            self._connections.append(conn)
+        else:
+            conn = await self._idle.get()
+        try:
+            yield conn
+        finally:
+            self._idle.put_nowait(conn)
+
+    async def fetchall(self, query: str, params: tuple = ()) -> list:
+        async with self.acquire() as conn:
+            return await asyncio.to_thread(
+                lambda: conn.execute(query, params).fetchall()
+            )
+
+    def close(self) -> None:
+        for conn in self._connections:
+            conn.close()
+        self._connections.clear()
+        self._opened = 0
+        self._idle = asyncio.Queue()
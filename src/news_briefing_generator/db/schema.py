@@ -3,8 +3,24 @@ TABLE_TOPICS = "topics"
 TABLE_TOPIC_FEEDS = "topic_feeds"
 TABLE_BRIEFINGS = "briefings"
 TABLE_BRIEFING_TOPICS = "briefing_topics"
+TABLE_PROMPTS_CACHE = "prompts_cache"
+TABLE_ROBOTS_CACHE = "robots_cache"
 
-FEED_COLUMNS = ["id", "title", "link", "published", "summary", "source", "feed_url", "fetched_at", "scraped_text", "extracted_article", "summarized_article"]
+FEED_COLUMNS = ["id", "title", "link", "published", "summary", "source", "feed_url", "fetched_at", "scraped_text", "extracted_article", "summarized_article", "embedding", "embedding_model"]
 TOPICS_COLUMNS = ["id", "title", "generated_at", "summary"]
-BRIEFINGS_COLUMNS = ["id", "generated_at"]
-BRIEFING_TOPICS_COLUMNS = ["briefing_id", "topic_id"]
\ No newline at end of file
+TOPIC_FEEDS_COLUMNS = ["topic_id", "feed_id", "used_for_summarization"]
+BRIEFINGS_COLUMNS = ["id", "title", "generated_at"]
+BRIEFING_TOPICS_COLUMNS = ["briefing_id", "topic_id"]
+PROMPTS_CACHE_COLUMNS = ["hash", "response", "created_at"]
+ROBOTS_CACHE_COLUMNS = ["domain", "body", "fetched_at"]
+
+# Column names per table, matching the DDL files
+TABLE_COLUMNS = {
+    TABLE_FEEDS: FEED_COLUMNS,
+    TABLE_TOPICS: TOPICS_COLUMNS,
+    TABLE_TOPIC_FEEDS: TOPIC_FEEDS_COLUMNS,
+    TABLE_BRIEFINGS: BRIEFINGS_COLUMNS,
+    TABLE_BRIEFING_TOPICS: BRIEFING_TOPICS_COLUMNS,
+    TABLE_PROMPTS_CACHE: PROMPTS_CACHE_COLUMNS,
+    TABLE_ROBOTS_CACHE: ROBOTS_CACHE_COLUMNS,
+}
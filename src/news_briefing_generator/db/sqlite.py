@@ -1,4 +1,51 @@
+import re
 import sqlite3
+from contextlib import contextmanager
+from functools import lru_cache
+from typing import Any, Dict, Iterator, Optional
+
+import numpy as np
+
+from news_briefing_generator.db.pool import ConnectionPool
+from news_briefing_generator.db.schema import TABLE_COLUMNS
+
+_IDENTIFIER = re.compile(r"^[A-Za-z_][A-Za-z0-9_]*$")
+
+
+def _check_identifiers(*names: str) -> None:
+    """Reject table/column names that would need quoting (or inject SQL)."""
+    for name in names:
+        if not _IDENTIFIER.match(name):
+            raise ValueError(f"Invalid SQL identifier: {name!r}")
+
+
+# SQL templates are memoized per table/column combination, identifiers are
+# validated once on cache miss
+
+
+@lru_cache(maxsize=256)
+def _insert_sql(table: str, columns: tuple[str, ...], replace: bool = False) -> str:
+    _check_identifiers(table, *columns)
+    columns_str = ", ".join(columns)
+    placeholders = ", ".join(["?"] * len(columns))
+    conflict = "REPLACE" if replace else "IGNORE"
+    return f"INSERT OR {conflict} INTO {table} ({columns_str}) VALUES ({placeholders})"
+
+
+@lru_cache(maxsize=256)
+def _select_sql(table: str, columns: tuple[str, ...]) -> str:
+    _check_identifiers(table, *columns)
+    return f"SELECT {', '.join(columns)} FROM {table}"
+
+
+@lru_cache(maxsize=256)
+def _update_sql(
+    table: str, columns: tuple[str, ...], condition_columns: tuple[str, ...]
+) -> str:
+    _check_identifiers(table, *columns, *condition_columns)
+    set_clause = ", ".join(f"{col} = ?" for col in columns)
+    where_clause = " AND ".join(f"{col} = ?" for col in condition_columns)
+    return f"UPDATE {table} SET {set_clause} WHERE {where_clause}"
 
 
 class DatabaseManager:
@@ -6,70 +53,233 @@ class DatabaseManager:
     A class to manage SQLite database operations.
     Methods
     -------
-    __init__(db_path: str) -> None
-        Initializes the database connection.
+    __init__(db_path: str, pragmas: dict | None = None, pool_size: int = 5) -> None
+        Initializes the database connection and applies connection PRAGMAs.
     close() -> None
-        Commits changes and closes the database connection.
+        Runs PRAGMA optimize, commits changes and closes the database connection.
+    ensure_statistics() -> None
+        Runs ANALYZE if no planner statistics exist yet.
+    transaction() -> ContextManager[None]
+        Groups all statements in the block into a single transaction.
     execute_ddl(command: str) -> None
         Executes a DDL (Data Definition Language) command.
-    run_query(query: str) -> list
+    execute_script(script: str) -> None
+        Executes multiple SQL statements in a single transaction.
+    run_query(query: str, params: tuple = ()) -> list
         Executes a query and returns the results.
-    insert(table: str, columns: list, values: list) -> None
+    iter_query(query: str, params: tuple = ()) -> Iterator[tuple]
+        Executes a query and yields the results lazily.
+    run_query_async(query: str, params: tuple = ()) -> list
+        Executes a read query on a pooled connection without blocking the loop.
+    insert(table: str, columns: list, values: list, replace: bool = False) -> None
         Inserts a row into the specified table.
-    select(table: str, columns: list, condition: str | None = None) -> list
-        Selects rows from the specified table with an optional condition.
+    insert_embeddings(rows: list[tuple[int, np.ndarray]], model: str | None = None)
+        Stores feed embeddings as raw float16 BLOBs, with the model that made them.
+    load_embedding(blob: bytes) -> np.ndarray
+        Decodes an embedding BLOB back into a float32 vector.
+    select(table: str, columns: list, where: str | None = None, params: tuple = ())
+        Selects rows from the specified table with an optional parameterized WHERE.
+    select_iter(table: str, columns: list, where: str | None = None, params: tuple = ())
+        Like select, but yields the rows lazily.
+    add_column_if_missing(table: str, column: str, definition: str) -> None
+        Adds a column to an existing table unless it is already present.
     update(table: str, columns: list, values: list, condition: str) -> None
         Updates rows in the specified table based on a condition.
     delete(table: str, condition: str) -> None
         Deletes rows from the specified table based on a condition.
     """
 
-    def __init__(self, db_path: str) -> None:
-        self.conn = sqlite3.connect(db_path)
-        self.cursor = self.conn.cursor()
+    # Embeddings are stored as raw bytes of this dtype
+    EMBEDDING_DTYPE = np.float16
+
+    # WAL lets readers proceed during writes, synchronous=NORMAL is safe with WAL
+    # and syncs less often, and a larger page cache keeps hot pages in memory
+    DEFAULT_PRAGMAS: Dict[str, Any] = {
+        "journal_mode": "WAL",
+        "synchronous": "NORMAL",
+        "temp_store": "MEMORY",
+        "cache_size": -64000,  # 64 MB
+        "mmap_size": 268435456,  # 256 MB
+    }
+
+    def __init__(
+        self,
+        db_path: str,
+        pragmas: Optional[Dict[str, Any]] = None,
+        pool_size: int = 5,
+    ) -> None:
+        # The connection may be created in a worker thread during application
+        # startup and is used from the event loop thread afterwards.
+        # isolation_level=None: single statements autocommit, multi-statement
+        # writes are grouped explicitly via transaction()
+        self.conn = sqlite3.connect(
+            db_path, check_same_thread=False, isolation_level=None
+        )
+
+        # Pass an empty dict to keep SQLite defaults
+        pragmas = self.DEFAULT_PRAGMAS if pragmas is None else pragmas
+        for name, value in pragmas.items():
+            self.conn.execute(f"PRAGMA {name}={value}")
+
+        # Extra connections for concurrent async reads. An in-memory database
+        # is private to its connection, so reads there use the main connection.
+        self.pool: Optional[ConnectionPool] = None
+        if db_path != ":memory:" and pool_size > 0:
+            self.pool = ConnectionPool(db_path, size=pool_size, pragmas=pragmas)
 
     def close(self) -> None:
+        if self.pool:
+            self.pool.close()
+        # Let SQLite refresh planner statistics that went stale during this run
+        self.conn.execute("PRAGMA optimize")
         self.conn.commit()
         self.conn.close()
 
-    def execute_ddl(self, command: str) -> None:
-        self.cursor.execute(command)
-        self.conn.commit()
+    @contextmanager
+    def transaction(self) -> Iterator[None]:
+        """Run all statements in the block in one transaction (a single commit).
 
-    def run_query(self, query: str) -> list:
-        self.cursor.execute(query)
-        return self.cursor.fetchall()
+        Rolls back on error. Nested calls join the already open transaction.
+        The write lock is taken up front (BEGIN IMMEDIATE), so a block can't fail
+        halfway with SQLITE_BUSY when upgrading from a read to a write lock.
+        """
+        if self.conn.in_transaction:
+            yield
+            return
 
-    def insert(self, table: str, columns: list, values: list) -> None:
-        placeholders = ", ".join(["?"] * len(columns))
-        columns_str = ", ".join(columns)
-        query = f"INSERT OR IGNORE INTO {table} ({columns_str}) VALUES ({placeholders})"
-        self.cursor.execute(query, values)
+        self.conn.execute("BEGIN IMMEDIATE")
+        try:
+            yield
+        except BaseException:
+            self.conn.rollback()
+            raise
         self.conn.commit()
 
+    def ensure_statistics(self) -> None:
+        """Run ANALYZE once if the database has no planner statistics yet.
+
+        Later runs keep them current through PRAGMA optimize in close().
+        """
+        has_stats = self.conn.execute(
+            "SELECT 1 FROM sqlite_master WHERE name = 'sqlite_stat1'"
+        ).fetchone()
+        if not has_stats:
+            self.conn.execute("ANALYZE")
+
+    def execute_ddl(self, command: str) -> None:
+        self.conn.execute(command)
+
+    def execute_script(self, script: str) -> None:
+        # Wrap all statements in one transaction so the script costs a single commit
+        try:
+            self.conn.executescript(f"BEGIN;\n{script}\nCOMMIT;")
+        except sqlite3.Error:
+            if self.conn.in_transaction:
+                self.conn.rollback()
+            raise
+
+    def run_query(self, query: str, params: tuple = ()) -> list:
+        return self.conn.execute(query, params).fetchall()
+
+    def iter_query(self, query: str, params: tuple = ()) -> Iterator[tuple]:
+        """Execute a query and yield result rows as they are fetched.
+
+        Avoids materializing large result sets. Consume the iterator fully
+        before issuing further writes on this connection.
+        """
+        cursor = self.conn.execute(query, params)
+        try:
+            yield from cursor
+        finally:
+            cursor.close()
+
+    async def run_query_async(self, query: str, params: tuple = ()) -> list:
+        """Run a read query on a pooled connection in a worker thread.
+
+        Pooled connections only see committed data, so don't use this for
+        reads that depend on writes in a still open transaction().
+        """
+        if self.pool is None:
+            return self.conn.execute(query, params).fetchall()
+        return await self.pool.fetchall(query, params)
+
+    def insert(
+        self, table: str, columns: list, values: list, replace: bool = False
+    ) -> None:
+        """Insert a row, existing rows with the same key are kept unless replace."""
+        query = _insert_sql(table, tuple(columns), replace)
+        self.conn.execute(query, values)
+
     def insert_many(self, table: str, columns: list, values: list[tuple]) -> None:
-        placeholders = ", ".join(["?"] * len(columns))
-        columns_str = ", ".join(columns)
-        query = f"INSERT OR IGNORE INTO {table} ({columns_str}) VALUES ({placeholders})"
-        self.cursor.executemany(query, values)
-        self.conn.commit()
+        query = _insert_sql(table, tuple(columns))
+        with self.transaction():
+            self.conn.executemany(query, values)
+
+    def insert_embeddings(
+        self, rows: list[tuple[int, np.ndarray]], model: str | None = None
+    ) -> None:
+        """Store embeddings for the given feed IDs in the feeds table.
+
+        model identifies what produced the vectors, so they are only reused
+        for the same embedding setup.
+        """
+        dtype = self.EMBEDDING_DTYPE
+        with self.transaction():
+            self.conn.executemany(
+                "UPDATE feeds SET embedding = ?, embedding_model = ? WHERE id = ?",
+                [
+                    (
+                        sqlite3.Binary(np.asarray(vec, dtype=dtype).tobytes()),
+                        model,
+                        feed_id,
+                    )
+                    for feed_id, vec in rows
+                ],
+            )
+
+    @classmethod
+    def load_embedding(cls, blob: bytes) -> np.ndarray:
+        """Decode an embedding BLOB written by insert_embeddings()."""
+        return np.frombuffer(blob, dtype=cls.EMBEDDING_DTYPE).astype(np.float32)
 
-    def select(self, table: str, columns: list, condition: str | None = None) -> list:
-        query = f"SELECT {', '.join(columns)} FROM {table}"
-        if condition:
-            query += f" WHERE {condition}"
-        self.cursor.execute(query)
-        return self.cursor.fetchall()
+    def add_column_if_missing(self, table: str, column: str, definition: str) -> None:
+        """Add a column to an existing table unless it is already there."""
+        if column not in self.get_column_names(table, refresh=True):
+            self.conn.execute(f"ALTER TABLE {table} ADD COLUMN {column} {definition}")
+
+    def select(
+        self, table: str, columns: list, where: str | None = None, params: tuple = ()
+    ) -> list:
+        """Select rows, with an optional WHERE clause using ? placeholders.
+
+        Keeping values in params (instead of formatting them into the clause)
+        lets SQLite reuse the prepared statement across calls.
+        """
+        return list(self.select_iter(table, columns, where, params))
+
+    def select_iter(
+        self, table: str, columns: list, where: str | None = None, params: tuple = ()
+    ) -> Iterator[tuple]:
+        """Like select(), but yields rows lazily (see iter_query())."""
+        query = _select_sql(table, tuple(columns))
+        if where:
+            query += f" WHERE {where}"
+        return self.iter_query(query, params)
 
     def delete(self, table: str, condition: str) -> None:
         query = f"DELETE FROM {table} WHERE {condition}"
-        self.cursor.execute(query)
-        self.conn.commit()
+        self.conn.execute(query)
+
+    def get_column_names(self, table: str, refresh: bool = False) -> list:
+        """Column names of a table.
 
-    def get_column_names(self, table: str) -> list:
+        Known tables are answered from the schema constants. Use refresh=True
+        to read the live schema (e.g. for migrations).
+        """
+        if not refresh and table in TABLE_COLUMNS:
+            return list(TABLE_COLUMNS[table])
         query = f"PRAGMA table_info({table})"
-        self.cursor.execute(query)
-        return [row[1] for row in self.cursor.fetchall()]
+        return [row[1] for row in self.conn.execute(query)]
 
     def update_many(
         self,
@@ -90,10 +300,6 @@ class DatabaseManager:
         if isinstance(condition_columns, str):
             condition_columns = [condition_columns]
 
-        # Build SET and WHERE clauses
-        set_clause = ", ".join([f"{col} = ?" for col in columns])
-        where_clause = " AND ".join([f"{col} = ?" for col in condition_columns])
-
-        query = f"UPDATE {table} SET {set_clause} WHERE {where_clause}"
-        self.cursor.executemany(query, values)
-        self.conn.commit()
+        query = _update_sql(table, tuple(columns), tuple(condition_columns))
+        with self.transaction():
+            self.conn.executemany(query, values)
@@ -1,14 +1,34 @@
+from functools import lru_cache
+
 import numpy as np
-from langchain_huggingface import HuggingFaceEmbeddings
 
 
 class HFEmbeddings:
     """HuggingFace Embeddings interface."""
 
     def __init__(self, **kwargs):
+        # Imported here, langchain_huggingface loads sentence-transformers/torch
+        from langchain_huggingface import HuggingFaceEmbeddings
+
         self.model = HuggingFaceEmbeddings(**kwargs)
 
-    def embed(self, docs: list[str]) -> list[np.ndarray]:
+    def embed(self, docs: list[str], normalize: bool = False) -> np.ndarray:
+        """Embed documents into a single (n_docs, dim) float32 matrix.
+
+        Args:
+            docs: Documents to embed
+            normalize: Scale each embedding to unit length, so cosine similarity
+                reduces to a plain dot product downstream
+        """
         embeddings = self.model.embed_documents(docs)  # list[list[float]]
-        embeddings = [np.array(lst) for lst in embeddings]
+        embeddings = np.asarray(embeddings, dtype=np.float32)
+        if normalize and embeddings.size:
+            norms = np.linalg.norm(embeddings, axis=1, keepdims=True)
+            np.divide(embeddings, norms, out=embeddings, where=norms > 0)
         return embeddings
+
+
+@lru_cache(maxsize=2)
+def get_hf_embeddings(model_name: str) -> HFEmbeddings:
+    """Load an embedding model once per process and reuse it on later runs."""
+    return HFEmbeddings(model_name=model_name)
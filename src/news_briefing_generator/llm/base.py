@@ -1,15 +1,57 @@
+import asyncio
+import hashlib
+import json
 from abc import abstractmethod
-from typing import Any, Optional
+from datetime import datetime, timedelta, timezone
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Sequence
 
+from langchain_core.messages import (
+    SystemMessage,
+    message_to_dict,
+    messages_from_dict,
+)
 from langchain_core.messages.base import BaseMessage
 
+from news_briefing_generator.db.schema import (
+    PROMPTS_CACHE_COLUMNS,
+    TABLE_PROMPTS_CACHE,
+)
+from news_briefing_generator.utils.datetime_ops import get_utc_now_formatted
+
+if TYPE_CHECKING:
+    from news_briefing_generator.db.sqlite import DatabaseManager
+
+DEFAULT_MAX_CONCURRENCY = 8
+
+
+@lru_cache(maxsize=32)
+def system_message(content: str) -> SystemMessage:
+    """Return a shared SystemMessage for a constant system prompt.
+
+    System prompts are module-level constants sent with every call of a task,
+    so one message object per prompt is built and reused instead of a new one
+    per request. Callers must not mutate the returned message.
+    """
+    return SystemMessage(content=content)
+
 
 class LLM:
     """Base LLM interface."""
 
-    def __init__(self, type: str, base_url: Optional[str] = None) -> None:
+    def __init__(
+        self, type: str, base_url: Optional[str] = None, use_cache: bool = False
+    ) -> None:
         self._type = type
         self.base_url = base_url
+        self.config: Dict[str, Any] = {}
+        # Upper bound for in-flight requests in generate_many_async()
+        self.max_concurrency = DEFAULT_MAX_CONCURRENCY
+        # Responses are cached only with use_cache and an attached database
+        self.use_cache = use_cache
+        self.cache_db: Optional["DatabaseManager"] = None
+        # Maximum age of reused responses in hours, None keeps them forever
+        self.cache_ttl: Optional[float] = None
 
     def __str__(self) -> str:
         return f"LLM(type={self._type}, base_url={self.base_url})"
@@ -22,6 +64,77 @@ class LLM:
     async def generate_async(self, prompts: Any) -> BaseMessage:
         pass
 
+    async def generate_many_async(
+        self, prompts_list: Sequence[Any], max_concurrency: Optional[int] = None
+    ) -> List[BaseMessage]:
+        """Generate responses for several prompts concurrently.
+
+        Args:
+            prompts_list: Prompts as returned by prepare_prompts()
+            max_concurrency: Maximum number of requests in flight, defaults to
+                self.max_concurrency
+
+        Returns:
+            List of responses in the same order as prompts_list
+        """
+        semaphore = asyncio.Semaphore(max_concurrency or self.max_concurrency)
+
+        async def generate_one(prompts: Any) -> BaseMessage:
+            async with semaphore:
+                return await self.generate_async(prompts)
+
+        return await asyncio.gather(*(generate_one(p) for p in prompts_list))
+
+    def attach_cache(self, db: "DatabaseManager") -> None:
+        """Use the prompts_cache table of db to cache responses."""
+        self.cache_db = db
+
+    def _cache_key(self, prompts: Any) -> Optional[bytes]:
+        """Hash provider, model config and prompt content (None if caching is off)."""
+        if not (self.use_cache and self.cache_db):
+            return None
+        if isinstance(prompts, list):
+            prompt_text = "|".join(f"{m.type}:{m.content}" for m in prompts)
+        else:
+            prompt_text = str(prompts)
+        config = repr(sorted(self.config.items()))
+        return hashlib.blake2b(
+            f"{self._type}|{config}|{prompt_text}".encode(), digest_size=16
+        ).digest()
+
+    def _cache_get(self, key: Optional[bytes]) -> Optional[BaseMessage]:
+        if key is None:
+            return None
+        where, params = "hash = ?", (key,)
+        if self.cache_ttl is not None:
+            # created_at uses the fixed-width UTC format, so strings compare in order
+            cutoff = datetime.now(timezone.utc) - timedelta(hours=self.cache_ttl)
+            where += " AND created_at >= ?"
+            params += (cutoff.strftime("%Y-%m-%d %H:%M:%S%z"),)
+        rows = self.cache_db.select(
+            table=TABLE_PROMPTS_CACHE,
+            columns=["response"],
+            where=where,
+            params=params,
+        )
+        if not rows:
+            return None
+        return messages_from_dict([json.loads(rows[0][0])])[0]
+
+    def _cache_put(self, key: Optional[bytes], response: BaseMessage) -> None:
+        if key is None:
+            return
+        self.cache_db.insert(
+            table=TABLE_PROMPTS_CACHE,
+            columns=PROMPTS_CACHE_COLUMNS,
+            values=(
+                key,
+                json.dumps(message_to_dict(response)),
+                get_utc_now_formatted(),
+            ),
+            replace=True,  # Refreshes expired entries
+        )
+
     @abstractmethod
     def prepare_prompts(self, human: str, system: str) -> Any:
         pass
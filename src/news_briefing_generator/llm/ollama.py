@@ -1,16 +1,23 @@
 from typing import Any, List, Optional
 
-from langchain_core.messages import BaseMessage, HumanMessage, SystemMessage
-from langchain_ollama import ChatOllama
+from langchain_core.messages import BaseMessage, HumanMessage
 
-from .base import LLM
+from .base import LLM, system_message
+
+__all__ = ["OllamaModel"]
 
 
 class OllamaModel(LLM):
     """Ollama LLM interface."""
 
-    def __init__(self, base_url: Optional[str] = None, **kwargs: Any) -> None:
-        super().__init__("ollama", base_url)
+    def __init__(
+        self, base_url: Optional[str] = None, use_cache: bool = False, **kwargs: Any
+    ) -> None:
+        super().__init__("ollama", base_url, use_cache=use_cache)
+        # Imported here to keep the integration package off the import path
+        # of code that never instantiates this model (e.g. CLI startup)
+        from langchain_ollama import ChatOllama
+
         self.model = ChatOllama(base_url=base_url, **kwargs)
         self.config = kwargs
 
@@ -19,10 +26,21 @@ class OllamaModel(LLM):
         return f"OllamaModel(base_url={self.base_url}, {config_str})"
 
     def generate(self, prompts: Any) -> BaseMessage:
-        return self.model.invoke(prompts)
+        key = self._cache_key(prompts)
+        cached = self._cache_get(key)
+        if cached is not None:
+            return cached
+        response = self.model.invoke(prompts)
+        self._cache_put(key, response)
+        return response
 
     async def generate_async(self, prompts: Any) -> BaseMessage:
+        key = self._cache_key(prompts)
+        cached = self._cache_get(key)
+        if cached is not None:
+            return cached
         response = await self.model.ainvoke(prompts)
+        self._cache_put(key, response)
         return response
 
     @staticmethod
@@ -42,4 +60,4 @@ class OllamaModel(LLM):
         if not human or not system:
             raise ValueError("Both human and system prompts must not be empty")
 
-        return [SystemMessage(content=system), HumanMessage(content=human)]
+        return [system_message(system), HumanMessage(content=human)]
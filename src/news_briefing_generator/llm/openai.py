@@ -1,16 +1,21 @@
 from typing import Any, List, Optional
 
-from langchain_core.messages import BaseMessage, HumanMessage, SystemMessage
-from langchain_openai import ChatOpenAI
+from langchain_core.messages import BaseMessage, HumanMessage
 
-from .base import LLM
+from .base import LLM, system_message
+
+__all__ = ["OpenAIModel"]
 
 
 class OpenAIModel(LLM):
     """OpenAI LLM interface."""
 
-    def __init__(self, api_key: Optional[str] = None, **kwargs: Any) -> None:
-        super().__init__("openai", None)
+    def __init__(
+        self, api_key: Optional[str] = None, use_cache: bool = False, **kwargs: Any
+    ) -> None:
+        super().__init__("openai", None, use_cache=use_cache)
+        # Imported here, langchain_openai pulls in the openai client and httpx
+        from langchain_openai import ChatOpenAI
 
         # Use api_key from kwargs if the explicit parameter is None
         if api_key is None and "api_key" in kwargs:
@@ -38,10 +43,21 @@ class OpenAIModel(LLM):
         return self.__str__()
 
     def generate(self, prompts: Any) -> BaseMessage:
-        return self.model.invoke(prompts)
+        key = self._cache_key(prompts)
+        cached = self._cache_get(key)
+        if cached is not None:
+            return cached
+        response = self.model.invoke(prompts)
+        self._cache_put(key, response)
+        return response
 
     async def generate_async(self, prompts: Any) -> BaseMessage:
+        key = self._cache_key(prompts)
+        cached = self._cache_get(key)
+        if cached is not None:
+            return cached
         response = await self.model.ainvoke(prompts)
+        self._cache_put(key, response)
         return response
 
     @staticmethod
@@ -61,4 +77,4 @@ class OpenAIModel(LLM):
         if not human or not system:
             raise ValueError("Both human and system prompts must not be empty")
 
-        return [SystemMessage(content=system), HumanMessage(content=human)]
+        return [system_message(system), HumanMessage(content=human)]
@@ -0,0 +1,140 @@
+import asyncio
+import sys
+import time
+from typing import List, Optional, Tuple, Type
+
+from tenacity import (
+    AsyncRetrying,
+    retry_if_exception,
+    stop_after_attempt,
+    wait_exponential,
+)
+
+RATE_LIMIT_STATUS = 429
+RATE_LIMIT_MAX_ATTEMPTS = 5
+
+
+def _status_code(error: BaseException) -> Optional[int]:
+    """HTTP status code of an LLM client error, None if it has none.
+
+    The OpenAI client (APIStatusError), the Ollama client (ResponseError) and
+    httpx errors all expose it, either directly or on their response.
+    """
+    status = getattr(error, "status_code", None)
+    if status is None:
+        status = getattr(getattr(error, "response", None), "status_code", None)
+    return status
+
+
+def is_rate_limit_error(error: BaseException) -> bool:
+    """Check whether an LLM client error is an HTTP 429 rate limit response."""
+    return _status_code(error) == RATE_LIMIT_STATUS
+
+
+def _connection_error_types() -> Tuple[Type[BaseException], ...]:
+    """Connection error classes of the HTTP clients loaded in this process.
+
+    The clients are looked up in sys.modules instead of imported: an error
+    raised by httpx or openai means its module is already loaded, and
+    importing them here would cost every run, Ollama-only ones included.
+    """
+    types: List[Type[BaseException]] = [TimeoutError]
+    httpx = sys.modules.get("httpx")
+    if httpx is not None:
+        types.append(httpx.TransportError)
+    openai = sys.modules.get("openai")
+    if openai is not None:
+        types.append(openai.APIConnectionError)
+    return tuple(types)
+
+
+def is_transient_error(error: BaseException) -> bool:
+    """Check whether an LLM request may succeed when sent again.
+
+    Rate limits, server errors, timeouts and connection problems are
+    transient. Other client errors, such as a prompt exceeding the context
+    window, fail the same way on every attempt and are not.
+    """
+    if isinstance(error, _connection_error_types()):
+        return True
+    status = _status_code(error)
+    if not isinstance(status, int):
+        return False
+    return status == RATE_LIMIT_STATUS or status >= 500
+
+
+def transient_error_retrying() -> AsyncRetrying:
+    """Retry policy for transient errors: exponential backoff, 5 attempts."""
+    return AsyncRetrying(
+        retry=retry_if_exception(is_transient_error),
+        wait=wait_exponential(multiplier=1, max=60),
+        stop=stop_after_attempt(RATE_LIMIT_MAX_ATTEMPTS),
+        reraise=True,
+    )
+
+
+class TokenBucketLimiter:
+    """Limits requests and tokens per minute sent to an LLM endpoint.
+
+    Both budgets refill continuously. acquire() waits until one request and the
+    estimated number of tokens are available and then takes them, so bursts of
+    coroutines are spread out instead of running into 429 responses.
+
+    Methods
+    -------
+    acquire(tokens: int = 0) -> None
+        Waits for and takes one request and the given number of tokens.
+    """
+
+    def __init__(
+        self,
+        requests_per_minute: Optional[float] = None,
+        tokens_per_minute: Optional[float] = None,
+    ) -> None:
+        self.requests_per_minute = requests_per_minute
+        self.tokens_per_minute = tokens_per_minute
+        # Buckets start full, a None budget is unlimited
+        self._requests = requests_per_minute or 0.0
+        self._tokens = tokens_per_minute or 0.0
+        self._updated = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        minutes = (now - self._updated) / 60
+        self._updated = now
+        if self.requests_per_minute:
+            self._requests = min(
+                self.requests_per_minute,
+                self._requests + minutes * self.requests_per_minute,
+            )
+        if self.tokens_per_minute:
+            self._tokens = min(
+                self.tokens_per_minute, self._tokens + minutes * self.tokens_per_minute
+            )
+
+    def _wait_time(self, tokens: float) -> float:
+        """Seconds until both buckets hold enough, 0 if they already do."""
+        wait = 0.0
+        if self.requests_per_minute and self._requests < 1:
+            wait = (1 - self._requests) / self.requests_per_minute * 60
+        if self.tokens_per_minute and self._tokens < tokens:
+            wait = max(wait, (tokens - self._tokens) / self.tokens_per_minute * 60)
+        return wait
+
+    async def acquire(self, tokens: int = 0) -> None:
+        # Requests larger than the whole budget would otherwise wait forever
+        if self.tokens_per_minute:
+            tokens = min(tokens, self.tokens_per_minute)
+        # Waiters are served in order, each one sleeps until its budget refills
+        async with self._lock:
+            self._refill()
+            wait = self._wait_time(tokens)
+            while wait > 0:
+                await asyncio.sleep(wait)
+                self._refill()
+                wait = self._wait_time(tokens)
+            if self.requests_per_minute:
+                self._requests -= 1
+            if self.tokens_per_minute:
+                self._tokens -= tokens
@@ -1,6 +1,7 @@
 import logging
 import logging.handlers
 import sys
+import time
 from dataclasses import dataclass
 from pathlib import Path
 from queue import Queue
@@ -16,6 +17,33 @@ class LogConfig:
     queue_size: int = -1  # no size limit
 
 
+class _CachedTimeFormatter(logging.Formatter):
+    """Formatter that formats each wall-clock second only once.
+
+    Records logged within the same second reuse the cached timestamp string
+    instead of calling time.localtime() + time.strftime() per record. Formatting
+    happens in the single QueueListener thread, so the cache needs no lock.
+    """
+
+    def __init__(self, *args, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        self._cached_second: Optional[int] = None
+        self._cached_time = ""
+
+    def formatTime(
+        self, record: logging.LogRecord, datefmt: Optional[str] = None
+    ) -> str:
+        second = int(record.created)
+        if second != self._cached_second:
+            ct = self.converter(second)
+            self._cached_time = time.strftime(datefmt or self.default_time_format, ct)
+            self._cached_second = second
+        if datefmt:
+            return self._cached_time
+        # Without an explicit datefmt the logging default appends milliseconds
+        return self.default_msec_format % (self._cached_time, record.msecs)
+
+
 class LoggerManager:
     """
     Singleton class to manage logging configuration using QueueHandler and QueueListener for thread-safe logging.
@@ -63,7 +91,7 @@ class LoggerManager:
 
     def _setup_listener(self) -> None:
         """Setup single QueueListener for all loggers."""
-        formatter = logging.Formatter(
+        formatter = _CachedTimeFormatter(
             fmt=self.config.format, datefmt=self.config.date_format
         )
 
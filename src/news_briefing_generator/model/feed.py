@@ -1,10 +1,11 @@
 from dataclasses import dataclass
+from typing import Optional
 
 from news_briefing_generator.preprocessing.parsing import html_to_text, to_dt_utc
 from news_briefing_generator.utils.datetime_ops import get_utc_now_formatted
 
 
-@dataclass
+@dataclass(slots=True)
 class FeedItem:
     """Dataclass to store feed items."""
 
@@ -17,29 +18,31 @@ class FeedItem:
     fetched_at: str | None = None
 
     @classmethod
-    def from_entry(self, entry: str, source: str, feed_url: str) -> "FeedItem":
-        """Creates a FeedItem object from a feedparser entry."""
+    def from_entry(
+        cls,
+        entry: str,
+        source: str,
+        feed_url: str,
+        fetched_at: Optional[str] = None,
+    ) -> Optional["FeedItem"]:
+        """Creates a FeedItem object from a feedparser entry.
+
+        fetched_at defaults to the current time, callers converting a whole
+        feed pass one timestamp for all of its entries.
+        """
 
         # If the entry does not have a link, skip it
         if "link" not in entry:
             return None
 
-        self.source = source
-        self.feed_url = feed_url
-        self.title = entry.get("title", None)
-        self.link = entry.link
-        self.published = to_dt_utc(entry.get("published", entry.get("updated", None)))
-        self.summary = html_to_text(entry.get("summary", None))
-        self.fetched_at = get_utc_now_formatted()
-
-        return FeedItem(
-            self.title,
-            self.link,
-            self.published,
-            self.summary,
-            self.source,
-            self.feed_url,
-            self.fetched_at,
+        return cls(
+            title=entry.get("title", None),
+            link=entry.link,
+            published=to_dt_utc(entry.get("published", entry.get("updated", None))),
+            summary=html_to_text(entry.get("summary", None)),
+            source=source,
+            feed_url=feed_url,
+            fetched_at=fetched_at or get_utc_now_formatted(),
         )
 
     def to_tuple(self) -> tuple:
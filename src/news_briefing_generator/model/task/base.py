@@ -1,8 +1,10 @@
 from abc import ABC, abstractmethod
+from contextlib import asynccontextmanager
 from dataclasses import dataclass, field
-from typing import Any, Dict, Optional
+from types import MappingProxyType
+from typing import Any, AsyncIterator, Dict, Mapping, NamedTuple, Optional
 
-import typer
+import aiohttp
 
 from news_briefing_generator.config.config_manager import (
     ConfigManager,
@@ -13,21 +15,71 @@ from news_briefing_generator.db.sqlite import DatabaseManager
 from news_briefing_generator.llm.base import LLM
 from news_briefing_generator.logging.manager import LoggerManager
 from news_briefing_generator.model.task.result import TaskResult
+from news_briefing_generator.utils.http_session import HttpSessionManager
 
+# Review UI label per parameter source, anything else is a default value
+_STATUS_INDICATORS = {
+    ConfigSource.WORKFLOW: "[source= workflow config]",
+    ConfigSource.ENVIRONMENT_VARIABLE: "[source= environment variable]",
+    ConfigSource.ENVIRONMENT_SETTINGS: "[source= environment settings yaml]",
+    ConfigSource.BASE_SETTINGS: "[source= base settings yaml]",
+}
 
-@dataclass()
+# String to value converters for parameters entered during review
+_CONVERTERS = {
+    bool: lambda value: value.lower() in ("true", "1", "yes"),
+    int: int,
+    float: float,
+    list: lambda value: [item.strip() for item in value.strip("[]").split(",")],
+    str: str,
+}
+
+
+class ParamRecord(NamedTuple):
+    """Resolved value, source and type of a task parameter."""
+
+    value: Any
+    source: ConfigSource
+    type: Optional[type]
+
+
+# Shared read-only default, contexts get their own dict on first write
+_EMPTY_MAPPING: Mapping[str, Any] = MappingProxyType({})
+
+
+@dataclass(slots=True)
 class TaskContext:
     """Common context for all tasks."""
 
     db: DatabaseManager
     conf: ConfigManager
     logger_manager: LoggerManager
-    params: Dict[str, Any] = field(
-        default_factory=dict
+    params: Mapping[str, Any] = field(
+        default_factory=lambda: _EMPTY_MAPPING
     )  # parameters from worflow config
-    param_sources: Dict[str, Dict[str, Any]] = field(default_factory=dict)
-    workflow_data: Dict[str, Any] = field(default_factory=dict)  # For inter-task data
+    param_sources: Dict[str, ParamRecord] = field(default_factory=dict)
+    workflow_data: Mapping[str, Any] = field(
+        default_factory=lambda: _EMPTY_MAPPING
+    )  # For inter-task data
     llm: Optional[LLM] = None
+    http: Optional[HttpSessionManager] = None  # HTTP session shared between tasks
+
+    @asynccontextmanager
+    async def http_session(self) -> AsyncIterator[aiohttp.ClientSession]:
+        """Yield the shared HTTP session, or a session for this block only."""
+        if self.http is not None:
+            yield self.http.get_session()
+            return
+        async with aiohttp.ClientSession() as session:
+            yield session
+
+    def update_params(self, values: Mapping[str, Any]) -> None:
+        """Update parameters, copying the shared empty default on first write."""
+        if not values:
+            return
+        if not isinstance(self.params, dict):
+            self.params = dict(self.params)
+        self.params.update(values)
 
 
 class Task(ABC):
@@ -98,18 +150,22 @@ class Task(ABC):
         Returns:
             str: "accepted", "rejected", or "re-run"
         """
-        typer.echo(f"\nReview output for task: {self.name}")
-        typer.echo("\nMetrics:")
-        for key, value in result.metrics.items():
-            typer.echo(f"  {key}: {value}")
-        typer.echo("\nWarnings:")
-        typer.echo(result.warning or "None")
+        # Interactive only, headless runs never import the CLI toolkit
+        import typer
+
+        # Each screen is written with a single echo call
+        lines = [f"\nReview output for task: {self.name}", "\nMetrics:"]
+        lines.extend(f"  {key}: {value}" for key, value in result.metrics.items())
+        lines.extend(["\nWarnings:", result.warning or "None"])
+        typer.echo("\n".join(lines))
 
         while True:
-            typer.echo("\nOptions:")
-            typer.echo("1. Approve")
-            typer.echo("2. Re-run with different parameters")
-            typer.echo("3. Reject")
+            typer.echo(
+                "\nOptions:\n"
+                "1. Approve\n"
+                "2. Re-run with different parameters\n"
+                "3. Reject"
+            )
 
             choice = typer.prompt("\nSelect option (1-3)", type=int)
 
@@ -143,23 +199,31 @@ class Task(ABC):
         Raises:
             ValueError: If conversion fails or type not supported
         """
-        if expected_type == bool:
-            return value.lower() in ("true", "1", "yes")
-        elif expected_type == int:
-            return int(value)
-        elif expected_type == float:
-            return float(value)
-        elif expected_type == list:
-            return [item.strip() for item in value.strip("[]").split(",")]
-        elif expected_type == str:
-            return value
-        raise ValueError(f"Unsupported type: {expected_type}")
+        try:
+            converter = _CONVERTERS[expected_type]
+        except KeyError:
+            raise ValueError(f"Unsupported type: {expected_type}") from None
+        return converter(value)
 
     def _track_param_resolution(
         self, name: str, value: Any, source: ConfigSource
     ) -> None:
-        """Track parameter resolution internally."""
-        self.context.param_sources[name] = {"value": value, "source": source.name}
+        """Track parameter resolution internally.
+
+        The parameter type is fixed by the first non-None value, so later updates
+        are validated against it. None means the type is not known yet.
+        """
+        previous = self.context.param_sources.get(name)
+        if previous is not None:
+            # Parameters are re-resolved on every access, mostly to the same result
+            if previous.source is source and previous.value == value:
+                return
+            param_type = previous.type
+        else:
+            param_type = None
+        if param_type is None and value is not None:
+            param_type = type(value)
+        self.context.param_sources[name] = ParamRecord(value, source, param_type)
 
     def _get_updated_parameters(self) -> Dict[str, Any]:
         """Get updated parameters from user input with source tracking.
@@ -169,45 +233,38 @@ class Task(ABC):
         existing sources.
 
         Returns:
-            Dict[str, Any]: Updated parameter dictionary
+            Dict[str, Any]: Parameters changed by the user, empty if none
         """
+        # Interactive only, headless runs never import the CLI toolkit
+        import typer
+
         # Show all known parameters
-        typer.echo("\nCurrent parameters:")
-
-        def _get_status_indicator(name: str, source: str) -> str:
-            """Get parameter status indicator."""
-            if source == ConfigSource.WORKFLOW.name:
-                return "[source= workflow config]"
-            elif source == ConfigSource.ENVIRONMENT_VARIABLE.name:
-                return "[source= environment variable]"
-            elif source == ConfigSource.ENVIRONMENT_SETTINGS.name:
-                return "[source= environment settings yaml]"
-            elif source == ConfigSource.BASE_SETTINGS.name:
-                return "[source= base settings yaml]"
-            return "[default value]"
+        lines = ["\nCurrent parameters:"]
 
         # Show all parameters with clear source indication
-        for name, param_info in self.context.param_sources.items():
-            value = param_info["value"]
-            source = param_info["source"]
-            status = _get_status_indicator(name, source)
-            typer.echo(f"  {name}: {value} ({source}) {status}")
-
-        typer.echo("\nNote: Parameters can be overridden in order of precedence:")
-        typer.echo("1. Workflow config (active overrides)")
-        typer.echo("2. Environment variables")
-        typer.echo("3. Environment settings")
-        typer.echo("4. Base settings")
-        typer.echo("5. Default values")
-
-        # Get parameter updates
-        updated_params = self.context.params.copy()
-        typer.echo(
-            "\nEnter parameters to update or override (parameter=value), empty line to finish:"
-        )
-        typer.echo(
-            "Note: Updates will be added to workflow config, overriding all other sources"
+        for name, (value, source, _) in self.context.param_sources.items():
+            status = _STATUS_INDICATORS.get(source, "[default value]")
+            lines.append(f"  {name}: {value} ({source.name}) {status}")
+
+        lines.extend(
+            [
+                "\nNote: Parameters can be overridden in order of precedence:",
+                "1. Workflow config (active overrides)",
+                "2. Environment variables",
+                "3. Environment settings",
+                "4. Base settings",
+                "5. Default values",
+                "\nEnter parameters to update or override (parameter=value), "
+                "empty line to finish:",
+                "Note: Updates will be added to workflow config, "
+                "overriding all other sources",
+            ]
         )
+        # Write the whole listing at once
+        typer.echo("\n".join(lines))
+
+        # Collect only the edited parameters, unchanged ones stay in the context
+        updated_params: Dict[str, Any] = {}
 
         while True:
             line = typer.prompt(
@@ -216,35 +273,34 @@ class Task(ABC):
             if not line:
                 break
 
-            try:
-                key, value = line.split("=")
-                key = key.strip()
-
-                # Allow any parameter that has been resolved
-                if key in self.context.param_sources:
-                    try:
-                        param_type = type(self.context.param_sources[key]["value"])
-                        value = self._safe_convert_value(value.strip(), param_type)
-                        current_source = self.context.param_sources[key]["source"]
-                        updated_params[key] = value
-                        typer.echo(
-                            f"Updated {key} = {value} "
-                            f"(overriding previous value from {current_source})"
-                        )
-                    except Exception as e:
-                        typer.echo(
-                            f"Error converting value: {e}. "
-                            f"Make sure the value matches the parameter type."
-                        )
-                else:
+            # Split at the first "=" only, values may contain "=" themselves
+            key, sep, value = line.partition("=")
+            if not sep:
+                typer.echo("Use format: parameter=value (e.g., timeout=30)")
+                continue
+            key = key.strip()
+
+            # Allow any parameter that has been resolved
+            if key in self.context.param_sources:
+                try:
+                    # Parameters without a known type are taken as strings
+                    record = self.context.param_sources[key]
+                    value = self._safe_convert_value(value.strip(), record.type or str)
+                    current_source = record.source.name
+                    updated_params[key] = value
+                    typer.echo(
+                        f"Updated {key} = {value} "
+                        f"(overriding previous value from {current_source})"
+                    )
+                except Exception as e:
                     typer.echo(
-                        f"Warning: '{key}' is not a known parameter. "
-                        "Parameters must be defined in settings or workflow config first."
+                        f"Error converting value: {e}. "
+                        f"Make sure the value matches the parameter type."
                     )
-            except Exception as e:
+            else:
                 typer.echo(
-                    f"Error parsing input: {e}\n"
-                    f"Use format: parameter=value (e.g., timeout=30)"
+                    f"Warning: '{key}' is not a known parameter. "
+                    "Parameters must be defined in settings or workflow config first."
                 )
 
         return updated_params
@@ -261,12 +317,12 @@ class Task(ABC):
                 raise ValueError(f"Unknown parameter: {name}")
 
             # Validate parameter type
-            expected_type = type(self.context.param_sources[name]["value"])
-            if not isinstance(value, expected_type):
+            expected_type = self.context.param_sources[name].type
+            if expected_type is not None and not isinstance(value, expected_type):
                 raise TypeError(
                     f"Parameter {name} must be of type {expected_type.__name__}"
                 )
 
             # Update parameter value and tracking
-            self.context.params[name] = value
+            self.context.update_params({name: value})
             self._track_param_resolution(name, value, ConfigSource.WORKFLOW)
@@ -2,7 +2,7 @@ from dataclasses import dataclass, field
 from typing import List, Optional, Dict, Any
 
 
-@dataclass
+@dataclass(slots=True)
 class TaskConfig:
     """Task configuration container."""
 
@@ -5,7 +5,7 @@ from typing import Any, Optional
 NO_DATA_WARNING = "NO_DATA_WARNING: "
 
 
-@dataclass
+@dataclass(slots=True)
 class TaskResult:
     """Container for standardized task results.
 
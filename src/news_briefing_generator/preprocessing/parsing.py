@@ -1,20 +1,158 @@
-from datetime import datetime
+import codecs
+from datetime import datetime, timezone, tzinfo
+from email.utils import parsedate_to_datetime
+from functools import lru_cache
+from html.parser import HTMLParser
+from importlib.util import find_spec
+from zoneinfo import ZoneInfo
 
-import pytz
-from bs4 import BeautifulSoup
+# Pick the BeautifulSoup tree builder once: the C-based lxml parser when it is
+# installed, otherwise the pure-Python stdlib parser
+_HTML_PARSER = "lxml" if find_spec("lxml") else "html.parser"
+
+
+class _TextExtractor(HTMLParser):
+    """Collects text nodes while parsing, without building a document tree.
+
+    Mirrors BeautifulSoup's get_text(): entities are decoded, comments and
+    script/style contents are dropped, CDATA sections are kept.
+    """
+
+    _SKIP_TAGS = frozenset({"script", "style"})
+
+    def __init__(self) -> None:
+        super().__init__(convert_charrefs=True)
+        self.parts: list[str] = []
+        self._skip_depth = 0
+
+    def handle_starttag(self, tag: str, attrs: list) -> None:
+        if tag in self._SKIP_TAGS:
+            self._skip_depth += 1
+
+    def handle_endtag(self, tag: str) -> None:
+        if tag in self._SKIP_TAGS and self._skip_depth:
+            self._skip_depth -= 1
+
+    def handle_data(self, data: str) -> None:
+        if not self._skip_depth:
+            self.parts.append(data)
+
+    def unknown_decl(self, data: str) -> None:
+        if data.startswith("CDATA["):
+            self.parts.append(data[6:])
 
 
 def html_to_text(html: str) -> str | None:
     """Convert HTML content to plain text."""
     # Check if the input is not None and is a string
     if html and isinstance(html, str):
-        # Parse the HTML content
-        soup = BeautifulSoup(html, "html.parser")
-        # Extract and return the text content
-        return soup.get_text()
+        # Without markup (or entities) there is nothing to parse
+        if "<" not in html and "&" not in html:
+            return html
+        # Stream the text nodes out instead of building a BeautifulSoup tree
+        try:
+            extractor = _TextExtractor()
+            extractor.feed(html)
+            extractor.close()
+            return "".join(extractor.parts)
+        except Exception:
+            # Only the fallback needs bs4, keep it off the import path otherwise
+            from bs4 import BeautifulSoup
+
+            return BeautifulSoup(html, _HTML_PARSER).get_text()
     return html
 
 
+class HtmlTextStream:
+    """Converts HTML arriving in byte chunks to plain text.
+
+    Chunks are parsed as they arrive. With lxml installed the C-based libxml2
+    parser is used, otherwise chunks are decoded and run through the stdlib
+    parser, which keeps only the extracted text so a large page never has to
+    be held in memory as markup.
+    """
+
+    def __init__(self, encoding: str | None = None) -> None:
+        self._lxml_parser = None
+        if _HTML_PARSER == "lxml":
+            from lxml import etree
+
+            try:
+                self._lxml_parser = etree.HTMLParser(
+                    encoding=encoding, remove_comments=True
+                )
+            except LookupError:
+                # Unknown charset, let libxml2 detect it from the document
+                self._lxml_parser = etree.HTMLParser(remove_comments=True)
+            return
+
+        try:
+            decoder_cls = codecs.getincrementaldecoder(encoding or "utf-8")
+        except LookupError:
+            decoder_cls = codecs.getincrementaldecoder("utf-8")
+        self._decoder = decoder_cls(errors="replace")
+        self._extractor = _TextExtractor()
+
+    def feed(self, chunk: bytes) -> None:
+        """Parse the next chunk of the document."""
+        if self._lxml_parser is not None:
+            self._lxml_parser.feed(chunk)
+            return
+        self._extractor.feed(self._decoder.decode(chunk))
+
+    def close(self) -> str:
+        """Finish parsing and return the text of the whole document."""
+        if self._lxml_parser is not None:
+            from lxml import etree
+
+            try:
+                root = self._lxml_parser.close()
+            except etree.XMLSyntaxError:
+                return ""  # Nothing parseable was fed
+            if root is None:
+                return ""
+            etree.strip_elements(root, "script", "style", with_tail=False)
+            return "".join(root.itertext())
+
+        self._extractor.feed(self._decoder.decode(b"", final=True))
+        self._extractor.close()
+        return "".join(self._extractor.parts)
+
+
+def html_bytes_to_text(data: bytes, encoding: str | None = None) -> str:
+    """Convert a complete HTML document in bytes to plain text.
+
+    Top-level so it can be sent to process pool workers.
+    """
+    stream = HtmlTextStream(encoding)
+    stream.feed(data)
+    return stream.close()
+
+
+# Feed timestamp formats, tried in order
+_DATE_FORMATS = (
+    "%a, %d %b %Y %H:%M:%S %Z",  # Mon, 18 Nov 2024 18:55:24 GMT
+    "%a, %d %b %Y %H:%M:%S %z",  # Mon, 18 Nov 2024 21:05:34 +0000
+    "%Y-%m-%dT%H:%M:%S%z",  # 2024-11-19T02:03:27+05:30
+)
+# Abbreviations that aren't valid IANA zone names
+_TZ_MAPPING = {"EDT": "US/Eastern"}
+# Timezone objects by abbreviation, UTC aliases map to the fixed offset and the
+# rest are looked up on first use
+_TZ_CACHE: dict[str, tzinfo] = {"GMT": timezone.utc, "UTC": timezone.utc}
+
+
+def _get_timezone(abbreviation: str) -> tzinfo:
+    """Return the (cached) timezone for a timezone abbreviation."""
+    tz = _TZ_CACHE.get(abbreviation)
+    if tz is None:
+        tz = ZoneInfo(_TZ_MAPPING.get(abbreviation, abbreviation))
+        _TZ_CACHE[abbreviation] = tz
+    return tz
+
+
+# Pure function of its input, and entries of a feed often share timestamps
+@lru_cache(maxsize=4096)
 def to_dt_utc(s: str) -> datetime | None:
     # There's an issue with parsing timestamps in format "%a, %d %b %Y %H:%M:%S %Z"
     # for the timezone value %Z, see: https://github.com/python/cpython/issues/66571
@@ -22,25 +160,27 @@ def to_dt_utc(s: str) -> datetime | None:
     if not s:
         return None
 
-    date_formats = [
-        "%a, %d %b %Y %H:%M:%S %Z",  # Mon, 18 Nov 2024 18:55:24 GMT
-        "%a, %d %b %Y %H:%M:%S %z",  # Mon, 18 Nov 2024 21:05:34 +0000
-        "%Y-%m-%dT%H:%M:%S%z",  # 2024-11-19T02:03:27+05:30
-    ]
-    tz_mapping = {"EDT": "US/Eastern"}
+    # Fast paths: ISO 8601 (C parser) and RFC 822 dates. Only timezone-aware
+    # results are accepted, anything else falls through to the strptime formats
+    try:
+        dt = datetime.fromisoformat(s)
+    except ValueError:
+        try:
+            dt = parsedate_to_datetime(s)
+        except (TypeError, ValueError):
+            dt = None
+    if dt is not None and dt.tzinfo is not None:
+        return dt.astimezone(timezone.utc)
 
-    for date_format in date_formats:
+    for date_format in _DATE_FORMATS:
         try:
             dt = datetime.strptime(s, date_format)
 
             if not dt.tzinfo:
                 # Assuming that this only happens for format '%a, %d %b %Y %H:%M:%S %Z'
-                Z = s[-3:]
-                tz = tz_mapping[Z] if Z in tz_mapping else Z
-                timezone = pytz.timezone(tz)
-                dt = timezone.localize(dt)
+                dt = dt.replace(tzinfo=_get_timezone(s[-3:]))
 
-            dt_utc = dt.astimezone(pytz.UTC)
+            dt_utc = dt.astimezone(timezone.utc)
             return dt_utc
         except ValueError:
             continue
@@ -45,3 +45,18 @@ Output format:
 <summary>
 [Your 5-15 sentence summary here]
 </summary>"""
+
+ARTICLE_BATCH_SUMMARY_USER = """Summarize each of the following {count} webpage texts separately:
+
+{articles}
+
+Return exactly {count} summaries, one per webpage and in the same order. Start each
+one on a new line with "SUMMARY <number>:" followed by the summary in the format:
+<summary>
+[Your 5-15 sentence summary here]
+</summary>"""
+
+ARTICLE_BATCH_SECTION = """=== ARTICLE {number} ===
+[WEBPAGE CONTENT START]
+{article}
+[WEBPAGE CONTENT END]"""
@@ -15,3 +15,20 @@ HEADLINES:
 {headlines}
 
 HEADLINE:"""
+
+TOPIC_TITLE_BATCH_USER = """Create one brief headline for each of the following {count} topics, summarizing the topic's article headlines/abstracts.
+
+Style requirements:
+- Maximum length: {max_words} words
+- Use title case (capitalize main words), not ALL CAPS
+- Be informative and factual, avoid sensationalism
+- Provide only the headlines with no explanation or commentary
+- Use plain text with no formatting characters (no asterisks, underscores, etc.)
+
+{topics}
+
+Return exactly {count} headlines, one per topic and in the same order, each on its
+own line as "TITLE <number>: <headline>"."""
+
+TOPIC_TITLE_BATCH_SECTION = """TOPIC {number} HEADLINES:
+{headlines}"""
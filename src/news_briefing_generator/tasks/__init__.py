@@ -1,28 +1,42 @@
-from typing import Dict, Type
-
-from news_briefing_generator.model.task.base import Task
-from news_briefing_generator.tasks.article_summarization import ArticleSummarizationTask
-from news_briefing_generator.tasks.briefing_html_generation import (
-    BriefingHtmlGenerationTask,
-)
-from news_briefing_generator.tasks.content_fetching import ContentFetchingTask
-from news_briefing_generator.tasks.feed_collection import FeedCollectionTask
-from news_briefing_generator.tasks.feed_hdbscan_clustering import (
-    FeedHdbscanClusteringTask,
-)
-from news_briefing_generator.tasks.topic_selection import TopicSelectionTask
-from news_briefing_generator.tasks.topic_summarization import TopicSummarizationTask
-from news_briefing_generator.tasks.topic_title_generation import (
-    TopicTitleGenerationTask,
-)
-
-TASK_REGISTRY: Dict[str, Type[Task]] = {
-    "TopicSelectionTask": TopicSelectionTask,
-    "FeedCollectionTask": FeedCollectionTask,
-    "FeedHdbscanClusteringTask": FeedHdbscanClusteringTask,
-    "ContentFetchingTask": ContentFetchingTask,
-    "TopicTitleGenerationTask": TopicTitleGenerationTask,
-    "ArticleSummarizationTask": ArticleSummarizationTask,
-    "TopicSummarizationTask": TopicSummarizationTask,
-    "BriefingHtmlGenerationTask": BriefingHtmlGenerationTask,
+from importlib import import_module
+from typing import TYPE_CHECKING, Dict, Iterator, Mapping, Type
+
+if TYPE_CHECKING:
+    from news_briefing_generator.model.task.base import Task
+
+# Task type -> module defining the task class of the same name
+_TASK_MODULES: Dict[str, str] = {
+    "TopicSelectionTask": "topic_selection",
+    "FeedCollectionTask": "feed_collection",
+    "FeedHdbscanClusteringTask": "feed_hdbscan_clustering",
+    "ContentFetchingTask": "content_fetching",
+    "TopicTitleGenerationTask": "topic_title_generation",
+    "ArticleSummarizationTask": "article_summarization",
+    "TopicSummarizationTask": "topic_summarization",
+    "BriefingHtmlGenerationTask": "briefing_html_generation",
 }
+
+
+class _LazyTaskRegistry(Mapping[str, Type["Task"]]):
+    """Task registry that imports a task module on first lookup.
+
+    Membership checks and iteration only use the task names, so validating a
+    workflow or running a few tasks doesn't load the dependencies (pandas,
+    hdbscan, jinja2, ...) of every other task.
+    """
+
+    def __getitem__(self, task_type: str) -> Type["Task"]:
+        module = import_module(f"{__name__}.{_TASK_MODULES[task_type]}")
+        return getattr(module, task_type)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(_TASK_MODULES)
+
+    def __len__(self) -> int:
+        return len(_TASK_MODULES)
+
+    def __contains__(self, task_type: object) -> bool:
+        return task_type in _TASK_MODULES
+
+
+TASK_REGISTRY: Mapping[str, Type["Task"]] = _LazyTaskRegistry()
@@ -1,23 +1,61 @@
 import asyncio
+import hashlib
 import random
-from dataclasses import dataclass
-from typing import Dict, List, Optional, Tuple
+import re
+from dataclasses import dataclass, replace
+from typing import Any, Dict, Iterable, List, NamedTuple, Optional, Tuple, TypeVar
 
 from langchain_core.messages.ai import AIMessage
 
 from news_briefing_generator.llm.base import LLM
+from news_briefing_generator.llm.rate_limit import (
+    TokenBucketLimiter,
+    transient_error_retrying,
+)
 from news_briefing_generator.model.task.base import Task, TaskContext
 from news_briefing_generator.model.task.result import NO_DATA_WARNING, TaskResult
 from news_briefing_generator.prompt.summarization.article import (
+    ARTICLE_BATCH_SECTION,
+    ARTICLE_BATCH_SUMMARY_USER,
     ARTICLE_SUMMARY_SYSTEM,
     ARTICLE_SUMMARY_USER,
 )
-from news_briefing_generator.utils.async_progress import track_async_progress
+from news_briefing_generator.utils.async_progress import (
+    DEFAULT_UPDATE_INTERVAL,
+    track_async_progress,
+)
 from news_briefing_generator.utils.database_ops import (
     get_feeds_for_topics,
     get_topics_for_briefing,
 )
 from news_briefing_generator.utils.datetime_ops import get_utc_now_formatted
+from news_briefing_generator.utils.text_processing import (
+    CHARS_PER_TOKEN,
+    truncate_to_tokens,
+)
+
+T = TypeVar("T")
+
+# Pre-split around the placeholder, so prompts are built by concatenation
+_ARTICLE_USER_PREFIX, _ARTICLE_USER_SUFFIX = ARTICLE_SUMMARY_USER.split("{article}", 1)
+
+# One "SUMMARY <n>:" section per article in a batched response
+_BATCH_SUMMARY_RE = re.compile(r"SUMMARY (\d+):\s*(.*?)(?=SUMMARY \d+:|\Z)", re.S)
+
+
+def _parse_batch_summaries(text: str, count: int) -> Optional[List[str]]:
+    """Split a batched response into its summaries, in article order.
+
+    Returns None unless the response holds exactly one non-empty summary
+    for each of the ``count`` articles.
+    """
+    summaries = {
+        int(match.group(1)): match.group(2).strip()
+        for match in _BATCH_SUMMARY_RE.finditer(text)
+    }
+    if sorted(summaries) != list(range(1, count + 1)) or not all(summaries.values()):
+        return None
+    return [summaries[number] for number in range(1, count + 1)]
 
 
 @dataclass
@@ -29,6 +67,12 @@ class ArticleData:
     text: str
 
 
+class ArticleSummary(NamedTuple):
+    """Summary text of an article, as passed on in the task result data."""
+
+    content: str
+
+
 @dataclass
 class ProcessingResult:
     """Container for processing results."""
@@ -41,6 +85,32 @@ class ProcessingResult:
     success: bool = True
 
 
+def _reservoir_sample(items: Iterable[T], k: int) -> List[T]:
+    """Uniformly sample up to k items in a single pass, holding only k at a time."""
+    sample: List[T] = []
+    for i, item in enumerate(items):
+        if i < k:
+            sample.append(item)
+        else:
+            j = random.randint(0, i)
+            if j < k:
+                sample[j] = item
+    return sample
+
+
+def _group_duplicates(tasks: List[ArticleData]) -> List[List[ArticleData]]:
+    """Group article tasks with identical text, keeping first-seen order.
+
+    Syndicated wire stories show up in several feeds, each group only needs
+    to be summarized once.
+    """
+    groups: Dict[bytes, List[ArticleData]] = {}
+    for task in tasks:
+        digest = hashlib.blake2b(task.text.encode(), digest_size=16).digest()
+        groups.setdefault(digest, []).append(task)
+    return list(groups.values())
+
+
 class ArticleSummarizationTask(Task):
     """Implementation of article summarization task.
 
@@ -48,17 +118,30 @@ class ArticleSummarizationTask(Task):
     Handles concurrent processing and token usage tracking.
 
     Attributes:
-        DEFAULT_MAX_LENGTH: Maximum length for article text
+        DEFAULT_MAX_LENGTH: Maximum length for article text in characters
+        DEFAULT_MAX_INPUT_TOKENS: Maximum length for article text in tokens
         DEFAULT_MAX_CONCURRENT: Maximum concurrent LLM requests
         DEFAULT_NR_ARTICLES: Maximum articles to process per topic
+        DEFAULT_BATCH_SIZE: Articles summarized per LLM request, 1 disables batching
+        DEFAULT_REQUESTS_PER_MINUTE: LLM request budget, None for no limit
+        DEFAULT_TOKENS_PER_MINUTE: Estimated LLM input token budget, None for no limit
+        DEFAULT_PROGRESS_UPDATE_INTERVAL: Minimum seconds between progress redraws
     """
 
     DEFAULT_MAX_LENGTH: Optional[int] = None
+    DEFAULT_MAX_INPUT_TOKENS: Optional[int] = None
     DEFAULT_MAX_CONCURRENT: int = 5
     DEFAULT_NR_ARTICLES: Optional[int] = None
+    DEFAULT_BATCH_SIZE: int = 1
+    DEFAULT_REQUESTS_PER_MINUTE: Optional[float] = None
+    DEFAULT_TOKENS_PER_MINUTE: Optional[float] = None
+    DEFAULT_PROGRESS_UPDATE_INTERVAL: float = DEFAULT_UPDATE_INTERVAL
 
     def __init__(self, context: TaskContext):
         super().__init__(context)
+        self.rate_limiter: Optional[TokenBucketLimiter] = None
+        self.max_input_tokens: Optional[int] = None
+        self.progress_update_interval = self.DEFAULT_PROGRESS_UPDATE_INTERVAL
 
     @property
     def name(self) -> str:
@@ -75,18 +158,39 @@ class ArticleSummarizationTask(Task):
             max_length = self.get_parameter(
                 "max_length", default=self.DEFAULT_MAX_LENGTH
             )
+            self.max_input_tokens = self.get_parameter(
+                "max_input_tokens", default=self.DEFAULT_MAX_INPUT_TOKENS
+            )
             max_concurrent = self.get_parameter(
                 "max_concurrent", default=self.DEFAULT_MAX_CONCURRENT
             )
             nr_articles = self.get_parameter(
                 "nr_articles", default=self.DEFAULT_NR_ARTICLES
             )
+            batch_size = self.get_parameter(
+                "batch_size", default=self.DEFAULT_BATCH_SIZE
+            )
+            requests_per_minute = self.get_parameter(
+                "requests_per_minute", default=self.DEFAULT_REQUESTS_PER_MINUTE
+            )
+            tokens_per_minute = self.get_parameter(
+                "tokens_per_minute", default=self.DEFAULT_TOKENS_PER_MINUTE
+            )
+            self.progress_update_interval = self.get_parameter(
+                "progress_update_interval",
+                default=self.DEFAULT_PROGRESS_UPDATE_INTERVAL,
+            )
+            if requests_per_minute or tokens_per_minute:
+                self.rate_limiter = TokenBucketLimiter(
+                    requests_per_minute, tokens_per_minute
+                )
 
             return await self._run_summarization(
                 briefing_id=briefing_id,
                 max_length=max_length,
                 max_concurrent=max_concurrent,
                 nr_articles=nr_articles,
+                batch_size=batch_size,
             )
         except Exception as e:
             self.logger.error(f"Article summarization failed: {str(e)}", exc_info=True)
@@ -104,6 +208,7 @@ class ArticleSummarizationTask(Task):
         max_length: Optional[int] = None,
         max_concurrent: int = DEFAULT_MAX_CONCURRENT,
         nr_articles: Optional[int] = None,
+        batch_size: int = DEFAULT_BATCH_SIZE,
     ) -> TaskResult:
         """Run article summarization for a briefing.
 
@@ -137,18 +242,17 @@ class ArticleSummarizationTask(Task):
         # Prepare article tasks
         article_tasks = []
         for topic_id, feeds in feeds_by_topic.items():
-            valid_feeds = [f for f in feeds if f.get("scraped_text")]
+            valid_feeds = (f for f in feeds if f.get("scraped_text"))
+            selected_feeds = (
+                _reservoir_sample(valid_feeds, nr_articles)
+                if nr_articles
+                else list(valid_feeds)
+            )
 
-            if not valid_feeds:
+            if not selected_feeds:
                 self.logger.warning(f"No scraped articles found for topic {topic_id}")
                 continue
 
-            selected_feeds = (
-                random.sample(valid_feeds, nr_articles)
-                if nr_articles and len(valid_feeds) > nr_articles
-                else valid_feeds
-            )
-
             for feed in selected_feeds:
                 article_tasks.append(
                     ArticleData(
@@ -169,14 +273,32 @@ class ArticleSummarizationTask(Task):
                 metrics={"topics_processed": 0},
             )
 
-        # Process articles
-        self.logger.info(f"Generating summaries for {len(article_tasks)} articles")
-        summarization_results = await self._process_articles(
-            article_tasks, llm, semaphore, max_length
+        # Process articles, one representative per group of identical texts
+        groups = _group_duplicates(article_tasks)
+        self.logger.info(
+            f"Generating summaries for {len(groups)} unique articles "
+            f"({len(article_tasks) - len(groups)} duplicates)"
+        )
+        unique_results = await self._process_articles(
+            [group[0] for group in groups], llm, semaphore, max_length, batch_size
         )
 
+        # Fan results out to the duplicates, token usage is only counted once
+        summarization_results: List[ProcessingResult] = []
+        for group, result in zip(groups, unique_results, strict=True):
+            summarization_results.append(result)
+            summarization_results.extend(
+                replace(
+                    result,
+                    feed_id=task.feed_id,
+                    topic_id=task.topic_id,
+                    usage_metadata={},
+                )
+                for task in group[1:]
+            )
+
         # Process results
-        summaries_by_topic: Dict[str, List[Tuple[str, AIMessage]]] = {}
+        summaries_by_topic: Dict[str, List[Tuple[str, ArticleSummary]]] = {}
         successful_summaries = [
             r for r in summarization_results if r.success and r.content
         ]
@@ -186,7 +308,7 @@ class ArticleSummarizationTask(Task):
             if result.topic_id not in summaries_by_topic:
                 summaries_by_topic[result.topic_id] = []
             summaries_by_topic[result.topic_id].append(
-                (result.feed_id, AIMessage(content=result.content))
+                (result.feed_id, ArticleSummary(result.content))
             )
 
         # Update database
@@ -199,36 +321,33 @@ class ArticleSummarizationTask(Task):
 
         self.logger.info(f"Successfully processed {len(successful_summaries)} articles")
 
-        # Calculate metrics
+        # Calculate metrics in a single pass over the results
+        failed = sum_input_tokens = sum_output_tokens = sum_total_tokens = 0
+        input_tokens: List[int] = []
+        output_tokens: List[int] = []
+        for r in summarization_results:
+            if not r.success:
+                failed += 1
+                continue
+            usage = r.usage_metadata or {}
+            n_input = usage.get("input_tokens", 0)
+            n_output = usage.get("output_tokens", 0)
+            sum_input_tokens += n_input
+            sum_output_tokens += n_output
+            sum_total_tokens += usage.get("total_tokens", 0)
+            input_tokens.append(n_input)
+            output_tokens.append(n_output)
+
         metrics = {
             "articles_processed": len(article_tasks),
             "summaries_generated": len(successful_summaries),
-            "failed": len([r for r in summarization_results if not r.success]),
-            "sum_input_tokens": sum(
-                r.usage_metadata.get("input_tokens", 0)
-                for r in summarization_results
-                if r.success
-            ),
-            "sum_output_tokens": sum(
-                r.usage_metadata.get("output_tokens", 0)
-                for r in summarization_results
-                if r.success
-            ),
-            "sum_total_tokens": sum(
-                r.usage_metadata.get("total_tokens", 0)
-                for r in summarization_results
-                if r.success
-            ),
-            "input_tokens": [
-                r.usage_metadata.get("input_tokens", 0)
-                for r in summarization_results
-                if r.success
-            ],
-            "output_tokens": [
-                r.usage_metadata.get("output_tokens", 0)
-                for r in summarization_results
-                if r.success
-            ],
+            "duplicates_skipped": len(article_tasks) - len(groups),
+            "failed": failed,
+            "sum_input_tokens": sum_input_tokens,
+            "sum_output_tokens": sum_output_tokens,
+            "sum_total_tokens": sum_total_tokens,
+            "input_tokens": input_tokens,
+            "output_tokens": output_tokens,
         }
 
         return TaskResult(
@@ -245,8 +364,9 @@ class ArticleSummarizationTask(Task):
         llm: LLM,
         semaphore: asyncio.Semaphore,
         max_length: Optional[int] = None,
+        batch_size: int = DEFAULT_BATCH_SIZE,
     ) -> List[ProcessingResult]:
-        """Process article tasks concurrently."""
+        """Process article tasks concurrently, batch_size articles per request."""
 
         async def summarize_with_semaphore(task: ArticleData) -> ProcessingResult:
             async with semaphore:
@@ -283,26 +403,118 @@ class ArticleSummarizationTask(Task):
                         success=False,
                     )
 
-        coroutines = [summarize_with_semaphore(task) for task in tasks]
+        if batch_size <= 1:
+            coroutines = [summarize_with_semaphore(task) for task in tasks]
+
+            results = await track_async_progress(
+                coroutines=coroutines,
+                desc="Summarizing articles",
+                logger=self.logger,
+                unit="articles",
+                update_interval=self.progress_update_interval,
+            )
+
+            return results
 
-        results = await track_async_progress(
-            coroutines=coroutines,
-            desc="Summarizing articles",
+        async def summarize_batch(batch: List[ArticleData]) -> List[ProcessingResult]:
+            async with semaphore:
+                try:
+                    return await self._batch_summarize(batch, llm, max_length)
+                except Exception as e:
+                    self.logger.warning(
+                        f"Batch summarization failed, summarizing {len(batch)} "
+                        f"articles one by one: {str(e)}"
+                    )
+            # Outside the semaphore, the single-article calls acquire it themselves
+            return await asyncio.gather(
+                *(summarize_with_semaphore(task) for task in batch)
+            )
+
+        batches = [
+            tasks[start : start + batch_size]
+            for start in range(0, len(tasks), batch_size)
+        ]
+        batch_results = await track_async_progress(
+            coroutines=[summarize_batch(batch) for batch in batches],
+            desc="Summarizing article batches",
             logger=self.logger,
-            unit="articles",
+            unit="batches",
+            update_interval=self.progress_update_interval,
         )
 
-        return results
+        return [result for results in batch_results for result in results]
+
+    async def _batch_summarize(
+        self,
+        batch: List[ArticleData],
+        llm: LLM,
+        max_length: Optional[int] = None,
+    ) -> List[ProcessingResult]:
+        """Summarize several articles with a single LLM request.
+
+        The system prompt is sent once for the whole batch. Token usage of the
+        request is attributed to the first article of the batch.
+
+        Raises:
+            ValueError: If the response does not hold one summary per article
+        """
+        sections = "\n\n".join(
+            ARTICLE_BATCH_SECTION.format(
+                number=number, article=self._truncate(task.text, max_length)
+            )
+            for number, task in enumerate(batch, 1)
+        )
+        prompts = llm.prepare_prompts(
+            system=ARTICLE_SUMMARY_SYSTEM,
+            human=ARTICLE_BATCH_SUMMARY_USER.format(
+                count=len(batch), articles=sections
+            ),
+        )
+        response = await self._generate(llm, prompts, len(sections))
+
+        summaries = _parse_batch_summaries(response.content, len(batch))
+        if summaries is None:
+            raise ValueError(f"Expected {len(batch)} summaries in batched response")
+
+        return [
+            ProcessingResult(
+                feed_id=task.feed_id,
+                topic_id=task.topic_id,
+                content=summary,
+                response_metadata=response.response_metadata,
+                usage_metadata=(response.usage_metadata or {}) if i == 0 else {},
+            )
+            for i, (task, summary) in enumerate(zip(batch, summaries, strict=True))
+        ]
 
     async def _generate_article_summary(
         self, article_text: str, llm: LLM, max_length: Optional[int] = None
     ) -> AIMessage:
         """Generate summary for single article."""
-        if max_length:
-            article_text = article_text[:max_length]
+        article_text = self._truncate(article_text, max_length)
 
         prompts = llm.prepare_prompts(
             system=ARTICLE_SUMMARY_SYSTEM,
-            human=ARTICLE_SUMMARY_USER.format(article=article_text),
+            human=_ARTICLE_USER_PREFIX + article_text + _ARTICLE_USER_SUFFIX,
         )
-        return await llm.generate_async(prompts=prompts)
+        return await self._generate(llm, prompts, len(article_text))
+
+    def _truncate(self, article_text: str, max_length: Optional[int] = None) -> str:
+        """Apply the character limit and then the token limit to article text."""
+        if max_length:
+            article_text = article_text[:max_length]
+        if self.max_input_tokens:
+            article_text = truncate_to_tokens(article_text, self.max_input_tokens)
+        return article_text
+
+    async def _generate(self, llm: LLM, prompts: Any, text_length: int) -> AIMessage:
+        """Send prompts within the rate limits, retrying transient errors with backoff.
+
+        Token usage is estimated from the text length (CHARS_PER_TOKEN).
+        """
+        async for attempt in transient_error_retrying():
+            with attempt:
+                if self.rate_limiter:
+                    await self.rate_limiter.acquire(text_length // CHARS_PER_TOKEN)
+                response = await llm.generate_async(prompts=prompts)
+        return response
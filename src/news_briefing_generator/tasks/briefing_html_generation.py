@@ -1,16 +1,59 @@
+import asyncio
+import os
 from datetime import datetime
-from typing import Optional
-
-from jinja2 import Template
+from functools import lru_cache
+from typing import TYPE_CHECKING, Dict, List, Optional
 
 from news_briefing_generator.model.task.base import Task, TaskContext
 from news_briefing_generator.model.task.result import NO_DATA_WARNING, TaskResult
-from news_briefing_generator.utils.database_ops import get_topics_for_briefing
+from news_briefing_generator.utils.database_ops import (
+    count_topics_for_briefing,
+    get_topics_for_briefing,
+)
 from news_briefing_generator.utils.datetime_ops import (
     get_utc_now_formatted,
     get_utc_now_simple,
 )
 
+if TYPE_CHECKING:
+    from jinja2 import Environment, Template
+
+
+@lru_cache(maxsize=1)
+def _template_env() -> "Environment":
+    """Jinja2 environment, imported on first render to keep CLI startup fast."""
+    from jinja2 import Environment
+
+    # Feed titles and links are untrusted, so template values are HTML-escaped
+    return Environment(
+        autoescape=True, trim_blocks=True, lstrip_blocks=True, auto_reload=False
+    )
+
+
+@lru_cache(maxsize=8)
+def _compile_template(source: str) -> "Template":
+    """Compile a briefing template once per distinct template string."""
+    return _template_env().from_string(source)
+
+
+def _render_to_file(template: "Template", data: dict, output_path: str) -> None:
+    """Render a template into a file without building the whole page first.
+
+    The page is written to a temporary file that replaces output_path once
+    complete, so readers never see a partially written briefing.
+    """
+    tmp_path = f"{output_path}.tmp"
+    try:
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            template.stream(**data).dump(f)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, output_path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+
 
 class BriefingHtmlGenerationTask(Task):
     """Implementation of rendering task.
@@ -65,9 +108,12 @@ class BriefingHtmlGenerationTask(Task):
         """Render HTML briefing from topics and summaries."""
         db = self.context.db
 
-        # Get briefing and topics
-        briefing_id, topics = get_topics_for_briefing(db, briefing_id)
-        if not topics:
+        # Get briefing and the topics worth rendering, skipped ones stay in the db
+        briefing_id, topics = get_topics_for_briefing(
+            db, briefing_id, exclude_error_summaries=True
+        )
+        total_topics = count_topics_for_briefing(db, briefing_id)
+        if not total_topics:
             warning_msg = f"{NO_DATA_WARNING}No topics found for briefing {briefing_id}"
             self.logger.warning(warning_msg)
             return TaskResult(
@@ -87,52 +133,42 @@ class BriefingHtmlGenerationTask(Task):
             formatted_date = briefing_id
             self.logger.warning(f"Could not parse briefing ID as date: {briefing_id}")
 
-        # Fetch related articles for each topic
-        topics_with_articles = []
-        skipped_topics = 0
-
-        for topic in topics:
-            topic_id = topic[0]
-            topic_summary = topic[3] if len(topic) > 2 else "No summary available."
-
-            # Skip topics with no summary (when no fetched article content was found)
-            if not topic_summary:
-                self.logger.warning(f"Skipping topic {topic_id} with no summary")
-                skipped_topics += 1
-                continue
+        # Topics without summary (no fetched article content) or with an error
+        # summary (no coherent topic) were filtered out by the query
+        skipped_topics = total_topics - len(topics)
 
-            # Skip topics with error summaries (when no coherent topic was determined)
-            if "<ERROR> Cannot determine coherent topic. <ERROR>" in topic_summary:
-                self.logger.warning(
-                    f"Skipping topic {topic_id} due to incoherent content error"
-                )
-                skipped_topics += 1
-                continue
-
-            articles = db.run_query(
+        # Fetch related articles for all rendered topics with a single query
+        articles_by_topic: Dict[str, List[dict]] = {t[0]: [] for t in topics}
+        if articles_by_topic:
+            placeholders = ",".join("?" * len(articles_by_topic))
+            rows = db.run_query(
                 f"""
-                SELECT f.source, f.title, tf.used_for_summarization, f.link
+                SELECT tf.topic_id, f.source, f.title, tf.used_for_summarization, f.link
                 FROM feeds f
                 JOIN topic_feeds tf ON f.id = tf.feed_id
-                WHERE tf.topic_id = '{topic_id}'
+                WHERE tf.topic_id IN ({placeholders})
                 ORDER BY f.published DESC
-            """
-            )
-            topics_with_articles.append(
-                {
-                    "title": topic[1],
-                    "summary": topic[3] if len(topic) > 2 else "No summary available.",
-                    "articles": [
-                        {
-                            "source": article[0],
-                            "title": article[1],
-                            "used_for_summarization": bool(article[2]),
-                            "link": article[3],
-                        }
-                        for article in articles
-                    ],
-                }
+            """,
+                tuple(articles_by_topic),
             )
+            for topic_id, source, title, used_for_summarization, link in rows:
+                articles_by_topic[topic_id].append(
+                    {
+                        "source": source,
+                        "title": title,
+                        "used_for_summarization": bool(used_for_summarization),
+                        "link": link,
+                    }
+                )
+
+        topics_with_articles = [
+            {
+                "title": topic[1],
+                "summary": topic[3] if len(topic) > 2 else "No summary available.",
+                "articles": articles_by_topic[topic[0]],
+            }
+            for topic in topics
+        ]
 
         # Add warning if topics were skipped
         if skipped_topics > 0:
@@ -146,14 +182,13 @@ class BriefingHtmlGenerationTask(Task):
             "topics": topics_with_articles,
         }
 
-        # Render HTML
-        template = Template(template_string or self._get_default_template())
-        html = template.render(**template_data)
-
-        # Save to file
+        # Render HTML straight into the file, in a worker thread to keep the
+        # event loop free
+        template = _compile_template(template_string or _DEFAULT_TEMPLATE)
         try:
-            with open(output_path, "w", encoding="utf-8") as f:
-                f.write(html)
+            await asyncio.to_thread(
+                _render_to_file, template, template_data, output_path
+            )
             self.logger.info("=" * 50)
             self.logger.info(f"Briefing HTML saved to {output_path}")
             self.logger.info("=" * 50)
@@ -165,17 +200,17 @@ class BriefingHtmlGenerationTask(Task):
             task_name=self.name,
             success=True,
             created_at=get_utc_now_formatted(),
-            metrics={"topics_rendered": len(topics), "topics_skipped": skipped_topics},
+            metrics={"topics_rendered": total_topics, "topics_skipped": skipped_topics},
             data={
                 "briefing_id": briefing_id,
                 "output_path": output_path,
-                "topics_count": len(topics),
+                "topics_count": total_topics,
             },
         )
 
-    def _get_default_template(self) -> str:
-        """Get default HTML template."""
-        return """<!DOCTYPE html>
+
+# Default HTML template, used when no template_string parameter is set
+_DEFAULT_TEMPLATE = """<!DOCTYPE html>
         <html>
         <head>
             <title>News Briefing {{ date }}</title>
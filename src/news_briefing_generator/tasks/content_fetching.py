@@ -1,26 +1,55 @@
 import asyncio
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import nullcontext
 from dataclasses import dataclass
-from typing import Any, Dict, List, Optional
+from datetime import datetime, timedelta, timezone
+from typing import Any, AsyncIterator, Dict, List, Optional
 from urllib.parse import urlparse
 from urllib.robotparser import RobotFileParser
 
 import aiohttp
 import requests
-from bs4 import BeautifulSoup
 
+from news_briefing_generator.db.schema import ROBOTS_CACHE_COLUMNS, TABLE_ROBOTS_CACHE
 from news_briefing_generator.model.task.base import Task, TaskContext
 from news_briefing_generator.model.task.result import NO_DATA_WARNING, TaskResult
+from news_briefing_generator.preprocessing.parsing import (
+    HtmlTextStream,
+    html_bytes_to_text,
+)
 from news_briefing_generator.utils.async_progress import track_async_progress
 from news_briefing_generator.utils.database_ops import (
     get_feeds_for_topics,
     get_topics_for_briefing,
 )
 from news_briefing_generator.utils.datetime_ops import get_utc_now_formatted
+from news_briefing_generator.utils.process_pool import create_process_pool
+
+# Bytes read from a response body at a time
+_READ_CHUNK_SIZE = 64 * 1024
+
+
+class _HostThrottle:
+    """Spaces out requests to the same host, other hosts don't wait on it."""
+
+    def __init__(self) -> None:
+        self._locks: Dict[str, asyncio.Lock] = defaultdict(asyncio.Lock)
+        self._next_request: Dict[str, float] = {}
+
+    async def wait(self, host: str, delay: float) -> None:
+        """Wait for the host's turn, the next request may go delay seconds later."""
+        loop = asyncio.get_running_loop()
+        async with self._locks[host]:
+            wait = self._next_request.get(host, 0.0) - loop.time()
+            if wait > 0:
+                await asyncio.sleep(wait)
+            self._next_request[host] = loop.time() + delay
 
 
 @dataclass
 class ScrapedContent:
-    """Container for scraped content and metadata."""
+    """Container for scraped content (as plain text) and metadata."""
 
     url: str
     content: str
@@ -39,14 +68,24 @@ class ContentFetchingTask(Task):
     Attributes:
     DEFAULT_TIMEOUT (int): Default request timeout in seconds (30)
     DEFAULT_MAX_CONCURRENT (int): Default maximum concurrent requests (5)
-    DEFAULT_RATE_LIMIT (float): Default delay between requests in seconds (0.5)
+    DEFAULT_RATE_LIMIT (float): Default delay between requests to the same host in
+        seconds (0.5), a longer robots.txt Crawl-delay takes precedence
+    MAX_CRAWL_DELAY (float): Upper bound for robots.txt Crawl-delay values (10)
     DEFAULT_CHECK_ROBOTS_TXT (bool): Default setting for robots.txt compliance (True)
+    DEFAULT_ROBOTS_CACHE_TTL (float): Hours a stored robots.txt is reused (24)
+    DEFAULT_MAX_BYTES (int): Bytes read per page, the rest is dropped (2 MiB)
+    PARALLEL_PARSE_MIN_URLS (int): URLs needed before pages are parsed in a
+        process pool, below this the pool startup costs more than it saves
     """
 
     DEFAULT_TIMEOUT: int = 30
     DEFAULT_MAX_CONCURRENT: int = 5
     DEFAULT_RATE_LIMIT: float = 0.5
     DEFAULT_CHECK_ROBOTS_TXT: bool = True
+    DEFAULT_ROBOTS_CACHE_TTL: float = 24
+    DEFAULT_MAX_BYTES: Optional[int] = 2 * 1024 * 1024
+    MAX_CRAWL_DELAY: float = 10
+    PARALLEL_PARSE_MIN_URLS: int = 16
 
     def __init__(self, context: TaskContext):
         super().__init__(context)
@@ -116,8 +155,8 @@ class ContentFetchingTask(Task):
                 metrics={"total_urls": 0, "successful_fetches": 0},
             )
 
-        # 3. Collect URLs and fetch content
-        urls = [feed["link"] for feed in all_feeds]
+        # 3. Collect URLs and fetch content, feeds in several topics share a fetch
+        urls = list(dict.fromkeys(feed["link"] for feed in all_feeds))
         params = self._resolve_fetch_params()
 
         self.logger.info(f"Attempting to fetch {len(urls)} URLs")
@@ -128,7 +167,8 @@ class ContentFetchingTask(Task):
         self.logger.info(f"Successfully fetched {successful_fetches}/{len(urls)} URLs")
 
         # 4. Write fetched content back to feeds table
-        updates = [(text, feed["id"]) for feed, text in zip(all_feeds, scraped_results)]
+        text_by_url = dict(zip(urls, scraped_results, strict=True))
+        updates = [(text_by_url[feed["link"]], feed["id"]) for feed in all_feeds]
         db.update_many(
             table="feeds",
             columns=["scraped_text"],
@@ -156,48 +196,70 @@ class ContentFetchingTask(Task):
         timeout: int,
         user_agent: Optional[str] = None,
         check_robots_txt: bool = True,
+        robots_cache_ttl: float = DEFAULT_ROBOTS_CACHE_TTL,
+        max_bytes: Optional[int] = DEFAULT_MAX_BYTES,
     ) -> List[str]:
         """Asynchronously scrape a list of URLs."""
         sem = asyncio.Semaphore(max_concurrent)
         fetched_contents: List[str] = []
-        robots_cache: Dict[str, bool] = {}
+        # One robots.txt lookup per domain, shared by all of its URLs
+        robots_cache: Dict[str, asyncio.Future] = {}
+        throttle = _HostThrottle()
         requests_session = self._setup_requests_session()
+        client_timeout = aiohttp.ClientTimeout(total=timeout)
+        # Parsing is CPU-bound, large runs spread it across cores
+        pool_context = (
+            create_process_pool()
+            if len(urls) >= self.PARALLEL_PARSE_MIN_URLS
+            else nullcontext()
+        )
 
-        async with aiohttp.ClientSession(
-            timeout=aiohttp.ClientTimeout(total=timeout)
-        ) as session:
-
-            async def rate_limited_fetch(url: str) -> Optional[str]:
-                try:
+        async def rate_limited_fetch(
+            session: aiohttp.ClientSession,
+            pool: Optional[ProcessPoolExecutor],
+            url: str,
+        ) -> Optional[str]:
+            try:
+                domain = urlparse(url).netloc
+                delay = rate_limit
+                if check_robots_txt:
+                    if domain not in robots_cache:
+                        robots_cache[domain] = asyncio.ensure_future(
+                            self._get_robots_parser(
+                                session, url, robots_cache_ttl, client_timeout
+                            )
+                        )
                     async with sem:
-                        if check_robots_txt:
-                            domain = urlparse(url).netloc
-                            if domain not in robots_cache:
-                                robots_cache[domain] = await self._check_robots_txt(
-                                    session, url, user_agent
-                                )
-                            if not robots_cache[domain]:
-                                self.logger.warning(
-                                    f"Skipping {url}: not allowed by robots.txt"
-                                )
-                                return None
-
-                        await asyncio.sleep(rate_limit)
-                        result = await self._fetch_page(session, requests_session, url)
-                        if result:
-                            return BeautifulSoup(
-                                result.content, "html.parser"
-                            ).get_text()
-                        return None
-                except Exception as e:
-                    self.logger.error(f"Error fetching {url}: {str(e)}")
-                    return None
-
-            # Create tasks
-            tasks = [rate_limited_fetch(url) for url in urls]
-            fetched_contents = await track_async_progress(
-                tasks, desc="Fetching content", logger=self.logger
-            )
+                        parser = await robots_cache[domain]
+                    if parser:
+                        agent = user_agent or "*"
+                        if not parser.can_fetch(agent, url):
+                            self.logger.warning(
+                                f"Skipping {url}: not allowed by robots.txt"
+                            )
+                            return None
+                        crawl_delay = float(parser.crawl_delay(agent) or 0)
+                        delay = max(delay, min(crawl_delay, self.MAX_CRAWL_DELAY))
+
+                # Waiting for the host's turn doesn't hold a fetch slot
+                await throttle.wait(domain, delay)
+                async with sem:
+                    result = await self._fetch_page(
+                        session, requests_session, url, client_timeout, pool, max_bytes
+                    )
+                if result:
+                    return result.content
+                return None
+            except Exception as e:
+                self.logger.error(f"Error fetching {url}: {str(e)}")
+                return None
+
+        with pool_context as pool:
+            async with self.context.http_session() as session:
+                tasks = [rate_limited_fetch(session, pool, url) for url in urls]
+                fetched_contents = await track_async_progress(
+                    tasks, desc="Fetching content", logger=self.logger
+                )
 
         return fetched_contents
 
@@ -206,16 +268,37 @@ class ContentFetchingTask(Task):
         session: aiohttp.ClientSession,
         requests_session: requests.Session,
         url: str,
+        timeout: aiohttp.ClientTimeout,
+        pool: Optional[ProcessPoolExecutor] = None,
+        max_bytes: Optional[int] = DEFAULT_MAX_BYTES,
     ) -> Optional[ScrapedContent]:
-        """Fetch single page with error handling."""
+        """Fetch single page with error handling.
+
+        With a process pool the page is read whole and parsed by a worker,
+        otherwise it is parsed while streaming in a worker thread. Either way
+        at most max_bytes of the body are read.
+        """
         try:
             kwargs: Dict = dict(
                 headers=requests_session.headers,
                 cookies=requests_session.cookies.get_dict(),
+                timeout=timeout,
             )
             async with session.get(url, **kwargs) as response:
                 if response.status == 200:
-                    content = await response.text()
+                    chunks = self._iter_body(response, max_bytes)
+                    if pool is not None:
+                        body = b"".join([chunk async for chunk in chunks])
+                        content = await asyncio.get_running_loop().run_in_executor(
+                            pool, html_bytes_to_text, body, response.charset
+                        )
+                    else:
+                        # Convert while streaming, parsing runs in a worker thread
+                        # so it doesn't block the other fetches on the event loop
+                        stream = HtmlTextStream(response.charset)
+                        async for chunk in chunks:
+                            await asyncio.to_thread(stream.feed, chunk)
+                        content = await asyncio.to_thread(stream.close)
                     return ScrapedContent(
                         url=url,
                         content=content,
@@ -227,25 +310,76 @@ class ContentFetchingTask(Task):
             self.logger.error(f"Error fetching {url}: {str(e)}")
         return None
 
-    async def _check_robots_txt(
-        self, session: aiohttp.ClientSession, url: str, user_agent: str
-    ) -> bool:
-        """Check if URL is allowed by robots.txt."""
-        try:
-            parsed_url = urlparse(url)
-            domain = f"{parsed_url.scheme}://{parsed_url.netloc}"
-            robots_url = f"{domain}/robots.txt"
+    @staticmethod
+    async def _iter_body(
+        response: aiohttp.ClientResponse, max_bytes: Optional[int]
+    ) -> AsyncIterator[bytes]:
+        """Yield the response body in chunks, stopping after max_bytes.
+
+        Stopping early leaves the rest unread, aiohttp then closes the
+        connection instead of downloading an oversized page.
+        """
+        remaining = max_bytes
+        async for chunk in response.content.iter_chunked(_READ_CHUNK_SIZE):
+            if remaining is not None:
+                chunk = chunk[:remaining]
+                remaining -= len(chunk)
+            yield chunk
+            if remaining is not None and remaining <= 0:
+                break
+
+    async def _get_robots_parser(
+        self,
+        session: aiohttp.ClientSession,
+        url: str,
+        ttl: Optional[float],
+        timeout: aiohttp.ClientTimeout,
+    ) -> Optional[RobotFileParser]:
+        """Get the robots.txt rules for the URL's domain, None if all is allowed.
+
+        A robots.txt stored within the last ttl hours is reused, otherwise it is
+        fetched and stored. Missing robots.txt files (4xx) are stored as well,
+        so later runs skip the request for them too.
+        """
+        parsed_url = urlparse(url)
+        domain = parsed_url.netloc
+
+        where, params = "domain = ?", (domain,)
+        if ttl is not None:
+            # fetched_at uses the fixed-width UTC format, so strings compare in order
+            cutoff = datetime.now(timezone.utc) - timedelta(hours=ttl)
+            where += " AND fetched_at >= ?"
+            params += (cutoff.strftime("%Y-%m-%d %H:%M:%S%z"),)
+        rows = self.context.db.select(
+            table=TABLE_ROBOTS_CACHE, columns=["body"], where=where, params=params
+        )
+        if rows:
+            body = rows[0][0]
+        else:
+            try:
+                robots_url = f"{parsed_url.scheme}://{domain}/robots.txt"
+                async with session.get(robots_url, timeout=timeout) as response:
+                    if response.status == 200:
+                        body = await response.text()
+                    elif 400 <= response.status < 500:
+                        body = None  # If no robots.txt, assume allowed
+                    else:
+                        return None  # Server errors aren't stored, retry next run
+            except Exception as e:
+                self.logger.warning(f"Error checking robots.txt for {url}: {e}")
+                return None
+            self.context.db.insert(
+                table=TABLE_ROBOTS_CACHE,
+                columns=ROBOTS_CACHE_COLUMNS,
+                values=(domain, body, get_utc_now_formatted()),
+                replace=True,
+            )
 
-            async with session.get(robots_url) as response:
-                if response.status == 200:
-                    robots_content = await response.text()
-                    parser = RobotFileParser()
-                    parser.parse(robots_content.splitlines())
-                    return parser.can_fetch(user_agent, url)
-                return True  # If no robots.txt, assume allowed
-        except Exception as e:
-            self.logger.warning(f"Error checking robots.txt for {url}: {e}")
-            return True
+        if body is None:
+            return None
+        parser = RobotFileParser()
+        parser.parse(body.splitlines())
+        return parser
 
     def _resolve_fetch_params(self) -> Dict[str, Any]:
         """Resolve parameters for content fetching from config sources."""
@@ -254,6 +388,12 @@ class ContentFetchingTask(Task):
             "check_robots_txt": self.get_parameter(
                 "check_robots_txt", default=self.DEFAULT_CHECK_ROBOTS_TXT
             ),
+            "robots_cache_ttl": self.get_parameter(
+                "robots_cache_ttl", default=self.DEFAULT_ROBOTS_CACHE_TTL
+            ),
+            "max_bytes": self.get_parameter(
+                "max_bytes", default=self.DEFAULT_MAX_BYTES
+            ),
             "timeout": self.get_parameter("timeout", default=self.DEFAULT_TIMEOUT),
             "max_concurrent": self.get_parameter(
                 "max_concurrent", default=self.DEFAULT_MAX_CONCURRENT
@@ -1,5 +1,5 @@
 import asyncio
-from typing import List
+from typing import List, Optional, Tuple
 
 import aiohttp
 import feedparser
@@ -9,6 +9,34 @@ from news_briefing_generator.model.task.base import Task, TaskContext
 from news_briefing_generator.model.task.result import TaskResult
 from news_briefing_generator.utils.async_progress import track_async_progress
 from news_briefing_generator.utils.datetime_ops import get_utc_now_formatted
+from news_briefing_generator.utils.process_pool import create_process_pool
+
+
+def _parse_feed(
+    text: str, feed_url: str, source: Optional[str]
+) -> Tuple[str, List[FeedItem]]:
+    """Parse a fetched feed document into feed items.
+
+    Module-level and free of task state so it can run in a worker process.
+
+    Args:
+        text: Raw RSS/ATOM document
+        feed_url: URL the document was fetched from
+        source: Configured source name, None to use the feed title
+
+    Returns:
+        Tuple of the source name and the parsed feed items
+    """
+    feed = feedparser.parse(text)
+    if source is None:
+        source = feed.feed.get("title", feed_url)
+    fetched_at = get_utc_now_formatted()
+    items = []
+    for entry in feed.entries:
+        feed_item = FeedItem.from_entry(entry, source, feed_url, fetched_at)
+        if feed_item is not None:
+            items.append(feed_item)
+    return source, items
 
 
 class FeedCollectionTask(Task):
@@ -20,10 +48,13 @@ class FeedCollectionTask(Task):
     Attributes:
         DEFAULT_TIMEOUT: Default timeout for feed requests in seconds
         DEFAULT_USER_AGENT: Default user agent string for requests
+        PARALLEL_PARSE_MIN_FEEDS: Fetched feeds needed before parsing moves to
+            a process pool, below this the pool startup costs more than it saves
     """
 
     DEFAULT_TIMEOUT: int = 15
     DEFAULT_USER_AGENT: str = "Mozilla/5.0"
+    PARALLEL_PARSE_MIN_FEEDS: int = 16
 
     def __init__(self, context: TaskContext):
         super().__init__(context)
@@ -54,7 +85,10 @@ class FeedCollectionTask(Task):
         """
         try:
             # Get feed URLs from config
-            feed_urls = [feed["url"] for feed in self.context.conf.get("feeds")]
+            # A feed listed twice is fetched once
+            feed_urls = list(
+                dict.fromkeys(feed["url"] for feed in self.context.conf.get("feeds"))
+            )
             self.logger.info(f"Starting feed collection for {len(feed_urls)} sources")
 
             # Get optional parameters
@@ -119,11 +153,13 @@ class FeedCollectionTask(Task):
         processed_items = set()
         collected_items = []
 
+        headers = {"User-Agent": user_agent}
+
         async def fetch_feed(session: aiohttp.ClientSession, url: str) -> tuple:
             """Fetch single feed asynchronously."""
             try:
                 async with session.get(
-                    url, timeout=aiohttp.ClientTimeout(total=timeout)
+                    url, headers=headers, timeout=aiohttp.ClientTimeout(total=timeout)
                 ) as response:
                     text = await response.text()
                     self.logger.debug(f"Successfully fetched feed from {url}")
@@ -136,8 +172,7 @@ class FeedCollectionTask(Task):
                 return (url, None)
 
         # Fetch feeds concurrently
-        headers = {"User-Agent": user_agent}
-        async with aiohttp.ClientSession(headers=headers) as session:
+        async with self.context.http_session() as session:
             tasks = [fetch_feed(session, url) for url in feed_urls]
             responses = await track_async_progress(
                 coroutines=tasks,
@@ -146,36 +181,27 @@ class FeedCollectionTask(Task):
                 unit="feeds",
             )
 
-        # Process responses
-        for feed_url, response in responses:
-            if not response:
-                continue
-
-            feed = feedparser.parse(response)
-            if not feed.entries:
-                self.logger.warning(
-                    f"No entries found for feed: {feed_url}. See feed: {feed}"
-                )
+        # Parse responses, HTML and date handling per entry is CPU-bound
+        jobs = [
+            (text, feed_url, self.context.conf.url_to_feedname.get(feed_url))
+            for feed_url, text in responses
+            if text
+        ]
+        parsed = await self._parse_feeds(jobs)
+
+        for (_, feed_url, _), (source, feed_items) in zip(jobs, parsed, strict=True):
+            if not feed_items:
+                self.logger.warning(f"No entries found for feed: {feed_url}")
                 continue
 
-            # Get source name from config or feed
-            source = self.context.conf.url_to_feedname.get(
-                feed_url, feed.feed.get("title", feed_url)
-            )
-
             # Process entries
             entries_processed = 0
-            for entry in feed.entries:
-                feed_item = FeedItem.from_entry(entry, source, feed_url)
-                if feed_item is None:
-                    continue
-
-                item = feed_item.to_tuple()
+            for feed_item in feed_items:
                 item_key = (feed_item.source, feed_item.link)
 
-                # Drop duplicates
+                # Drop duplicates before building their rows
                 if item_key not in processed_items:
-                    collected_items.append(item)
+                    collected_items.append(feed_item.to_tuple())
                     processed_items.add(item_key)
                     entries_processed += 1
 
@@ -187,3 +213,23 @@ class FeedCollectionTask(Task):
             f"Feed collection completed. Total entries: {len(collected_items)}"
         )
         return collected_items
+
+    async def _parse_feeds(
+        self, jobs: List[Tuple[str, str, Optional[str]]]
+    ) -> List[Tuple[str, List[FeedItem]]]:
+        """Parse fetched feeds, across CPU cores for large batches.
+
+        Args:
+            jobs: Tuples of (document, feed URL, configured source name)
+
+        Returns:
+            Source name and feed items per job, in job order
+        """
+        if len(jobs) < self.PARALLEL_PARSE_MIN_FEEDS:
+            return [_parse_feed(*job) for job in jobs]
+
+        loop = asyncio.get_running_loop()
+        with create_process_pool() as pool:
+            return await asyncio.gather(
+                *(loop.run_in_executor(pool, _parse_feed, *job) for job in jobs)
+            )
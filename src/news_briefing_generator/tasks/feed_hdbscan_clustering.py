@@ -1,3 +1,4 @@
+import numpy as np
 import pandas as pd
 
 from news_briefing_generator.clustering.hdbscan import HDBSCAN
@@ -8,7 +9,7 @@ from news_briefing_generator.db.schema import (
     TABLE_TOPICS,
 )
 from news_briefing_generator.db.sqlite import DatabaseManager
-from news_briefing_generator.embedding.huggingface import HFEmbeddings
+from news_briefing_generator.embedding.huggingface import get_hf_embeddings
 from news_briefing_generator.model.task.base import Task, TaskContext
 from news_briefing_generator.model.task.result import NO_DATA_WARNING, TaskResult
 from news_briefing_generator.utils.datetime_ops import (
@@ -32,6 +33,8 @@ class FeedHdbscanClusteringTask(Task):
         DEFAULT_HDBSCAN_MIN_SAMPLES: Default min_samples for HDBSCAN
         DEFAULT_HDBSCAN_MIN_CLUSTER_SIZE: Default min_cluster_size for HDBSCAN
         DEFAULT_HDBSCAN_CLUSTER_SELECTION_EPSILON: Default cluster_selection_epsilon for HDBSCAN
+        DEFAULT_NORMALIZE_EMBEDDINGS: Whether to L2-normalize embeddings before clustering
+        DEFAULT_HDBSCAN_BACKEND: HDBSCAN implementation ("cpu" or "gpu" via cuML)
     """
 
     DEFAULT_TIME_WINDOW: int = 24
@@ -39,6 +42,8 @@ class FeedHdbscanClusteringTask(Task):
     DEFAULT_HDBSCAN_MIN_SAMPLES: int = 2
     DEFAULT_HDBSCAN_MIN_CLUSTER_SIZE: int = 2
     DEFAULT_HDBSCAN_CLUSTER_SELECTION_EPSILON: float = 0.1
+    DEFAULT_NORMALIZE_EMBEDDINGS: bool = False
+    DEFAULT_HDBSCAN_BACKEND: str = "cpu"
 
     def __init__(self, context: TaskContext):
         super().__init__(context)
@@ -99,12 +104,13 @@ class FeedHdbscanClusteringTask(Task):
             TaskResult with clustering results and metrics
         """
         # Read recent feeds from database
-        data = db.select(
+        rows = db.select_iter(
             table=TABLE_FEEDS,
             columns=FEED_COLUMNS,
-            condition=f"published >= datetime('now', '-{time_window} hours')",
+            where="published >= datetime('now', ?)",
+            params=(f"-{time_window} hours",),
         )
-        df = pd.DataFrame(data, columns=FEED_COLUMNS)
+        df = pd.DataFrame.from_records(rows, columns=FEED_COLUMNS)
         self.logger.info(
             f"{len(df)} feed entries found in the last {time_window} hours"
         )
@@ -120,15 +126,10 @@ class FeedHdbscanClusteringTask(Task):
                 metrics={"total_entries": 0, "clusters_created": 0},
             )
 
-        # Create embeddings
-        headlines_series = df.apply(
-            lambda row: f"{row['source']}: {row['title']}. {row['summary']}", axis=1
+        normalize_embeddings = self.get_parameter(
+            "normalize_embeddings", default=self.DEFAULT_NORMALIZE_EMBEDDINGS
         )
-        self.logger.info(f"Loading embedding model: {embedding_model}")
-        emb_model = HFEmbeddings(model_name=embedding_model)
-
-        self.logger.info("Creating embeddings")
-        embeddings = emb_model.embed(docs=headlines_series.tolist())
+        embeddings = self._get_embeddings(db, df, embedding_model, normalize_embeddings)
 
         # Run clustering
         self.logger.info("Running HDBSCAN clustering")
@@ -142,17 +143,19 @@ class FeedHdbscanClusteringTask(Task):
             "cluster_selection_epsilon",
             default=self.DEFAULT_HDBSCAN_CLUSTER_SELECTION_EPSILON,
         )
+        backend = self.get_parameter("backend", default=self.DEFAULT_HDBSCAN_BACKEND)
 
         hdbscan = HDBSCAN(
             min_samples=min_samples,
             min_cluster_size=min_cluster_size,
             cluster_selection_epsilon=cluster_selection_epsilon,
+            backend=backend,
         )
-        clusters = hdbscan.cluster(embeddings=embeddings)
+        labels = np.asarray(hdbscan.cluster(embeddings=embeddings))
+        clustered = labels != "-1"
 
         # Check if clustering failed (all points assigned to noise cluster -1)
-        unique_clusters = set(str(c) for c in clusters)
-        if unique_clusters == {"-1"}:
+        if not clustered.any():
             error_msg = (
                 "Clustering failed: No valid clusters found. "
                 "All entries were classified as noise. "
@@ -176,11 +179,15 @@ class FeedHdbscanClusteringTask(Task):
                 },
             )
 
-        # Process results
-        df["cluster"] = clusters
+        # Process results, unclustered entries are dropped and topic IDs are
+        # built for all labels at once
         current_time_str = get_utc_now_simple()
-        df["cluster"] = df["cluster"].apply(lambda x: f"{current_time_str}-{x}")
-        df = df[df.cluster != f"{current_time_str}--1"]  # Drop unclustered entries
+        df = pd.DataFrame(
+            {
+                "id": df["id"].to_numpy()[clustered],
+                "cluster": np.char.add(f"{current_time_str}-", labels[clustered]),
+            }
+        )
 
         # Store clusters in database
         self._store_clusters(db, df)
@@ -195,6 +202,54 @@ class FeedHdbscanClusteringTask(Task):
             },
         )
 
+    def _get_embeddings(
+        self,
+        db: DatabaseManager,
+        df: pd.DataFrame,
+        embedding_model: str,
+        normalize: bool,
+    ) -> np.ndarray:
+        """Get embeddings for all feed entries in df, in row order.
+
+        Vectors stored by an earlier run with the same model and normalization
+        are reused, only new entries are embedded and then stored as well.
+        """
+        embedding_key = f"{embedding_model}|normalize={normalize}"
+        cached = (df["embedding_model"] == embedding_key) & df["embedding"].notna()
+        vectors = [
+            db.load_embedding(blob) if hit else None
+            for blob, hit in zip(df["embedding"].tolist(), cached.tolist(), strict=True)
+        ]
+        missing = df[~cached]
+        self.logger.info(
+            f"Reusing {len(df) - len(missing)} stored embeddings, "
+            f"creating {len(missing)}"
+        )
+        if len(missing):
+            # astype(str) renders missing values as "None", like an f-string
+            headlines = (
+                missing["source"].astype(str)
+                + ": "
+                + missing["title"].astype(str)
+                + ". "
+                + missing["summary"].astype(str)
+            ).tolist()
+            self.logger.info(f"Loading embedding model: {embedding_model}")
+            emb_model = get_hf_embeddings(embedding_model)
+            # Normalize once at ingest, so clustering doesn't need to do it again
+            new_vectors = emb_model.embed(docs=headlines, normalize=normalize)
+            # Persist as BLOBs so the vectors can be reused without re-embedding
+            db.insert_embeddings(
+                list(zip(missing["id"].tolist(), new_vectors, strict=True)),
+                model=embedding_key,
+            )
+            # Round to the stored precision, so new and reused vectors match
+            new_vectors = new_vectors.astype(db.EMBEDDING_DTYPE).astype(np.float32)
+            positions = np.flatnonzero(~cached.to_numpy())
+            for position, vector in zip(positions, new_vectors, strict=True):
+                vectors[position] = vector
+        return np.stack(vectors)
+
     def _store_clusters(self, db: DatabaseManager, df: pd.DataFrame) -> None:
         """Store cluster assignments in database.
 
@@ -202,26 +257,21 @@ class FeedHdbscanClusteringTask(Task):
             db: Database connection
             df: DataFrame with cluster assignments
         """
-        for _, row in df.iterrows():
-            topic_id = row["cluster"]
-            feed_entry_id = row["id"]
+        # tolist() yields Python scalars, which sqlite3 can bind
+        topic_ids = df["cluster"].tolist()
+        feed_ids = df["id"].tolist()
+        generated_at = get_utc_now_formatted()
 
-            # Check if topic exists
-            topic_results = db.select(
-                table=TABLE_TOPICS, columns=["id"], condition=f"id = '{topic_id}'"
+        with db.transaction():
+            # Topics that already exist are kept as they are (INSERT OR IGNORE)
+            db.insert_many(
+                table=TABLE_TOPICS,
+                columns=["id", "generated_at"],
+                values=[(topic_id, generated_at) for topic_id in set(topic_ids)],
             )
-
-            if not topic_results:
-                # Create new topic
-                db.insert(
-                    table=TABLE_TOPICS,
-                    columns=["id", "generated_at"],
-                    values=(topic_id, get_utc_now_formatted()),
-                )
-
-            # Link feed to topic
-            db.insert(
+            # Link feeds to topics
+            db.insert_many(
                 table=TABLE_TOPIC_FEEDS,
                 columns=["topic_id", "feed_id"],
-                values=(topic_id, feed_entry_id),
+                values=list(zip(topic_ids, feed_ids, strict=True)),
             )
@@ -1,7 +1,5 @@
 from typing import Any, Dict, List
 
-import typer
-
 from news_briefing_generator.db.sqlite import DatabaseManager
 from news_briefing_generator.llm.base import LLM
 from news_briefing_generator.model.task.base import Task, TaskContext
@@ -309,18 +307,22 @@ class TopicSelectionTask(Task):
         Returns:
             str: "accepted", "rejected", or "re-run"
         """
-        typer.echo(f"\nReview output for task: {self.name}")
-        typer.echo("\nMetrics:")
-        for key, value in result.metrics.items():
-            typer.echo(f"  {key}: {value}")
-        typer.echo(f"\nWarnings: {result.warning or 'None'}")
+        # Interactive only, headless runs never import the CLI toolkit
+        import typer
+
+        lines = [f"\nReview output for task: {self.name}", "\nMetrics:"]
+        lines.extend(f"  {key}: {value}" for key, value in result.metrics.items())
+        lines.append(f"\nWarnings: {result.warning or 'None'}")
+        typer.echo("\n".join(lines))
 
         while True:
-            typer.echo("\nOptions:")
-            typer.echo("1. Approve current selection")
-            typer.echo("2. Re-run with different parameters")
-            typer.echo("3. Manually select topics")
-            typer.echo("4. Reject")
+            typer.echo(
+                "\nOptions:\n"
+                "1. Approve current selection\n"
+                "2. Re-run with different parameters\n"
+                "3. Manually select topics\n"
+                "4. Reject"
+            )
 
             choice = input("\nSelect option (1-4): ").strip()
 
@@ -328,7 +330,7 @@ class TopicSelectionTask(Task):
                 return "accepted"
             elif choice == "2":
                 updated_params = self._get_updated_parameters()
-                self.context.params.update(updated_params)
+                self.context.update_params(updated_params)
                 return "re-run"
             elif choice == "3":
                 # Manually select topics and store briefing
@@ -357,14 +359,17 @@ class TopicSelectionTask(Task):
 
     def _get_manual_topic_selection(self) -> List[str]:
         """Get manual topic selection from user."""
+        import typer
+
         topics = get_most_recent_topics(self.context.db)
         topics = [Topic(*topic) for topic in topics]
 
-        typer.echo("\nAvailable topics:")
-        for i, topic in enumerate(topics, 1):
-            typer.echo(f"{i}. [{topic.id}] {topic.title}")
-
-        typer.echo("\nEnter topic index numbers to select (comma-separated):")
+        lines = ["\nAvailable topics:"]
+        lines.extend(
+            f"{i}. [{topic.id}] {topic.title}" for i, topic in enumerate(topics, 1)
+        )
+        lines.append("\nEnter topic index numbers to select (comma-separated):")
+        typer.echo("\n".join(lines))
         while True:
             try:
                 selections = input().strip()
@@ -1,3 +1,4 @@
+import asyncio
 from dataclasses import dataclass
 from typing import Dict, List, Optional
 
@@ -12,7 +13,10 @@ from news_briefing_generator.prompt.summarization.topic import (
 from news_briefing_generator.utils.async_progress import track_async_progress
 from news_briefing_generator.utils.database_ops import get_topics_for_briefing
 from news_briefing_generator.utils.datetime_ops import get_utc_now_formatted
-from news_briefing_generator.utils.text_processing import preprocess_llm_output
+from news_briefing_generator.utils.text_processing import (
+    is_error_response,
+    preprocess_llm_output,
+)
 
 
 @dataclass
@@ -80,7 +84,7 @@ class TopicSummarizationTask(Task):
         self.logger.info(f"Processing topic summaries for briefing {briefing_id}")
 
         # Prepare summary tasks
-        summary_tasks = self._prepare_summary_tasks(
+        summary_tasks = await self._prepare_summary_tasks(
             briefing_topics, summaries_per_topic
         )
         if not summary_tasks:
@@ -101,13 +105,18 @@ class TopicSummarizationTask(Task):
             metrics=self._calculate_metrics(briefing_topics, summary_tasks, aimessages),
         )
 
-    def _prepare_summary_tasks(
+    async def _prepare_summary_tasks(
         self, topics: List[tuple], summaries_per_topic: int
     ) -> List[TopicData]:
         """Prepare summary tasks from topics."""
+        # Fetch the article summaries of all topics concurrently
+        all_summaries = await asyncio.gather(
+            *(self._get_article_summaries(t[0], summaries_per_topic) for t in topics)
+        )
         tasks = []
-        for topic_id, topic_title in [(t[0], t[1]) for t in topics]:
-            summaries_text = self._get_article_summaries(topic_id, summaries_per_topic)
+        for (topic_id, topic_title), summaries_text in zip(
+            [(t[0], t[1]) for t in topics], all_summaries, strict=True
+        ):
             if summaries_text:
                 tasks.append(
                     TopicData(
@@ -120,7 +129,7 @@ class TopicSummarizationTask(Task):
                 self.logger.warning(f"No article summaries found for topic {topic_id}")
         return tasks
 
-    def _get_article_summaries(self, topic_id: str, limit: int) -> Optional[str]:
+    async def _get_article_summaries(self, topic_id: str, limit: int) -> Optional[str]:
         """Get formatted article summaries for a topic and mark used articles.
 
         Args:
@@ -130,16 +139,16 @@ class TopicSummarizationTask(Task):
         Returns:
             Formatted text of summaries or None if no summaries found
         """
-        query = f"""
+        query = """
             SELECT f.source, f.title, f.summarized_article, f.id
             FROM feeds f
             JOIN topic_feeds tf ON f.id = tf.feed_id
-            WHERE tf.topic_id = '{topic_id}'
+            WHERE tf.topic_id = ?
             AND f.summarized_article IS NOT NULL
             ORDER BY f.published DESC
-            LIMIT {limit}
+            LIMIT ?
         """
-        results = self.context.db.run_query(query)
+        results = await self.context.db.run_query_async(query, (topic_id, limit))
         if not results:
             return None
 
@@ -191,7 +200,6 @@ class TopicSummarizationTask(Task):
             task.topic_id: message for task, message in zip(tasks, messages)
         }
 
-        error_pattern = "<ERROR> Cannot determine coherent topic. <ERROR>"
         error_count = 0
 
         # Update database
@@ -200,7 +208,7 @@ class TopicSummarizationTask(Task):
             content = preprocess_llm_output(message.content)
 
             # Check for error pattern in the summary
-            if error_pattern in content:
+            if is_error_response(content):
                 self.logger.warning(
                     f"Topic {task.topic_id} ({task.topic_title}) has an incoherent content error"
                 )
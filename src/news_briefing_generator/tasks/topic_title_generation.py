@@ -1,8 +1,13 @@
-from typing import Any, Dict, List, Optional
+import asyncio
+import re
+from typing import Any, Dict, List, Optional, Tuple
 
+from news_briefing_generator.llm.base import LLM
 from news_briefing_generator.model.task.base import Task, TaskContext
 from news_briefing_generator.model.task.result import NO_DATA_WARNING, TaskResult
 from news_briefing_generator.prompt.topics.topic_titles import (
+    TOPIC_TITLE_BATCH_SECTION,
+    TOPIC_TITLE_BATCH_USER,
     TOPIC_TITLE_GENERATION_SYSTEM,
     TOPIC_TITLE_GENERATION_USER,
 )
@@ -12,7 +17,32 @@ from news_briefing_generator.utils.database_ops import (
     get_most_recent_topics,
 )
 from news_briefing_generator.utils.datetime_ops import get_utc_now_formatted
-from news_briefing_generator.utils.text_processing import preprocess_llm_output
+from news_briefing_generator.utils.text_processing import (
+    preprocess_llm_output,
+    remove_outer_quotes,
+    remove_think_tags,
+)
+
+# One "TITLE <n>: ..." line per topic in a batched response
+_BATCH_TITLE_RE = re.compile(r"^\s*TITLE (\d+):[ \t]*(.+?)\s*$", re.M)
+
+# Generated title: (topic id, title, usage metadata of the LLM call)
+TitleResult = Tuple[str, str, Dict[str, int]]
+
+
+def _parse_batch_titles(text: str, count: int) -> Optional[List[str]]:
+    """Split a batched response into its titles, in topic order.
+
+    Returns None unless the response holds exactly one title for each of the
+    ``count`` topics.
+    """
+    titles = {
+        int(match.group(1)): remove_outer_quotes(match.group(2))
+        for match in _BATCH_TITLE_RE.finditer(remove_think_tags(text))
+    }
+    if sorted(titles) != list(range(1, count + 1)) or not all(titles.values()):
+        return None
+    return [titles[number] for number in range(1, count + 1)]
 
 
 class TopicTitleGenerationTask(Task):
@@ -24,10 +54,12 @@ class TopicTitleGenerationTask(Task):
     Attributes:
         DEFAULT_MAX_SUMMARY_LENGTH (int): Default character limit for article summaries
         DEFAULT_MAX_TITLE_WORDS (int): Default maximum words for generated topic titles
+        DEFAULT_BATCH_SIZE (int): Topics titled per LLM request, 1 disables batching
     """
 
     DEFAULT_MAX_SUMMARY_LENGTH: int = 500
     DEFAULT_MAX_TITLE_WORDS: int = 10
+    DEFAULT_BATCH_SIZE: int = 1
 
     def __init__(self, context: TaskContext):
         super().__init__(context)
@@ -49,7 +81,12 @@ class TopicTitleGenerationTask(Task):
             max_title_words = self.get_parameter(
                 "max_title_words", default=self.DEFAULT_MAX_TITLE_WORDS
             )
-            return await self._run_title_generation(max_summary_length, max_title_words)
+            batch_size = self.get_parameter(
+                "batch_size", default=self.DEFAULT_BATCH_SIZE
+            )
+            return await self._run_title_generation(
+                max_summary_length, max_title_words, batch_size
+            )
         except Exception as e:
             self.logger.error(f"Topic title generation failed: {str(e)}", exc_info=True)
             return TaskResult(
@@ -61,7 +98,10 @@ class TopicTitleGenerationTask(Task):
             )
 
     async def _run_title_generation(
-        self, max_summary_length: Optional[int], max_title_words: int
+        self,
+        max_summary_length: Optional[int],
+        max_title_words: int,
+        batch_size: int = DEFAULT_BATCH_SIZE,
     ) -> TaskResult:
         """Generate titles for topic clusters using LLM.
 
@@ -72,6 +112,7 @@ class TopicTitleGenerationTask(Task):
         Args:
             max_summary_length: Character limit for article summaries
             max_title_words: Maximum words for generated topic titles
+            batch_size: Topics titled per LLM request
 
         Returns:
             TaskResult with generated titles and metrics
@@ -99,48 +140,34 @@ class TopicTitleGenerationTask(Task):
         topic_ids = [topic[0] for topic in topics]
         feeds_by_topic = get_feeds_for_topics(db, topic_ids)
 
-        # Prepare LLM prompts
-        tasks = []
-        valid_topic_ids = []
-        valid_formatted_texts = []
-
+        # Prepare formatted headlines per topic
+        topic_texts: List[Tuple[str, str]] = []
         for topic_id in topic_ids:
             headlines = feeds_by_topic.get(topic_id, [])
             formatted_text = self._prepare_topic_prompts(
                 topic_id, headlines, max_summary_length
             )
-
             if formatted_text:
-                prompts = llm.prepare_prompts(
-                    human=TOPIC_TITLE_GENERATION_USER.format(
-                        headlines=formatted_text, max_words=max_title_words
-                    ),
-                    system=TOPIC_TITLE_GENERATION_SYSTEM,
-                )
-                tasks.append(llm.generate_async(prompts=prompts))
-                valid_topic_ids.append(topic_id)
-                valid_formatted_texts.append(formatted_text)
+                topic_texts.append((topic_id, formatted_text))
 
-        self.logger.info(f"Generating titles for {len(tasks)} topics")
-        aimessages = await track_async_progress(
-            coroutines=tasks,
+        batch_size = max(batch_size, 1)
+        batches = [
+            topic_texts[start : start + batch_size]
+            for start in range(0, len(topic_texts), batch_size)
+        ]
+        self.logger.info(f"Generating titles for {len(topic_texts)} topics")
+        batch_results = await track_async_progress(
+            coroutines=[
+                self._generate_titles(batch, llm, max_title_words) for batch in batches
+            ],
             desc="Generating titles",
             logger=self.logger,
-            unit="topics",
+            unit="topics" if batch_size == 1 else "batches",
         )
+        results = [result for batch in batch_results for result in batch]
 
-        # Process results
-        updates = []
-        for topic_id, message, formatted_text in zip(
-            valid_topic_ids, aimessages, valid_formatted_texts
-        ):
-            title = preprocess_llm_output(message.content)
-            updates.append(
-                (title, topic_id)
-            )  # this tuple order is expected in sqlite executemany update
-            # self.logger.debug(
-            #     f"Topic ID: {topic_id}, Generated Title: {title}, Headlines: {formatted_text}"
-            # )
+        # this tuple order is expected in sqlite executemany update
+        updates = [(title, topic_id) for topic_id, title, _ in results]
 
         # Write topic titles to database
         db.update_many(
@@ -151,22 +178,13 @@ class TopicTitleGenerationTask(Task):
         )
 
         # Collect metrics
+        usages = [usage for _, _, usage in results]
         metrics = {
-            "sum_input_tokens": sum(
-                msg.usage_metadata.get("input_tokens", 0) for msg in aimessages
-            ),
-            "sum_output_tokens": sum(
-                msg.usage_metadata.get("output_tokens", 0) for msg in aimessages
-            ),
-            "sum_total_tokens": sum(
-                msg.usage_metadata.get("total_tokens", 0) for msg in aimessages
-            ),
-            "input_tokens": [
-                msg.usage_metadata.get("input_tokens", 0) for msg in aimessages
-            ],
-            "output_tokens": [
-                msg.usage_metadata.get("output_tokens", 0) for msg in aimessages
-            ],
+            "sum_input_tokens": sum(u.get("input_tokens", 0) for u in usages),
+            "sum_output_tokens": sum(u.get("output_tokens", 0) for u in usages),
+            "sum_total_tokens": sum(u.get("total_tokens", 0) for u in usages),
+            "input_tokens": [u.get("input_tokens", 0) for u in usages],
+            "output_tokens": [u.get("output_tokens", 0) for u in usages],
             "topics_processed": len(topics),
             "titles_generated": len(updates),
         }
@@ -179,6 +197,78 @@ class TopicTitleGenerationTask(Task):
             metrics=metrics,
         )
 
+    async def _generate_titles(
+        self, batch: List[Tuple[str, str]], llm: LLM, max_title_words: int
+    ) -> List[TitleResult]:
+        """Generate titles for a batch of (topic id, headlines) pairs.
+
+        Batches are sent as a single request, falling back to one request per
+        topic when that fails or its response can't be parsed.
+        """
+        if len(batch) > 1:
+            try:
+                return await self._batch_titles(batch, llm, max_title_words)
+            except Exception as e:
+                self.logger.warning(
+                    f"Batch title generation failed, titling {len(batch)} "
+                    f"topics one by one: {str(e)}"
+                )
+
+        # The template is split once around the headlines for all topics
+        prefix, suffix = TOPIC_TITLE_GENERATION_USER.replace(
+            "{max_words}", str(max_title_words)
+        ).split("{headlines}", 1)
+        messages = await asyncio.gather(
+            *(
+                llm.generate_async(
+                    prompts=llm.prepare_prompts(
+                        human=prefix + formatted_text + suffix,
+                        system=TOPIC_TITLE_GENERATION_SYSTEM,
+                    )
+                )
+                for _, formatted_text in batch
+            )
+        )
+        return [
+            (
+                topic_id,
+                preprocess_llm_output(message.content),
+                message.usage_metadata or {},
+            )
+            for (topic_id, _), message in zip(batch, messages, strict=True)
+        ]
+
+    async def _batch_titles(
+        self, batch: List[Tuple[str, str]], llm: LLM, max_title_words: int
+    ) -> List[TitleResult]:
+        """Generate titles for several topics with a single LLM request.
+
+        Token usage of the request is attributed to the first topic of the batch.
+
+        Raises:
+            ValueError: If the response does not hold one title per topic
+        """
+        sections = "\n\n".join(
+            TOPIC_TITLE_BATCH_SECTION.format(number=number, headlines=formatted_text)
+            for number, (_, formatted_text) in enumerate(batch, 1)
+        )
+        prompts = llm.prepare_prompts(
+            human=TOPIC_TITLE_BATCH_USER.format(
+                count=len(batch), max_words=max_title_words, topics=sections
+            ),
+            system=TOPIC_TITLE_GENERATION_SYSTEM,
+        )
+        message = await llm.generate_async(prompts=prompts)
+
+        titles = _parse_batch_titles(message.content, len(batch))
+        if titles is None:
+            raise ValueError(f"Expected {len(batch)} titles in batched response")
+
+        return [
+            (topic_id, title, (message.usage_metadata or {}) if i == 0 else {})
+            for i, ((topic_id, _), title) in enumerate(zip(batch, titles, strict=True))
+        ]
+
     def _format_headline(
         self, headline: Dict[str, Any], index: int, max_summary_length: Optional[int]
     ) -> str:
@@ -7,12 +7,15 @@ from typing import TypeVar, List
 
 T = TypeVar("T")
 
+DEFAULT_UPDATE_INTERVAL = 0.25
+
 
 async def track_async_progress(
     coroutines: List[Awaitable[T]],
     desc: str,
     logger: logging.Logger,
     unit: str = "items",
+    update_interval: float = DEFAULT_UPDATE_INTERVAL,
 ) -> List[T]:
     """Track progress of multiple coroutines with tqdm progress bar.
 
@@ -23,6 +26,7 @@ async def track_async_progress(
         desc: Description for the progress bar
         logger: Logger instance for error reporting
         unit: Unit label for the progress bar
+        update_interval: Minimum seconds between progress bar redraws
 
     Returns:
         List of results in same order as input coroutines
@@ -31,7 +35,15 @@ async def track_async_progress(
     tasks = [asyncio.create_task(coro) for coro in coroutines]
     results = [None] * len(tasks)
 
-    with tqdm.tqdm(total=len(tasks), desc=desc, unit=unit) as pbar:
+    # Redraws are throttled, fast completions otherwise pay for a render each
+    with tqdm.tqdm(
+        total=len(tasks),
+        desc=desc,
+        unit=unit,
+        mininterval=update_interval,
+        maxinterval=max(update_interval, 1.0),
+        smoothing=0,
+    ) as pbar:
         for index, task in enumerate(tasks):
             try:
                 results[index] = await task
@@ -59,7 +59,8 @@ def get_most_recent_topics(
     topics = db.select(
         table="topics",
         columns=["id", "title", "generated_at", "summary"],
-        condition=f"generated_at >= datetime('now', '-{time_window_hours} hours')",
+        where="generated_at >= datetime('now', ?)",
+        params=(f"-{time_window_hours} hours",),
     )
 
     if not topics:
@@ -102,8 +103,8 @@ def get_feeds_for_topics(
     if not topic_ids:
         return {}
 
-    # Format topic IDs for SQL IN clause
-    topic_ids_str = ",".join(f"'{tid}'" for tid in topic_ids)
+    # One placeholder per topic ID for the SQL IN clause
+    placeholders = ",".join("?" * len(topic_ids))
 
     # Join feeds and topic_feeds tables to get all related feeds
     query = f"""
@@ -120,15 +121,13 @@ def get_feeds_for_topics(
             f.summarized_article
         FROM topic_feeds tf
         JOIN feeds f ON tf.feed_id = f.id
-        WHERE tf.topic_id IN ({topic_ids_str})
+        WHERE tf.topic_id IN ({placeholders})
         ORDER BY tf.topic_id, f.published DESC
     """
 
-    results = db.run_query(query)
-
-    # Organize results by topic_id
+    # Organize results by topic_id while streaming rows (articles can be large)
     feeds_by_topic = {}
-    for row in results:
+    for row in db.iter_query(query, tuple(topic_ids)):
         topic_id = row[0]
         feed_entry = {
             "id": row[1],
@@ -149,8 +148,19 @@ def get_feeds_for_topics(
     return feeds_by_topic
 
 
+# Topics whose summary is missing or one of the LLM error sentinels (see
+# text_processing.is_error_response)
+_USABLE_SUMMARY_CONDITION = """
+        AND t.summary IS NOT NULL AND t.summary != ''
+        AND instr(t.summary, '<ERROR> No article content found.') = 0
+        AND instr(t.summary, '<ERROR> Cannot determine coherent topic.') = 0
+"""
+
+
 def get_topics_for_briefing(
-    db: DatabaseManager, briefing_id: Optional[str] = None
+    db: DatabaseManager,
+    briefing_id: Optional[str] = None,
+    exclude_error_summaries: bool = False,
 ) -> tuple[str, list[tuple]]:
     """Get topics associated with a briefing by joining topics and briefing_topics tables.
 
@@ -161,6 +171,8 @@ def get_topics_for_briefing(
         db (DatabaseManager): Database connection manager
         briefing_id (Optional[str]): Specific briefing ID (format: YYYY-MM-DD-HH-MM),
                                     if None uses most recent briefing
+        exclude_error_summaries (bool): Leave out topics without a summary or
+                                        with an LLM error summary
 
     Returns:
         tuple[str, list[tuple]]: Tuple containing:
@@ -175,17 +187,35 @@ def get_topics_for_briefing(
             return []
         briefing_id = recent_briefing[0]
 
-    topics_query = f"""
+    topics_query = """
         SELECT t.id, t.title, t.generated_at, t.summary
         FROM topics t
         JOIN briefing_topics bt ON t.id = bt.topic_id
-        WHERE bt.briefing_id = '{briefing_id}'
+        WHERE bt.briefing_id = ?
     """
-    briefing_topics = db.run_query(topics_query)
+    if exclude_error_summaries:
+        topics_query += _USABLE_SUMMARY_CONDITION
+    briefing_topics = db.run_query(topics_query, (briefing_id,))
 
     return briefing_id, briefing_topics
 
 
+def count_topics_for_briefing(db: DatabaseManager, briefing_id: str) -> int:
+    """Count all topics associated with a briefing.
+
+    Args:
+        db (DatabaseManager): Database connection manager
+        briefing_id (str): Briefing ID (format: YYYY-MM-DD-HH-MM)
+
+    Returns:
+        int: Number of topics linked to the briefing
+    """
+    rows = db.run_query(
+        "SELECT COUNT(*) FROM briefing_topics WHERE briefing_id = ?", (briefing_id,)
+    )
+    return rows[0][0]
+
+
 def store_briefing_with_topics(
     db: DatabaseManager,
     selected_topic_ids: List[str],
@@ -204,19 +234,20 @@ def store_briefing_with_topics(
     if briefing_id is None:
         briefing_id = get_utc_now_simple()
 
-    # Create a new entry in the briefings table
     utc_now_formatted = get_utc_now_formatted()
-    db.insert(
-        table="briefings",
-        columns=["id", "generated_at"],
-        values=[briefing_id, utc_now_formatted],
-    )
-
-    # Insert selected topic IDs into the briefing_topics table
-    for topic_id in selected_topic_ids:
+    with db.transaction():
+        # Create a new entry in the briefings table
         db.insert(
-            table="briefing_topics",
-            columns=["briefing_id", "topic_id"],
-            values=[briefing_id, topic_id],
+            table="briefings",
+            columns=["id", "generated_at"],
+            values=[briefing_id, utc_now_formatted],
         )
+
+        # Insert selected topic IDs into the briefing_topics table
+        for topic_id in selected_topic_ids:
+            db.insert(
+                table="briefing_topics",
+                columns=["briefing_id", "topic_id"],
+                values=[briefing_id, topic_id],
+            )
     return briefing_id
\ No newline at end of file
@@ -0,0 +1,50 @@
+from typing import Optional
+
+import aiohttp
+
+# Connector defaults, per-task concurrency is limited by the tasks' semaphores
+DEFAULT_CONNECTION_LIMIT = 100
+DEFAULT_DNS_CACHE_TTL = 300
+DEFAULT_KEEPALIVE_TIMEOUT = 75
+
+
+class HttpSessionManager:
+    """Provides one aiohttp session shared by all tasks of a run.
+
+    The session is created on first use, inside the running event loop, and
+    keeps its connections and DNS cache between tasks, so feeds and articles
+    on the same hosts reuse open connections.
+
+    Methods
+    -------
+    get_session() -> aiohttp.ClientSession
+        Returns the shared session, creating it on first call.
+    close() -> None
+        Closes the session and its connections.
+    """
+
+    def __init__(
+        self,
+        limit: int = DEFAULT_CONNECTION_LIMIT,
+        ttl_dns_cache: int = DEFAULT_DNS_CACHE_TTL,
+        keepalive_timeout: float = DEFAULT_KEEPALIVE_TIMEOUT,
+    ) -> None:
+        self.limit = limit
+        self.ttl_dns_cache = ttl_dns_cache
+        self.keepalive_timeout = keepalive_timeout
+        self._session: Optional[aiohttp.ClientSession] = None
+
+    def get_session(self) -> aiohttp.ClientSession:
+        if self._session is None or self._session.closed:
+            connector = aiohttp.TCPConnector(
+                limit=self.limit,
+                ttl_dns_cache=self.ttl_dns_cache,
+                keepalive_timeout=self.keepalive_timeout,
+            )
+            self._session = aiohttp.ClientSession(connector=connector)
+        return self._session
+
+    async def close(self) -> None:
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
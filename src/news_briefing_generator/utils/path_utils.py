@@ -1,5 +1,7 @@
 import os
+from functools import lru_cache
 from pathlib import Path
+from typing import Optional
 
 
 def resolve_config_path(filename: str, env_var_name: str = "NBG_CONFIGS_DIR") -> Path:
@@ -18,19 +20,27 @@ def resolve_config_path(filename: str, env_var_name: str = "NBG_CONFIGS_DIR") ->
     Returns:
         Path: Resolved path to the configuration file
     """
+    # Memoized on everything the lookup depends on, so changing the environment
+    # variable or working directory still resolves a fresh path
+    return _resolve_config_path(filename, os.environ.get(env_var_name), Path.cwd())
+
+
+@lru_cache(maxsize=None)
+def _resolve_config_path(filename: str, env_dir: Optional[str], cwd: Path) -> Path:
+    """Resolve configuration file path, see resolve_config_path()."""
     # Define default config directory relative to this file
     default_config_dir = Path(__file__).parent.parent.parent.parent / "configs"
 
     # Check environment variable first
-    if env_var_name in os.environ:
-        env_path = Path(os.environ[env_var_name]) / filename
+    if env_dir is not None:
+        env_path = Path(env_dir) / filename
         if env_path.exists():
             return env_path
 
     # Common locations to check
     locations = [
         Path("/app/configs") / filename,  # Docker standard
-        Path.cwd() / "configs" / filename,  # Current directory
+        cwd / "configs" / filename,  # Current directory
         default_config_dir / filename,  # Module relative
     ]
 
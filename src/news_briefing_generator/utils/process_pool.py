@@ -0,0 +1,21 @@
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from typing import Optional
+
+
+def create_process_pool(max_workers: Optional[int] = None) -> ProcessPoolExecutor:
+    """Create a process pool for CPU-bound parsing.
+
+    Workers are started from a forkserver (spawn where unavailable) rather than
+    forked from the workflow process, which by then may hold threads of its
+    own (embedding models, tokenizers, asyncio.to_thread workers) whose locks a
+    forked child would inherit in an undefined state.
+    """
+    method = (
+        "forkserver"
+        if "forkserver" in multiprocessing.get_all_start_methods()
+        else "spawn"
+    )
+    return ProcessPoolExecutor(
+        max_workers=max_workers, mp_context=multiprocessing.get_context(method)
+    )
@@ -1,4 +1,15 @@
 import re
+from functools import lru_cache
+
+# Sentinels the summarization prompts ask the LLM to emit when it cannot answer
+_ERROR_RE = re.compile(
+    r"<ERROR>[: ]?\s*"
+    r"(?:No article content found\.|Cannot determine coherent topic\.)"
+    r"\s*(?:<ERROR>)?"
+)
+
+# Rough characters per token for English text, used without a tokenizer
+CHARS_PER_TOKEN = 4
 
 
 def remove_outer_quotes(text: str) -> str:
@@ -42,3 +53,51 @@ def preprocess_llm_output(text: str) -> str:
     text = remove_think_tags(text)
     text = remove_outer_quotes(text)
     return text
+
+
+def is_error_response(text: str) -> bool:
+    """Check whether LLM output contains one of the prompts' error sentinels.
+
+    Args:
+        text (str): Input text from LLM output
+
+    Returns:
+        bool: True if the output reports missing content or no coherent topic
+    """
+    return _ERROR_RE.search(text) is not None
+
+
+@lru_cache(maxsize=1)
+def _get_token_encoding():
+    """Load the tiktoken encoding once, None if tiktoken or its data is missing."""
+    try:
+        import tiktoken
+
+        return tiktoken.get_encoding("cl100k_base")
+    except Exception:
+        return None
+
+
+def truncate_to_tokens(text: str, max_tokens: int) -> str:
+    """Truncate text to at most max_tokens tokens.
+
+    Uses the cl100k_base tokenizer when available, otherwise cuts at
+    CHARS_PER_TOKEN characters per token.
+
+    Args:
+        text (str): Input text
+        max_tokens (int): Token budget
+
+    Returns:
+        str: Text cut to the token budget
+    """
+    # Every token covers at least one character
+    if len(text) <= max_tokens:
+        return text
+    encoding = _get_token_encoding()
+    if encoding is None:
+        return text[: max_tokens * CHARS_PER_TOKEN]
+    token_ids = encoding.encode_ordinary(text)
+    if len(token_ids) <= max_tokens:
+        return text
+    return encoding.decode(token_ids[:max_tokens])
@@ -14,6 +14,7 @@ from news_briefing_generator.model.task.config import TaskConfig
 from news_briefing_generator.model.task.result import NO_DATA_WARNING, TaskResult
 from news_briefing_generator.tasks import TASK_REGISTRY
 from news_briefing_generator.utils.datetime_ops import get_utc_now_formatted
+from news_briefing_generator.utils.http_session import HttpSessionManager
 from news_briefing_generator.utils.path_utils import resolve_config_path
 from news_briefing_generator.utils.security import get_openai_api_key
 
@@ -38,6 +39,7 @@ class WorkflowHandler:
         conf: ConfigManager,
         logger_manager: LoggerManager,
         workflow_config_file: Optional[Path] = None,
+        http: Optional[HttpSessionManager] = None,
     ):
         """Initialize a workflow handler with the specified configuration.
 
@@ -49,11 +51,14 @@ class WorkflowHandler:
             workflow_config_file: Path to workflow config file. If None, the default
                 workflow_configs.yaml from the configs directory will be used. If provided,
                 the file name will be resolved relative to the configs directory.
+            http: HTTP session manager shared by the tasks. If None, tasks open
+                their own sessions.
         """
         self.db = db
         self.default_llm = default_llm
         self.conf = conf
         self.logger_manager = logger_manager
+        self.http = http
         self.logger = logger_manager.get_logger(__name__)
 
         # Handle workflow config file path resolution
@@ -113,7 +118,7 @@ class WorkflowHandler:
             logger_manager=self.logger_manager,
             llm=self._get_task_llm(task_config),
             params=task_config.params,
-            workflow_data={},
+            http=self.http,
         )
 
         # Instantiate task with context
@@ -143,7 +148,7 @@ class WorkflowHandler:
                     f"Inheriting base_url from default LLM for task {task_config.name}"
                 )
 
-            return OllamaModel(**llm_kwargs)
+            return self._with_response_cache(OllamaModel(**llm_kwargs))
 
         elif llm_type == "openai":
             # Remove type from kwargs
@@ -153,7 +158,7 @@ class WorkflowHandler:
             # Get API key from environment or config
             llm_kwargs["api_key"] = get_openai_api_key(self.conf)
 
-            return OpenAIModel(**llm_kwargs)
+            return self._with_response_cache(OpenAIModel(**llm_kwargs))
 
         else:
             self.logger.warning(
@@ -162,6 +167,14 @@ class WorkflowHandler:
             )
             return self.default_llm
 
+    def _with_response_cache(self, llm: LLM) -> LLM:
+        """Apply the shared response cache settings to a task-specific LLM."""
+        if not llm.use_cache:
+            llm.use_cache = self.conf.get_param("llm.use_cache", default=False).value
+        llm.cache_ttl = self.conf.get_param("llm.cache_ttl", default=None).value
+        llm.attach_cache(self.db)
+        return llm
+
     async def _execute_task(
         self, task_config: TaskConfig, workflow_context: Dict[str, Any]
     ) -> TaskResult:
@@ -0,0 +1,137 @@
+import asyncio
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from news_briefing_generator.db.helpers import get_sql_command
+from news_briefing_generator.db.schema import TABLE_COLUMNS
+from news_briefing_generator.db.sqlite import DatabaseManager
+
+
+@pytest.fixture
+def db(tmp_path: Path) -> DatabaseManager:
+    """Create a file-backed database with a single test table."""
+    db = DatabaseManager(str(tmp_path / "test.sqlite"))
+    db.execute_script("CREATE TABLE items (id INTEGER PRIMARY KEY, name TEXT);")
+    yield db
+    db.close()
+
+
+def test_transaction_commits_once(db: DatabaseManager) -> None:
+    """Test that statements inside a transaction are committed together."""
+    with db.transaction():
+        db.insert(table="items", columns=["id", "name"], values=(1, "a"))
+        db.insert(table="items", columns=["id", "name"], values=(2, "b"))
+        assert db.conn.in_transaction
+
+    assert not db.conn.in_transaction
+    assert db.run_query("SELECT id, name FROM items ORDER BY id") == [
+        (1, "a"),
+        (2, "b"),
+    ]
+
+
+def test_transaction_rolls_back_on_error(db: DatabaseManager) -> None:
+    """Test that a failing block leaves no partial writes behind."""
+    with pytest.raises(RuntimeError):
+        with db.transaction():
+            db.insert(table="items", columns=["id", "name"], values=(1, "a"))
+            raise RuntimeError("boom")
+
+    assert not db.conn.in_transaction
+    assert db.run_query("SELECT id FROM items") == []
+
+
+def test_default_pragmas_applied(db: DatabaseManager) -> None:
+    """Test that the connection runs in WAL mode by default."""
+    assert db.run_query("PRAGMA journal_mode") == [("wal",)]
+
+
+def test_pragmas_override(tmp_path: Path) -> None:
+    """Test that an empty pragma dict keeps SQLite defaults."""
+    db = DatabaseManager(str(tmp_path / "plain.sqlite"), pragmas={})
+    assert db.run_query("PRAGMA journal_mode") == [("delete",)]
+    db.close()
+
+
+@pytest.mark.asyncio
+async def test_run_query_async_uses_pool(db: DatabaseManager) -> None:
+    """Test that concurrent async reads share a bounded set of pooled connections."""
+    db.insert_many(table="items", columns=["id", "name"], values=[(1, "a"), (2, "b")])
+
+    query = "SELECT name FROM items WHERE id = ?"
+    results = await asyncio.gather(
+        *(db.run_query_async(query, (1,)) for _ in range(20))
+    )
+
+    assert results == [[("a",)]] * 20
+    assert 1 <= len(db.pool._connections) <= db.pool.size
+
+
+def test_embeddings_roundtrip(tmp_path: Path) -> None:
+    """Test that embeddings stored as BLOBs decode to the original vectors."""
+    db = DatabaseManager(str(tmp_path / "feeds.sqlite"))
+    db.execute_script(get_sql_command("feeds.sql"))
+    db.insert_many(table="feeds", columns=["id", "title"], values=[(1, "a"), (2, "b")])
+    vectors = np.array([[0.6, 0.8, 0.0], [0.0, 0.0, 1.0]], dtype=np.float32)
+
+    db.insert_embeddings([(1, vectors[0]), (2, vectors[1])])
+
+    blobs = db.run_query("SELECT embedding FROM feeds ORDER BY id")
+    decoded = np.stack([db.load_embedding(blob) for (blob,) in blobs])
+    assert decoded.dtype == np.float32
+    np.testing.assert_allclose(decoded, vectors, atol=1e-3)
+    db.close()
+
+
+def test_add_column_if_missing(db: DatabaseManager) -> None:
+    """Test that a missing column is added once and existing ones are kept."""
+    db.add_column_if_missing("items", "embedding", "BLOB")
+    db.add_column_if_missing("items", "embedding", "BLOB")
+    assert db.get_column_names("items") == ["id", "name", "embedding"]
+
+
+def test_invalid_identifier_rejected(db: DatabaseManager) -> None:
+    """Test that table and column names are validated before building SQL."""
+    with pytest.raises(ValueError, match="Invalid SQL identifier"):
+        db.insert(table="items", columns=["id; DROP TABLE items"], values=(1,))
+    with pytest.raises(ValueError, match="Invalid SQL identifier"):
+        db.select(table="items where 1", columns=["id"])
+
+
+def test_select_with_params(db: DatabaseManager) -> None:
+    """Test that select binds WHERE values as parameters."""
+    db.insert_many(
+        table="items", columns=["id", "name"], values=[(1, "a"), (2, "it's")]
+    )
+    assert db.select(
+        table="items", columns=["id"], where="name = ?", params=("it's",)
+    ) == [(2,)]
+
+
+def test_iter_query_streams_rows(db: DatabaseManager) -> None:
+    """Test that iter_query yields the same rows as run_query."""
+    db.insert_many(table="items", columns=["id", "name"], values=[(1, "a"), (2, "b")])
+    rows = db.iter_query("SELECT id, name FROM items WHERE id > ?", (0,))
+    assert not isinstance(rows, list)
+    assert list(rows) == db.run_query("SELECT id, name FROM items")
+
+
+def test_column_names_match_ddl(tmp_path: Path) -> None:
+    """Test that the schema constants agree with the live DDL schema."""
+    db = DatabaseManager(str(tmp_path / "schema.sqlite"))
+    db.execute_script(
+        "\n".join(get_sql_command(f"{table}.sql") for table in TABLE_COLUMNS)
+    )
+    for table in TABLE_COLUMNS:
+        assert db.get_column_names(table) == db.get_column_names(table, refresh=True)
+    db.close()
+
+
+def test_ensure_statistics_runs_analyze_once(db: DatabaseManager) -> None:
+    """Test that ANALYZE creates planner statistics on first use."""
+    db.execute_script("CREATE INDEX idx_items_name ON items (name);")
+    db.insert_many(table="items", columns=["id", "name"], values=[(1, "a"), (2, "b")])
+    db.ensure_statistics()
+    assert db.run_query("SELECT tbl FROM sqlite_stat1") == [("items",)]
@@ -1,9 +1,12 @@
+import asyncio
 import os
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 from langchain_core.messages import AIMessage, HumanMessage, SystemMessage
 
+from news_briefing_generator.db.helpers import get_sql_command
+from news_briefing_generator.db.sqlite import DatabaseManager
 from news_briefing_generator.llm.base import LLM
 from news_briefing_generator.llm.ollama import OllamaModel
 from news_briefing_generator.llm.openai import OpenAIModel
@@ -11,7 +14,7 @@ from news_briefing_generator.llm.openai import OpenAIModel
 
 @pytest.fixture
 def mock_chat_ollama():
-    with patch("news_briefing_generator.llm.ollama.ChatOllama") as mock:
+    with patch("langchain_ollama.ChatOllama") as mock:
         # Configure the mock to return a predetermined response
         instance = mock.return_value
         instance.invoke.return_value = AIMessage(content="Mocked Ollama response")
@@ -23,7 +26,7 @@ def mock_chat_ollama():
 
 @pytest.fixture
 def mock_chat_openai():
-    with patch("news_briefing_generator.llm.openai.ChatOpenAI") as mock:
+    with patch("langchain_openai.ChatOpenAI") as mock:
         # Configure the mock to return a predetermined response
         instance = mock.return_value
         instance.invoke.return_value = AIMessage(content="Mocked OpenAI response")
@@ -154,3 +157,75 @@ def test_prepare_prompts():
 
     with pytest.raises(ValueError):
         OllamaModel.prepare_prompts(human_msg, "")
+
+
+def test_prepare_prompts_reuses_system_message():
+    """Test that the same system prompt maps to one shared message object."""
+    first = OllamaModel.prepare_prompts("Question one", "Be brief")
+    second = OpenAIModel.prepare_prompts("Question two", "Be brief")
+
+    assert first[0] is second[0]
+    assert first[1] is not second[1]
+
+
+@pytest.mark.asyncio
+async def test_generate_many_async_limits_concurrency(mock_chat_ollama):
+    """Test that generate_many_async keeps order and bounds requests in flight."""
+    model = OllamaModel(base_url="http://test:11434", model="llama3")
+    in_flight = 0
+    max_in_flight = 0
+
+    async def fake_ainvoke(prompts):
+        nonlocal in_flight, max_in_flight
+        in_flight += 1
+        max_in_flight = max(max_in_flight, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        return AIMessage(content=prompts)
+
+    mock_chat_ollama.return_value.ainvoke = fake_ainvoke
+
+    prompts = [f"prompt {i}" for i in range(10)]
+    results = await model.generate_many_async(prompts, max_concurrency=3)
+
+    assert [r.content for r in results] == prompts
+    assert max_in_flight == 3
+
+
+@pytest.mark.asyncio
+async def test_response_cache_skips_repeated_prompts(mock_chat_ollama, tmp_path):
+    """Test that identical prompts are answered from the prompts_cache table."""
+    db = DatabaseManager(str(tmp_path / "cache.sqlite"))
+    db.execute_script(get_sql_command("prompts_cache.sql"))
+    model = OllamaModel(base_url="http://test:11434", use_cache=True, model="llama3")
+    model.attach_cache(db)
+    prompts = model.prepare_prompts(human="Hello", system="Be brief")
+
+    first = await model.generate_async(prompts)
+    second = await model.generate_async(prompts)
+    other = model.generate(model.prepare_prompts(human="Bye", system="Be brief"))
+
+    assert second.content == first.content == "Mocked Ollama response"
+    assert mock_chat_ollama.return_value.ainvoke.await_count == 1
+    assert mock_chat_ollama.return_value.invoke.call_count == 1
+    assert other.content == "Mocked Ollama response"
+    db.close()
+
+
+def test_response_cache_ttl_refreshes_expired_entries(mock_chat_ollama, tmp_path):
+    """Test that responses older than cache_ttl are generated and stored again."""
+    db = DatabaseManager(str(tmp_path / "cache.sqlite"))
+    db.execute_script(get_sql_command("prompts_cache.sql"))
+    model = OllamaModel(base_url="http://test:11434", use_cache=True, model="llama3")
+    model.attach_cache(db)
+    model.cache_ttl = 24
+    prompts = model.prepare_prompts(human="Hello", system="Be brief")
+
+    model.generate(prompts)
+    db.conn.execute("UPDATE prompts_cache SET created_at = '2000-01-01 00:00:00+0000'")
+    model.generate(prompts)
+    model.generate(prompts)
+
+    assert mock_chat_ollama.return_value.invoke.call_count == 2
+    assert db.run_query("SELECT created_at > '2001' FROM prompts_cache") == [(1,)]
+    db.close()
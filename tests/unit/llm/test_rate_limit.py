@@ -0,0 +1,73 @@
+import subprocess
+import sys
+import time
+
+import httpx
+import pytest
+
+from news_briefing_generator.llm.rate_limit import (
+    TokenBucketLimiter,
+    is_rate_limit_error,
+    is_transient_error,
+)
+
+
+class StatusError(Exception):
+    def __init__(self, status_code: int) -> None:
+        super().__init__(f"HTTP {status_code}")
+        self.status_code = status_code
+
+
+def test_is_rate_limit_error() -> None:
+    """Test that only 429 responses count as rate limiting."""
+    assert is_rate_limit_error(StatusError(429))
+    assert not is_rate_limit_error(StatusError(500))
+    assert not is_rate_limit_error(ValueError("no status"))
+
+
+@pytest.mark.parametrize(
+    "error, expected",
+    [
+        (StatusError(429), True),
+        (StatusError(503), True),
+        (httpx.ConnectTimeout("timed out"), True),
+        (TimeoutError(), True),
+        (StatusError(400), False),
+        (ValueError("prompt too long"), False),
+    ],
+)
+def test_is_transient_error(error: Exception, expected: bool) -> None:
+    """Test that only errors worth sending again are retried."""
+    assert is_transient_error(error) is expected
+
+
+def test_openai_not_imported_by_tasks() -> None:
+    """Test that the retry policy doesn't load the OpenAI client."""
+    code = (
+        "import sys, news_briefing_generator.tasks.article_summarization; "
+        "sys.exit('openai' in sys.modules)"
+    )
+    assert subprocess.run([sys.executable, "-c", code]).returncode == 0
+
+
+@pytest.mark.asyncio
+async def test_token_bucket_spaces_requests() -> None:
+    """Test that requests beyond the bucket wait for it to refill."""
+    limiter = TokenBucketLimiter(requests_per_minute=1200)  # one per 50 ms
+    limiter._requests = 1
+
+    start = time.monotonic()
+    for _ in range(3):
+        await limiter.acquire()
+
+    assert time.monotonic() - start >= 0.09
+
+
+@pytest.mark.asyncio
+async def test_token_bucket_caps_oversized_token_requests() -> None:
+    """Test that a request above the token budget doesn't wait forever."""
+    limiter = TokenBucketLimiter(tokens_per_minute=100)
+
+    await limiter.acquire(tokens=10_000)
+
+    assert limiter._tokens < 1
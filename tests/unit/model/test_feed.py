@@ -0,0 +1,28 @@
+import feedparser
+
+from news_briefing_generator.model.feed import FeedItem
+
+
+def test_from_entry_does_not_mutate_class() -> None:
+    """Test that from_entry builds independent instances without class state."""
+    first = FeedItem.from_entry(
+        feedparser.FeedParserDict(title="First", link="https://a.example/1"),
+        source="A",
+        feed_url="https://a.example/rss",
+    )
+    second = FeedItem.from_entry(
+        feedparser.FeedParserDict(title="Second", link="https://b.example/2"),
+        source="B",
+        feed_url="https://b.example/rss",
+    )
+
+    assert (first.title, first.source) == ("First", "A")
+    assert (second.title, second.source) == ("Second", "B")
+    assert FeedItem().source is None
+    assert not hasattr(first, "__dict__")
+
+
+def test_from_entry_without_link() -> None:
+    """Test that entries without a link are skipped."""
+    entry = feedparser.FeedParserDict(title="No link")
+    assert FeedItem.from_entry(entry, source="A", feed_url="https://a.example") is None
@@ -0,0 +1,102 @@
+from unittest.mock import MagicMock
+
+import pytest
+
+from news_briefing_generator.config.config_manager import ConfigSource
+from news_briefing_generator.model.task.base import ParamRecord, Task, TaskContext
+from news_briefing_generator.model.task.result import TaskResult
+
+
+class DummyTask(Task):
+    @property
+    def name(self) -> str:
+        return "dummy"
+
+    async def execute(self) -> TaskResult:
+        raise NotImplementedError
+
+
+@pytest.fixture
+def task() -> DummyTask:
+    context = TaskContext(db=MagicMock(), conf=MagicMock(), logger_manager=MagicMock())
+    return DummyTask(context)
+
+
+def test_parameter_type_fixed_by_first_resolution(task: DummyTask) -> None:
+    """Test that updates are validated against the first resolved type."""
+    task._track_param_resolution("limit", 10, ConfigSource.BASE_SETTINGS)
+
+    task._update_task_parameters({"limit": 20})
+    assert task.context.param_sources["limit"] == ParamRecord(
+        20, ConfigSource.WORKFLOW, int
+    )
+    with pytest.raises(TypeError):
+        task._update_task_parameters({"limit": "thirty"})
+
+
+def test_parameter_with_none_default_can_be_updated(task: DummyTask) -> None:
+    """Test that parameters resolved to None accept a value later."""
+    task._track_param_resolution("user_agent", None, ConfigSource.DEFAULT)
+
+    task._update_task_parameters({"user_agent": "nbg/1.0"})
+
+    assert task.context.params["user_agent"] == "nbg/1.0"
+    assert task.context.param_sources["user_agent"].type is str
+
+
+@pytest.mark.parametrize(
+    "value, expected_type, expected",
+    [
+        ("yes", bool, True),
+        ("0", bool, False),
+        ("42", int, 42),
+        ("0.5", float, 0.5),
+        ("[a, b]", list, ["a", "b"]),
+        ("text", str, "text"),
+    ],
+)
+def test_safe_convert_value(value: str, expected_type: type, expected) -> None:
+    """Test conversion of review input to the parameter type."""
+    assert Task._safe_convert_value(value, expected_type) == expected
+
+
+def test_safe_convert_value_unsupported_type() -> None:
+    """Test that unsupported parameter types are rejected."""
+    with pytest.raises(ValueError, match="Unsupported type"):
+        Task._safe_convert_value("{}", dict)
+
+
+def test_updated_parameters_keep_equals_in_values(
+    task: DummyTask, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Test that only the first '=' separates parameter name and value."""
+    task._track_param_resolution("feed_url", "https://a", ConfigSource.BASE_SETTINGS)
+    inputs = iter(["no separator", "feed_url=https://b.example/?q=1", ""])
+    monkeypatch.setattr("typer.prompt", lambda *args, **kwargs: next(inputs))
+    monkeypatch.setattr("typer.echo", lambda *args, **kwargs: None)
+
+    assert task._get_updated_parameters() == {"feed_url": "https://b.example/?q=1"}
+
+
+def test_context_params_copied_on_first_write() -> None:
+    """Test that contexts share the empty default until parameters are set."""
+    first = TaskContext(db=MagicMock(), conf=MagicMock(), logger_manager=MagicMock())
+    second = TaskContext(db=MagicMock(), conf=MagicMock(), logger_manager=MagicMock())
+    assert first.params is second.params
+
+    first.update_params({"limit": 5})
+
+    assert first.params == {"limit": 5}
+    assert dict(second.params) == {}
+
+
+def test_unchanged_resolution_keeps_record(task: DummyTask) -> None:
+    """Test that re-resolving to the same value and source keeps the record."""
+    task._track_param_resolution("limit", 10, ConfigSource.BASE_SETTINGS)
+    record = task.context.param_sources["limit"]
+
+    task._track_param_resolution("limit", 10, ConfigSource.BASE_SETTINGS)
+    assert task.context.param_sources["limit"] is record
+
+    task._track_param_resolution("limit", 10, ConfigSource.WORKFLOW)
+    assert task.context.param_sources["limit"].source is ConfigSource.WORKFLOW
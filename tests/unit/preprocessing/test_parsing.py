@@ -0,0 +1,80 @@
+from datetime import datetime, timezone
+
+import pytest
+
+from news_briefing_generator.preprocessing import parsing
+from news_briefing_generator.preprocessing.parsing import (
+    HtmlTextStream,
+    html_bytes_to_text,
+    html_to_text,
+    to_dt_utc,
+)
+
+
+def test_html_to_text_strips_markup() -> None:
+    """Test that tags are removed and entities decoded."""
+    assert html_to_text("<p>Rates <b>rise</b> &amp; fall</p>") == "Rates rise & fall"
+
+
+def test_html_to_text_passes_through_plain_text() -> None:
+    """Test that plain text and non-string values are returned unchanged."""
+    assert html_to_text("Plain summary without markup") == (
+        "Plain summary without markup"
+    )
+    assert html_to_text(None) is None
+    assert html_to_text("") == ""
+
+
+def test_html_to_text_drops_scripts_and_comments() -> None:
+    """Test that script/style contents and comments are not part of the text."""
+    html = (
+        "<html><head><style>p {color: red}</style></head>"
+        "<body><!-- nav --><p>Story</p><script>track();</script></body></html>"
+    )
+    assert html_to_text(html) == "Story"
+
+
+@pytest.mark.parametrize("backend", ["html.parser", "lxml"])
+def test_html_text_stream_matches_html_to_text(monkeypatch, backend: str) -> None:
+    """Test that chunked conversion handles splits inside tags, entities and UTF-8."""
+    if backend == "lxml":
+        pytest.importorskip("lxml")
+    monkeypatch.setattr(parsing, "_HTML_PARSER", backend)
+    html = (
+        "<p>Caf\u00e9 &amp; <b>cr\u00e8me</b></p>"
+        "<script>x()</script><p>br\u00fbl\u00e9e</p>"
+    )
+    data = html.encode("utf-8")
+    stream = HtmlTextStream("utf-8")
+    for i in range(0, len(data), 3):
+        stream.feed(data[i : i + 3])
+
+    assert stream.close() == html_to_text(html)
+
+
+def test_html_bytes_to_text_decodes_charset() -> None:
+    """Test conversion of a whole document with a declared charset."""
+    data = "<p>Caf\u00e9 <b>cr\u00e8me</b></p>".encode("latin-1")
+
+    assert html_bytes_to_text(data, "latin-1") == "Caf\u00e9 cr\u00e8me"
+
+
+@pytest.mark.parametrize(
+    "timestamp, expected",
+    [
+        ("Mon, 18 Nov 2024 18:55:24 GMT", datetime(2024, 11, 18, 18, 55, 24)),
+        ("Mon, 18 Nov 2024 21:05:34 +0000", datetime(2024, 11, 18, 21, 5, 34)),
+        ("Mon, 18 Nov 2024 18:55:24 EDT", datetime(2024, 11, 18, 22, 55, 24)),
+        ("2024-11-19T02:03:27+05:30", datetime(2024, 11, 18, 20, 33, 27)),
+        ("2024-11-19T02:03:27Z", datetime(2024, 11, 19, 2, 3, 27)),
+    ],
+)
+def test_to_dt_utc_formats(timestamp: str, expected: datetime) -> None:
+    """Test that supported feed timestamp formats are converted to UTC."""
+    assert to_dt_utc(timestamp) == expected.replace(tzinfo=timezone.utc)
+
+
+@pytest.mark.parametrize("timestamp", [None, "", "garbage", "2024-11-19 02:03:27"])
+def test_to_dt_utc_rejects_unparseable(timestamp: str) -> None:
+    """Test that missing, invalid and timezone-less timestamps give None."""
+    assert to_dt_utc(timestamp) is None
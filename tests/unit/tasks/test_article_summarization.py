@@ -0,0 +1,69 @@
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from langchain_core.messages.ai import AIMessage
+
+from news_briefing_generator.tasks.article_summarization import (
+    ArticleData,
+    ArticleSummarizationTask,
+    _group_duplicates,
+    _parse_batch_summaries,
+    _reservoir_sample,
+)
+
+
+def test_parse_batch_summaries() -> None:
+    """Test splitting a batched response and rejecting incomplete ones."""
+    text = "SUMMARY 2:\n<summary>Second.</summary>\nSUMMARY 1: First.\n"
+
+    assert _parse_batch_summaries(text, 2) == ["First.", "<summary>Second.</summary>"]
+    assert _parse_batch_summaries(text, 3) is None
+    assert _parse_batch_summaries("SUMMARY 1:\nSUMMARY 2: Second.", 2) is None
+
+
+@pytest.mark.asyncio
+async def test_batched_articles_fall_back_to_single_requests() -> None:
+    """Test one request per batch, and single requests when parsing fails."""
+    task = ArticleSummarizationTask(MagicMock())
+    llm = MagicMock()
+    llm.prepare_prompts = lambda human, system: human
+    llm.generate_async = AsyncMock(
+        side_effect=[
+            AIMessage(content="SUMMARY 1: A.\nSUMMARY 2: B."),
+            AIMessage(content="Only one summary"),
+            AIMessage(content="C."),
+            AIMessage(content="D."),
+        ]
+    )
+    articles = [ArticleData(topic_id="t", feed_id=str(i), text="x") for i in range(4)]
+
+    results = await task._process_articles(
+        articles, llm, asyncio.Semaphore(1), batch_size=2
+    )
+
+    assert [r.content for r in results] == ["A.", "B.", "C.", "D."]
+    assert llm.generate_async.await_count == 4
+
+
+def test_reservoir_sample_bounds_and_uniqueness() -> None:
+    """Test that sampling keeps at most k distinct items from the input."""
+    assert _reservoir_sample(iter(range(3)), 5) == [0, 1, 2]
+
+    sample = _reservoir_sample(iter(range(100)), 8)
+    assert len(sample) == 8
+    assert len(set(sample)) == 8
+    assert set(sample) <= set(range(100))
+
+
+def test_group_duplicates_keeps_order() -> None:
+    """Test that identical texts share a group and first occurrences lead."""
+    articles = [
+        ArticleData(topic_id="t1", feed_id="1", text="wire story"),
+        ArticleData(topic_id="t1", feed_id="2", text="local story"),
+        ArticleData(topic_id="t2", feed_id="3", text="wire story"),
+    ]
+
+    groups = _group_duplicates(articles)
+
+    assert [[a.feed_id for a in group] for group in groups] == [["1", "3"], ["2"]]
@@ -0,0 +1,111 @@
+from unittest.mock import MagicMock
+
+import pytest
+from jinja2.exceptions import UndefinedError
+
+from news_briefing_generator.db.helpers import get_sql_command
+from news_briefing_generator.db.sqlite import DatabaseManager
+from news_briefing_generator.tasks.briefing_html_generation import (
+    _DEFAULT_TEMPLATE,
+    BriefingHtmlGenerationTask,
+    _compile_template,
+    _render_to_file,
+)
+
+
+def test_default_template_compiled_once_and_escapes_values() -> None:
+    """Test that the template is reused and feed values are HTML-escaped."""
+    template = _compile_template(_DEFAULT_TEMPLATE)
+    assert _compile_template(_DEFAULT_TEMPLATE) is template
+
+    html = template.render(
+        briefing_id="2024-11-18-18-55",
+        date="November 18, 2024 18:55",
+        topics=[
+            {
+                "title": "Markets & <b>rates</b>",
+                "summary": "Summary text.",
+                "articles": [
+                    {
+                        "source": "Example",
+                        "title": "<script>alert(1)</script>",
+                        "used_for_summarization": True,
+                        "link": "https://example.com/?a=1&b=2",
+                    }
+                ],
+            }
+        ],
+    )
+
+    assert "Markets &amp; &lt;b&gt;rates&lt;/b&gt;" in html
+    assert "<script>alert(1)</script>" not in html
+    assert 'href="https://example.com/?a=1&amp;b=2"' in html
+
+
+def test_failed_render_keeps_previous_file(tmp_path) -> None:
+    """Test that a render error leaves the existing briefing untouched."""
+    output_path = tmp_path / "briefing.html"
+    output_path.write_text("previous")
+    template = _compile_template("{{ missing.attribute }}")
+
+    with pytest.raises(UndefinedError):
+        _render_to_file(template, {}, str(output_path))
+
+    assert output_path.read_text() == "previous"
+    assert [p.name for p in tmp_path.iterdir()] == ["briefing.html"]
+
+    _render_to_file(_compile_template("new"), {}, str(output_path))
+    assert output_path.read_text() == "new"
+
+
+@pytest.mark.asyncio
+async def test_rendering_groups_articles_by_topic(tmp_path) -> None:
+    """Test that unusable topics are skipped and articles grouped per topic."""
+    db = DatabaseManager(":memory:")
+    for table in ["feeds", "topics", "topic_feeds", "briefings", "briefing_topics"]:
+        db.execute_script(get_sql_command(f"{table}.sql"))
+    db.insert_many("briefings", ["id"], [("2024-11-18-18-55",)])
+    db.insert_many(
+        "topics",
+        ["id", "title", "summary"],
+        [
+            (1, "Topic A", "Summary A"),
+            (2, "Topic B", "Summary B"),
+            (3, "Topic C", "<ERROR> Cannot determine coherent topic. <ERROR>"),
+            (4, "Topic D", None),
+            (5, "Topic E", "A regular summary about an <ERROR> in the markets."),
+        ],
+    )
+    db.insert_many(
+        "briefing_topics",
+        ["briefing_id", "topic_id"],
+        [("2024-11-18-18-55", topic_id) for topic_id in range(1, 6)],
+    )
+    db.insert_many(
+        "feeds",
+        ["id", "title", "link", "published", "source"],
+        [
+            (1, "Old A", "https://a/1", "2024-11-17", "S"),
+            (2, "New A", "https://a/2", "2024-11-18", "S"),
+            (3, "Only B", "https://b/1", "2024-11-18", "S"),
+        ],
+    )
+    db.insert_many(
+        "topic_feeds",
+        ["topic_id", "feed_id", "used_for_summarization"],
+        [(1, 1, 0), (1, 2, 1), (2, 3, 0)],
+    )
+    context = MagicMock()
+    context.db = db
+    task = BriefingHtmlGenerationTask(context)
+
+    result = await task._run_rendering(output_path=str(tmp_path / "briefing.html"))
+
+    html = (tmp_path / "briefing.html").read_text()
+    assert result.success
+    assert html.index("New A") < html.index("Old A") < html.index("Topic B")
+    assert html.index("Topic B") < html.index("Only B")
+    assert "Topic C" not in html and "Topic D" not in html
+    assert "Topic E" in html
+    assert result.metrics["topics_skipped"] == 2
+    db.close()
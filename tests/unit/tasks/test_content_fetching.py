@@ -0,0 +1,108 @@
+import asyncio
+import time
+from unittest.mock import MagicMock
+
+import aiohttp
+import pytest
+
+from news_briefing_generator.db.helpers import get_sql_command
+from news_briefing_generator.db.sqlite import DatabaseManager
+from news_briefing_generator.tasks.content_fetching import (
+    ContentFetchingTask,
+    _HostThrottle,
+)
+
+
+class FakeResponse:
+    def __init__(self, status: int, text: str = "") -> None:
+        self.status = status
+        self._text = text
+
+    async def __aenter__(self) -> "FakeResponse":
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        return None
+
+    async def text(self) -> str:
+        return self._text
+
+
+class FakeSession:
+    def __init__(self, responses: dict) -> None:
+        self.responses = responses
+        self.requested: list = []
+
+    def get(self, url: str, **kwargs) -> FakeResponse:
+        self.requested.append(url)
+        return self.responses[url]
+
+
+@pytest.mark.asyncio
+async def test_robots_txt_is_stored_and_reused() -> None:
+    """Test robots.txt is fetched once per domain and reused across runs."""
+    context = MagicMock()
+    context.db = DatabaseManager(":memory:")
+    context.db.execute_script(get_sql_command("robots_cache.sql"))
+    task = ContentFetchingTask(context)
+    timeout = aiohttp.ClientTimeout(total=5)
+    robots_txt = "User-agent: *\nDisallow: /x"
+    session = FakeSession(
+        {
+            "https://a.com/robots.txt": FakeResponse(200, robots_txt),
+            "https://b.com/robots.txt": FakeResponse(404),
+        }
+    )
+
+    get_parser = task._get_robots_parser
+
+    parser = await get_parser(session, "https://a.com/x/1", 24, timeout)
+    assert not parser.can_fetch("*", "https://a.com/x/1")
+    assert parser.can_fetch("*", "https://a.com/y/1")
+    assert await get_parser(session, "https://b.com/1", 24, timeout) is None
+
+    # A later run answers from the stored rules without any request
+    session.responses = {}
+    parser = await get_parser(session, "https://a.com/x/2", 24, timeout)
+    assert not parser.can_fetch("*", "https://a.com/x/2")
+    assert await get_parser(session, "https://b.com/2", 24, timeout) is None
+    assert session.requested == [
+        "https://a.com/robots.txt",
+        "https://b.com/robots.txt",
+    ]
+
+
+@pytest.mark.asyncio
+async def test_host_throttle_spaces_only_same_host() -> None:
+    """Test that requests wait for their own host but not for other hosts."""
+    throttle = _HostThrottle()
+
+    start = time.monotonic()
+    await asyncio.gather(*(throttle.wait(f"host{i}", 0.2) for i in range(5)))
+    assert time.monotonic() - start < 0.1
+
+    start = time.monotonic()
+    for _ in range(3):
+        await throttle.wait("same", 0.05)
+    assert time.monotonic() - start >= 0.09
+
+
+@pytest.mark.asyncio
+async def test_iter_body_stops_at_max_bytes() -> None:
+    """Test that reading stops once the byte cap is reached."""
+    read: list = []
+
+    async def iter_chunked(size: int):
+        for i in range(10):
+            read.append(i)
+            yield bytes([65 + i]) * 4
+
+    response = MagicMock()
+    response.content.iter_chunked = iter_chunked
+
+    chunks = [c async for c in ContentFetchingTask._iter_body(response, 10)]
+    assert b"".join(chunks) == b"AAAABBBBCC"
+    assert read == [0, 1, 2]
+
+    chunks = [c async for c in ContentFetchingTask._iter_body(response, None)]
+    assert len(b"".join(chunks)) == 40
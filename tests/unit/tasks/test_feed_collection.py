@@ -0,0 +1,46 @@
+from datetime import datetime, timezone
+from unittest.mock import MagicMock
+
+import pytest
+
+from news_briefing_generator.tasks.feed_collection import (
+    FeedCollectionTask,
+    _parse_feed,
+)
+
+RSS = """<?xml version="1.0"?>
+<rss version="2.0"><channel><title>Example News</title>
+<item><title>First</title><link>https://example.com/1</link>
+<pubDate>Mon, 18 Nov 2024 18:55:24 GMT</pubDate>
+<description>&lt;p&gt;Hello &amp;amp; welcome&lt;/p&gt;</description></item>
+<item><title>No link</title></item>
+</channel></rss>"""
+
+
+def test_parse_feed_uses_feed_title_without_configured_source() -> None:
+    """Test that entries are parsed and entries without link are dropped."""
+    source, items = _parse_feed(RSS, "https://example.com/rss", None)
+
+    assert source == "Example News"
+    assert [item.link for item in items] == ["https://example.com/1"]
+    assert items[0].summary == "Hello & welcome"
+    assert items[0].published == datetime(2024, 11, 18, 18, 55, 24, tzinfo=timezone.utc)
+
+
+@pytest.mark.asyncio
+async def test_parse_feeds_process_pool_matches_inline() -> None:
+    """Test that parsing in worker processes gives the same items in order."""
+    task = FeedCollectionTask(MagicMock())
+    jobs = [(RSS, f"https://example.com/rss{i}", f"Source {i}") for i in range(3)]
+
+    inline = await task._parse_feeds(jobs)
+    task.PARALLEL_PARSE_MIN_FEEDS = 1
+    pooled = await task._parse_feeds(jobs)
+
+    def without_fetch_time(parsed):
+        return [
+            (src, [item.to_tuple()[:-1] for item in items]) for src, items in parsed
+        ]
+
+    assert without_fetch_time(pooled) == without_fetch_time(inline)
+    assert [source for source, _ in pooled] == ["Source 0", "Source 1", "Source 2"]
@@ -0,0 +1,68 @@
+from unittest.mock import MagicMock
+
+import numpy as np
+import pandas as pd
+
+from news_briefing_generator.db.helpers import get_sql_command
+from news_briefing_generator.db.schema import FEED_COLUMNS
+from news_briefing_generator.db.sqlite import DatabaseManager
+from news_briefing_generator.tasks import feed_hdbscan_clustering
+from news_briefing_generator.tasks.feed_hdbscan_clustering import (
+    FeedHdbscanClusteringTask,
+)
+
+
+def test_store_clusters_creates_topics_once_and_links_feeds() -> None:
+    """Test that each cluster becomes one topic and every feed gets linked."""
+    db = DatabaseManager(":memory:")
+    for table in ["topics", "topic_feeds"]:
+        db.execute_script(get_sql_command(f"{table}.sql"))
+    db.insert("topics", ["id", "title"], ("run-0", "Existing"))
+    task = FeedHdbscanClusteringTask(MagicMock())
+    df = pd.DataFrame({"id": [1, 2, 3], "cluster": ["run-0", "run-1", "run-0"]})
+
+    task._store_clusters(db, df)
+
+    assert db.run_query("SELECT id, title FROM topics ORDER BY id") == [
+        ("run-0", "Existing"),
+        ("run-1", None),
+    ]
+    assert db.run_query(
+        "SELECT topic_id, feed_id FROM topic_feeds ORDER BY feed_id"
+    ) == [("run-0", 1), ("run-1", 2), ("run-0", 3)]
+
+
+def test_get_embeddings_reuses_vectors_of_same_model(monkeypatch) -> None:
+    """Test that only entries without a matching stored vector are embedded."""
+    db = DatabaseManager(":memory:")
+    db.execute_script(get_sql_command("feeds.sql"))
+    db.insert_many(
+        "feeds",
+        ["id", "title", "source", "summary"],
+        [(i, f"title {i}", "src", "sum") for i in (1, 2, 3)],
+    )
+    db.insert_embeddings([(1, np.array([1.0, 0.0]))], model="m|normalize=True")
+    db.insert_embeddings([(2, np.array([0.0, 1.0]))], model="other|normalize=True")
+
+    model = MagicMock()
+    model.embed.side_effect = lambda docs, normalize: np.full((len(docs), 2), 0.5)
+    monkeypatch.setattr(
+        feed_hdbscan_clustering, "get_hf_embeddings", lambda name: model
+    )
+    task = FeedHdbscanClusteringTask(MagicMock())
+
+    df = pd.DataFrame.from_records(
+        db.run_query(f"SELECT {', '.join(FEED_COLUMNS)} FROM feeds ORDER BY id"),
+        columns=FEED_COLUMNS,
+    )
+    embeddings = task._get_embeddings(db, df, "m", True)
+
+    np.testing.assert_allclose(embeddings, [[1.0, 0.0], [0.5, 0.5], [0.5, 0.5]])
+    assert model.embed.call_args.kwargs["docs"] == [
+        "src: title 2. sum",
+        "src: title 3. sum",
+    ]
+    assert (
+        db.run_query("SELECT embedding_model FROM feeds ORDER BY id")
+        == [("m|normalize=True",)] * 3
+    )
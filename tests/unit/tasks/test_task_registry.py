@@ -0,0 +1,12 @@
+from news_briefing_generator.model.task.base import Task
+from news_briefing_generator.tasks import TASK_REGISTRY
+
+
+def test_registry_resolves_every_task_type() -> None:
+    """Test that each registered task type loads a Task subclass of that name."""
+    assert "UnknownTask" not in TASK_REGISTRY
+
+    for task_type in TASK_REGISTRY:
+        task_class = TASK_REGISTRY[task_type]
+        assert issubclass(task_class, Task)
+        assert task_class.__name__ == task_type
@@ -0,0 +1,45 @@
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from langchain_core.messages.ai import AIMessage
+
+from news_briefing_generator.tasks.topic_title_generation import (
+    TopicTitleGenerationTask,
+    _parse_batch_titles,
+)
+
+
+def test_parse_batch_titles() -> None:
+    """Test splitting a batched response and rejecting incomplete ones."""
+    text = '<think>TITLE 9: draft</think>\nTITLE 2: "Second Title"\nTITLE 1: First\n'
+
+    assert _parse_batch_titles(text, 2) == ["First", "Second Title"]
+    assert _parse_batch_titles(text, 3) is None
+    assert _parse_batch_titles("TITLE 1: Only one", 2) is None
+
+
+@pytest.mark.asyncio
+async def test_batched_titles_fall_back_to_single_requests() -> None:
+    """Test one request per batch, and single requests when parsing fails."""
+    task = TopicTitleGenerationTask(MagicMock())
+    llm = MagicMock()
+    llm.prepare_prompts = lambda human, system: human
+    llm.generate_async = AsyncMock(
+        side_effect=[
+            AIMessage(content="TITLE 1: A\nTITLE 2: B"),
+            AIMessage(content="No numbered titles"),
+            AIMessage(content="C"),
+            AIMessage(content="D"),
+        ]
+    )
+
+    first = await task._generate_titles([("t1", "h1"), ("t2", "h2")], llm, 10)
+    second = await task._generate_titles([("t3", "h3"), ("t4", "h4")], llm, 10)
+
+    assert [(topic_id, title) for topic_id, title, _ in first + second] == [
+        ("t1", "A"),
+        ("t2", "B"),
+        ("t3", "C"),
+        ("t4", "D"),
+    ]
+    assert llm.generate_async.await_count == 4
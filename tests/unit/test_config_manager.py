@@ -1,3 +1,4 @@
+import json
 import tempfile
 from pathlib import Path
 from typing import Generator
@@ -74,8 +75,11 @@ def test_parameter_resolution_precedence(
     assert param.value == "env_var_value"
     assert param.source == ConfigSource.ENVIRONMENT_VARIABLE
 
-    # Test environment settings precedence
+    # Test environment settings precedence (env vars are snapshotted at init)
     monkeypatch.delenv("NBG_TEST_PARAM", raising=False)
+    config_manager = ConfigManager(
+        config_path=temp_config_files / "settings.yaml", environment="development"
+    )
     param = config_manager.get_param("test_param", workflow_params=workflow_params)
     assert param.value == "env_value"
     assert param.source == ConfigSource.ENVIRONMENT_SETTINGS
@@ -115,3 +119,45 @@ def test_task_scoped_parameter_resolution(temp_config_files: Path) -> None:
     )
     assert param.value == "base_scoped_value"
     assert param.source == ConfigSource.BASE_SETTINGS
+
+
+def test_settings_cache_sidecar(temp_config_files: Path) -> None:
+    """Test that parsed settings are cached and invalidated when the YAML changes."""
+    settings_path = temp_config_files / "settings.yaml"
+    cache_path = temp_config_files / "settings.yaml.cache"
+
+    config_manager = ConfigManager(config_path=settings_path)
+    assert json.loads(cache_path.read_text())[2]["test_param"] == "base_value"
+    assert config_manager.base_settings["test_param"] == "base_value"
+
+    # Cached settings are reused while the YAML file is unchanged
+    assert ConfigManager(config_path=settings_path).base_settings == {
+        "test_param": "base_value",
+        "base_only": "base_only_value",
+    }
+
+    # Each manager gets its own copy of the cached settings
+    config_manager.base_settings["test_param"] = "mutated"
+    assert ConfigManager(config_path=settings_path).base_settings["test_param"] == (
+        "base_value"
+    )
+
+    # Changing the YAML file invalidates the cache
+    with open(settings_path, "w") as f:
+        yaml.dump({"test_param": "updated_value_with_different_size"}, f)
+    config_manager = ConfigManager(config_path=settings_path)
+    assert config_manager.base_settings == {
+        "test_param": "updated_value_with_different_size"
+    }
+
+
+def test_get_cache_invalidated_by_feed_override(temp_config_files: Path) -> None:
+    """Test that memoized get() lookups reflect overridden feeds."""
+    config_manager = ConfigManager(config_path=temp_config_files / "settings.yaml")
+    assert config_manager.get("feeds", []) == []
+
+    feeds = [{"name": "Example", "url": "https://example.com/rss"}]
+    config_manager.override_feeds(feeds)
+
+    assert config_manager.get("feeds") == feeds
+    assert config_manager.url_to_feedname == {"https://example.com/rss": "Example"}
@@ -0,0 +1,39 @@
+from unittest.mock import MagicMock
+
+import pytest
+
+from news_briefing_generator.model.task.base import TaskContext
+from news_briefing_generator.utils.http_session import HttpSessionManager
+
+
+@pytest.mark.asyncio
+async def test_tasks_share_one_session() -> None:
+    """Test that task contexts reuse the shared session and leave it open."""
+    http = HttpSessionManager()
+    contexts = [
+        TaskContext(
+            db=MagicMock(), conf=MagicMock(), logger_manager=MagicMock(), http=http
+        )
+        for _ in range(2)
+    ]
+
+    async with contexts[0].http_session() as first:
+        pass
+    async with contexts[1].http_session() as second:
+        pass
+
+    assert first is second
+    assert not first.closed
+    await http.close()
+    assert first.closed
+
+
+@pytest.mark.asyncio
+async def test_session_without_manager_is_closed_after_use() -> None:
+    """Test the fallback session only lives for the block."""
+    context = TaskContext(db=MagicMock(), conf=MagicMock(), logger_manager=MagicMock())
+
+    async with context.http_session() as session:
+        assert not session.closed
+
+    assert session.closed
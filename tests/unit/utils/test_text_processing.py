@@ -0,0 +1,51 @@
+import pytest
+
+from news_briefing_generator.utils import text_processing
+from news_briefing_generator.utils.text_processing import (
+    is_error_response,
+    truncate_to_tokens,
+)
+
+
+class _WordEncoding:
+    """Stand-in for a tiktoken encoding that treats each word as one token."""
+
+    def encode_ordinary(self, text: str) -> list:
+        return text.split(" ")
+
+    def decode(self, tokens: list) -> str:
+        return " ".join(tokens)
+
+
+@pytest.mark.parametrize(
+    "text, expected",
+    [
+        ("<ERROR> Cannot determine coherent topic. <ERROR>", True),
+        ("<ERROR> No article content found. <ERROR>", True),
+        ("<ERROR>: No article content found.", True),
+        ("Summary first.\n<ERROR> Cannot determine coherent topic. <ERROR>", True),
+        ("A regular summary about an <ERROR> in the markets.", False),
+        ("", False),
+    ],
+)
+def test_is_error_response(text: str, expected: bool) -> None:
+    """Test detection of the summarization error sentinels."""
+    assert is_error_response(text) is expected
+
+
+def test_truncate_to_tokens_cuts_on_token_boundary(monkeypatch) -> None:
+    """Test truncation keeps whole tokens up to the budget."""
+    monkeypatch.setattr(text_processing, "_get_token_encoding", _WordEncoding)
+    text = "one two three four five six"
+
+    assert truncate_to_tokens(text, 3) == "one two three"
+    assert truncate_to_tokens(text, 10) == text
+
+
+def test_truncate_to_tokens_falls_back_to_characters(monkeypatch) -> None:
+    """Test the character estimate is used when no encoding is available."""
+    monkeypatch.setattr(text_processing, "_get_token_encoding", lambda: None)
+    text = "x" * 100
+
+    assert truncate_to_tokens(text, 5) == "x" * 5 * text_processing.CHARS_PER_TOKEN
+    assert truncate_to_tokens("short", 10) == "short"
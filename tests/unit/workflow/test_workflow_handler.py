@@ -12,7 +12,7 @@ from news_briefing_generator.workflow.workflow_handler import WorkflowHandler
 @pytest.fixture
 def mock_chat_ollama():
     """Mock Ollama chat functionality."""
-    with patch("news_briefing_generator.llm.ollama.ChatOllama") as mock_class:
+    with patch("langchain_ollama.ChatOllama") as mock_class:
         mock_instance = mock_class.return_value
         mock_instance.invoke.return_value = AIMessage(content="Mocked Ollama response")
         mock_instance.ainvoke.return_value = AIMessage(content="Mocked Ollama response")
@@ -21,7 +21,7 @@ def mock_chat_ollama():
 
 @pytest.fixture
 def mock_chat_openai():
-    with patch("news_briefing_generator.llm.openai.ChatOpenAI") as mock:
+    with patch("langchain_openai.ChatOpenAI") as mock:
         # Configure the mock to return a predetermined response
         instance = mock.return_value
         instance.invoke.return_value = AIMessage(content="Mocked OpenAI response")